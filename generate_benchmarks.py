@@ -2,15 +2,53 @@
 Generate benchmark instances for performance evaluation.
 """
 
-from utils import graph_to_file, generate_random_graph, generate_connected_graph
+from utils import graph_to_file, graph_to_binary_file, generate_random_graph, generate_connected_graph
+from utils import (path_edges, star_edges, caterpillar_edges, random_forest_edges, forest_plus_edges,
+                   sparse_gnp_edges, block_forest_edges, edges_to_file, edges_to_binary_file, graph_metadata)
+import argparse
+import json
 import os
 import random
 
 
-def generate_benchmark_suite():
+# Large-scale instance families: name -> function(n, seed, options) returning an edge array
+FAMILIES = {
+    "path": lambda n, seed, options: path_edges(n, seed, shuffle=True),
+    "star": lambda n, seed, options: star_edges(n, seed, shuffle=True),
+    "caterpillar": lambda n, seed, options: caterpillar_edges(n, seed=seed, shuffle=True),
+    "tree": lambda n, seed, options: random_forest_edges(n, 1, seed),
+    "forest": lambda n, seed, options: random_forest_edges(n, options["trees"] or max(2, n // 1000), seed),
+    "forestk": lambda n, seed, options: forest_plus_edges(n, options["trees"] or max(2, n // 1000),
+                                                          options["extra"], seed),
+    "gnp": lambda n, seed, options: sparse_gnp_edges(n, options["avg_degree"] / max(1, n - 1), seed),
+    "blocks": lambda n, seed, options: block_forest_edges(options["blocks"], n // options["blocks"],
+                                                          options["cycles"], seed),
+}
+
+# Default family parameters
+FAMILY_OPTIONS = {"trees": None, "extra": 10, "avg_degree": 3.0, "blocks": 100, "cycles": 1}
+
+# Large-scale benchmark tiers: name -> list of (label, family, n, options)
+TIERS = {
+    # Random forests with about n / 1000 trees, 10^3 to 10^7 vertices
+    "forest": [(f"n_{n}", "forest", n, {}) for n in (10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7)],
+    # A random tree on 10^5 vertices plus k extra edges (cyclomatic number k)
+    "neartree": [(f"k_{k}", "forestk", 10 ** 5, {"trees": 1, "extra": k}) for k in (0, 1, 2, 4, 8, 16, 32)],
+    # 10^5 vertices in c equal components, each a random tree plus one extra edge
+    "components": [(f"c_{c}", "blocks", 10 ** 5, {"blocks": c}) for c in (10, 100, 1000, 10000)],
+}
+
+# Directory for the large-scale families and tiers
+LARGE_BENCHMARK_DIR = "benchmarks_large"
+
+
+def generate_benchmark_suite(binary: bool = False):
     """
     Generate at least 200 benchmark instances across at least 20 different sizes,
     with at least 10 instances per size.
+    
+    Args:
+        binary: Write instance_XX.bin files in the binary graph format instead of text
     """
     base_dir = "benchmarks"
     os.makedirs(base_dir, exist_ok=True)
@@ -44,8 +82,12 @@ def generate_benchmark_suite():
             graph, vertices = generate_random_graph(n, edge_prob, seed=n * 100 + i)
             
             # Write to file
-            instance_file = os.path.join(size_dir, f"instance_{i+1:02d}.txt")
-            graph_to_file(graph, vertices, instance_file)
+            if binary:
+                instance_file = os.path.join(size_dir, f"instance_{i+1:02d}.bin")
+                graph_to_binary_file(graph, vertices, instance_file)
+            else:
+                instance_file = os.path.join(size_dir, f"instance_{i+1:02d}.txt")
+                graph_to_file(graph, vertices, instance_file)
             
             total_instances += 1
     
@@ -54,6 +96,107 @@ def generate_benchmark_suite():
     return total_instances
 
 
+def generate_family(family: str, sizes: list, instances: int = 3, binary: bool = False,
+                    base_dir: str = LARGE_BENCHMARK_DIR, **options):
+    """
+    Generate large-scale instances of one family with the fast edge-array generators.
+    
+    Instances go to <base_dir>/<family>_<n>/instance_XX.txt (or .bin), seeded
+    from the family, size and instance number so reruns are identical.
+    
+    Args:
+        family: Name of a family in FAMILIES
+        sizes: Numbers of vertices
+        instances: Instances per size
+        binary: Write the binary graph format instead of text
+        base_dir: Directory for the generated instances
+        **options: Family parameters (see FAMILY_OPTIONS): trees (forest,
+            forestk), extra (forestk), avg_degree (gnp), blocks and cycles (blocks)
+            
+    Returns:
+        The number of instances generated
+    """
+    options = {**FAMILY_OPTIONS, **options}
+    total_instances = 0
+    for n in sizes:
+        size_dir = os.path.join(base_dir, f"{family}_{n}")
+        os.makedirs(size_dir, exist_ok=True)
+        for i in range(instances):
+            seed = sorted(FAMILIES).index(family) * 10 ** 9 + n * 100 + i
+            edges = FAMILIES[family](n, seed, options)
+            if binary:
+                edges_to_binary_file(n, edges, os.path.join(size_dir, f"instance_{i+1:02d}.bin"))
+            else:
+                edges_to_file(n, edges, os.path.join(size_dir, f"instance_{i+1:02d}.txt"))
+            total_instances += 1
+    
+    print(f"Generated {total_instances} {family} instances in {base_dir}/ for sizes {', '.join(map(str, sizes))}")
+    return total_instances
+
+
+def generate_tier(tier: str, instances: int = 3, base_dir: str = LARGE_BENCHMARK_DIR):
+    """
+    Generate one large-scale benchmark tier with its structural metadata.
+    
+    Each entry of TIERS[tier] becomes <base_dir>/<tier>/<label>/ holding
+    instance_XX.bin files (binary, so loading 10^7-vertex inputs is not the
+    bottleneck) and a metadata.json with the tier, family and parameters and,
+    per instance, n, m, component count and cyclomatic number.
+    
+    Args:
+        tier: Name of a tier in TIERS
+        instances: Instances per entry
+        base_dir: Directory for the tiers
+        
+    Returns:
+        The number of instances generated
+    """
+    total_instances = 0
+    for index, (label, family, n, options) in enumerate(TIERS[tier]):
+        entry_dir = os.path.join(base_dir, tier, label)
+        os.makedirs(entry_dir, exist_ok=True)
+        family_options = {**FAMILY_OPTIONS, **options}
+        metadata = {"tier": tier, "family": family, "options": family_options, "instances": {}}
+        for i in range(instances):
+            edges = FAMILIES[family](n, index * 100 + i, family_options)
+            instance_file = f"instance_{i+1:02d}.bin"
+            edges_to_binary_file(n, edges, os.path.join(entry_dir, instance_file))
+            metadata["instances"][instance_file] = graph_metadata(n, edges)
+            total_instances += 1
+        with open(os.path.join(entry_dir, "metadata.json"), "w") as f:
+            json.dump(metadata, f, indent=2)
+        print(f"  {tier}/{label}: {instances} instances, n={n}")
+    
+    print(f"Generated {total_instances} instances for tier {tier} in {base_dir}/{tier}/")
+    return total_instances
+
+
 if __name__ == "__main__":
-    generate_benchmark_suite()
+    parser = argparse.ArgumentParser(description="Generate the benchmark suite")
+    parser.add_argument("--binary", action="store_true",
+                        help="Write instances in the binary graph format (instance_XX.bin)")
+    parser.add_argument("--tier", choices=sorted(TIERS) + ["all"], default=None,
+                        help="Generate a large-scale benchmark tier (binary instances plus metadata)")
+    parser.add_argument("--family", choices=sorted(FAMILIES), default=None,
+                        help="Generate large-scale instances of this family instead of the default suite")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10 ** 5, 10 ** 6],
+                        help="Vertex counts for --family (default: 100000 1000000)")
+    parser.add_argument("--instances", type=int, default=3,
+                        help="Instances per size for --family and --tier (default: 3)")
+    parser.add_argument("--output-dir", default=LARGE_BENCHMARK_DIR,
+                        help=f"Directory for --family and --tier instances (default: {LARGE_BENCHMARK_DIR})")
+    parser.add_argument("--trees", type=int, default=None,
+                        help="Trees in forest/forestk instances (default: n // 1000, at least 2)")
+    parser.add_argument("--extra", type=int, default=10, help="Extra edges in forestk instances (default: 10)")
+    parser.add_argument("--avg-degree", type=float, default=3.0, help="Average degree of gnp instances (default: 3)")
+    parser.add_argument("--blocks", type=int, default=100, help="Components of blocks instances (default: 100)")
+    args = parser.parse_args()
+    if args.tier:
+        for tier in (sorted(TIERS) if args.tier == "all" else [args.tier]):
+            generate_tier(tier, args.instances, args.output_dir)
+    elif args.family:
+        generate_family(args.family, args.sizes, args.instances, args.binary, args.output_dir,
+                        trees=args.trees, extra=args.extra, avg_degree=args.avg_degree, blocks=args.blocks)
+    else:
+        generate_benchmark_suite(args.binary)
 
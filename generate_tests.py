@@ -2,11 +2,12 @@
 Generate functional test cases for white-box and black-box testing.
 """
 
-from utils import graph_to_file, generate_random_graph, generate_connected_graph
+from utils import graph_to_file, graph_to_binary_file, generate_random_graph, generate_connected_graph
+import argparse
 import os
 
 
-def create_test_case(test_id: int, graph: dict, vertices: list, description: str):
+def create_test_case(test_id: int, graph: dict, vertices: list, description: str, binary: bool = False):
     """
     Create a test case with input and expected output files.
     
@@ -15,12 +16,17 @@ def create_test_case(test_id: int, graph: dict, vertices: list, description: str
         graph: Graph adjacency list
         vertices: List of vertices
         description: Description of the test case
+        binary: Write instance_XX.bin in the binary graph format instead of text
     """
     test_dir = "tests"
     os.makedirs(test_dir, exist_ok=True)
     
-    input_file = f"{test_dir}/instance_{test_id:02d}.txt"
-    graph_to_file(graph, vertices, input_file)
+    if binary:
+        input_file = f"{test_dir}/instance_{test_id:02d}.bin"
+        graph_to_binary_file(graph, vertices, input_file)
+    else:
+        input_file = f"{test_dir}/instance_{test_id:02d}.txt"
+        graph_to_file(graph, vertices, input_file)
     
     # Write description
     desc_file = f"{test_dir}/description_{test_id:02d}.txt"
@@ -28,57 +34,85 @@ def create_test_case(test_id: int, graph: dict, vertices: list, description: str
         f.write(f"Test Case {test_id}: {description}\n")
 
 
-def main():
-    """Generate all functional test cases."""
+def main(binary: bool = False):
+    """
+    Generate all functional test cases.
+    
+    Args:
+        binary: Write the instances in the binary graph format
+    """
     
     # Test 1: Empty graph (no edges)
     graph1 = {0: set(), 1: set(), 2: set()}
     vertices1 = [0, 1, 2]
-    create_test_case(1, graph1, vertices1, "Empty graph - no edges, all isolated vertices")
+    create_test_case(1, graph1, vertices1, "Empty graph - no edges, all isolated vertices", binary)
     
     # Test 2: Single edge
     graph2 = {0: {1}, 1: {0}}
     vertices2 = [0, 1]
-    create_test_case(2, graph2, vertices2, "Single edge - minimum cover is 1")
+    create_test_case(2, graph2, vertices2, "Single edge - minimum cover is 1", binary)
     
     # Test 3: Path graph (P3)
     graph3 = {0: {1}, 1: {0, 2}, 2: {1}}
     vertices3 = [0, 1, 2]
-    create_test_case(3, graph3, vertices3, "Path graph P3 - linear structure")
+    create_test_case(3, graph3, vertices3, "Path graph P3 - linear structure", binary)
     
     # Test 4: Triangle (K3)
     graph4 = {0: {1, 2}, 1: {0, 2}, 2: {0, 1}}
     vertices4 = [0, 1, 2]
-    create_test_case(4, graph4, vertices4, "Triangle K3 - complete graph on 3 vertices")
+    create_test_case(4, graph4, vertices4, "Triangle K3 - complete graph on 3 vertices", binary)
     
     # Test 5: Star graph (K1,3)
     graph5 = {0: {1, 2, 3}, 1: {0}, 2: {0}, 3: {0}}
     vertices5 = [0, 1, 2, 3]
-    create_test_case(5, graph5, vertices5, "Star graph - center vertex covers all edges")
+    create_test_case(5, graph5, vertices5, "Star graph - center vertex covers all edges", binary)
     
     # Test 6: Cycle C4
     graph6 = {0: {1, 3}, 1: {0, 2}, 2: {1, 3}, 3: {0, 2}}
     vertices6 = [0, 1, 2, 3]
-    create_test_case(6, graph6, vertices6, "Cycle C4 - even cycle")
+    create_test_case(6, graph6, vertices6, "Cycle C4 - even cycle", binary)
     
     # Test 7: Complete graph K4
     graph7 = {0: {1, 2, 3}, 1: {0, 2, 3}, 2: {0, 1, 3}, 3: {0, 1, 2}}
     vertices7 = [0, 1, 2, 3]
-    create_test_case(7, graph7, vertices7, "Complete graph K4 - all vertices connected")
+    create_test_case(7, graph7, vertices7, "Complete graph K4 - all vertices connected", binary)
     
     # Test 8: Disconnected components
     graph8 = {0: {1}, 1: {0}, 2: {3}, 3: {2}}
     vertices8 = [0, 1, 2, 3]
-    create_test_case(8, graph8, vertices8, "Disconnected graph - two separate edges")
+    create_test_case(8, graph8, vertices8, "Disconnected graph - two separate edges", binary)
     
     # Test 9: Graph with 5 vertices (for Task 3 example)
     graph9 = {0: {1, 2}, 1: {0, 2, 3}, 2: {0, 1, 4}, 3: {1, 4}, 4: {2, 3}}
     vertices9 = [0, 1, 2, 3, 4]
-    create_test_case(9, graph9, vertices9, "5-vertex graph - example for Task 3")
+    create_test_case(9, graph9, vertices9, "5-vertex graph - example for Task 3", binary)
+    
+    # Test 10: Forest of several patches plus isolated vertices
+    graph10 = {0: {1, 2}, 1: {0}, 2: {0, 3}, 3: {2}, 4: set(), 5: {6, 7, 8}, 6: {5}, 7: {5}, 8: {5},
+               9: {10, 11}, 10: {9, 11}, 11: {9, 10}, 12: set()}
+    vertices10 = list(range(13))
+    create_test_case(10, graph10, vertices10, "Many components - path, star, triangle and isolated vertices", binary)
+    
+    # Test 11: Long path - far deeper than the recursion limit
+    graph11 = {i: set() for i in range(2000)}
+    for i in range(1, 2000):
+        graph11[i - 1].add(i)
+        graph11[i].add(i - 1)
+    vertices11 = list(range(2000))
+    create_test_case(11, graph11, vertices11, "Long path P2000 - deep tree solved by the iterative tree DP", binary)
+    
+    # Test 12: Self-loop - ignored by the solvers, as in the baseline DP
+    graph12 = {0: {0, 1}, 1: {0, 2}, 2: {1}}
+    vertices12 = [0, 1, 2]
+    create_test_case(12, graph12, vertices12, "Self-loop on a path P3 - the loop adds no edge to cover", binary)
     
-    print(f"Generated {9} test cases in tests/ directory")
+    print(f"Generated {12} test cases in tests/ directory")
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Generate the functional test cases")
+    parser.add_argument("--binary", action="store_true",
+                        help="Write instances in the binary graph format (instance_XX.bin)")
+    args = parser.parse_args()
+    main(args.binary)
 
@@ -0,0 +1,419 @@
+"""
+Incremental minimum vertex cover under edge insertions and deletions.
+
+IncrementalSolver keeps the optimum of a changing graph without
+recomputing it from scratch. Forest components hold the tree DP of
+main.minimum_vertex_cover_tree as parent pointers and per-vertex dp0/dp1
+values, so an update only walks the root path of the changed vertices.
+Components with cycles are re-solved with the regular pipeline (kernel and
+engine) when an update touches them.
+
+Run as a script to replay an update stream against an initial graph:
+
+    python incremental.py graph.txt updates.txt
+    
+where each update line is "+ u v" (add edge), "- u v" (remove edge) or
+"v u" (add vertex).
+"""
+
+import argparse
+import sys
+import time
+from typing import Dict, List, Set, Tuple
+
+from main import load_graph, solve_graph
+
+
+class IncrementalSolver:
+    """
+    Minimum vertex cover of a graph that changes a few edges at a time.
+    
+    Every vertex is either in the forest part, where parent maps it to its
+    parent (None for a root) and dp0/dp1 hold the size of the smallest cover
+    of its subtree without/with it, or in a cyclic component, where
+    component maps it to an id in components. size is the current optimum:
+    the sum of min(dp0, dp1) over roots plus the optimum of each cyclic
+    component.
+    """
+    
+    def __init__(self, graph: Dict[int, Set[int]] = None, vertices: List[int] = None,
+                 engine: str = "array", use_kernel: bool = True, **engine_options):
+        """
+        Build the solver and solve the initial graph.
+        
+        Args:
+            graph: Adjacency list representation of the initial graph (self-loops
+                are ignored)
+            vertices: List of all vertices of the initial graph
+            engine: Name of the engine in main.ENGINES for cyclic components
+            use_kernel: Whether to apply the reduction rules to cyclic components
+            **engine_options: Extra keyword arguments for the engine
+        """
+        self.engine = engine
+        self.use_kernel = use_kernel
+        self.engine_options = engine_options
+        self.graph: Dict[int, Set[int]] = {}
+        self.parent: Dict[int, int] = {}
+        self.dp0: Dict[int, int] = {}
+        self.dp1: Dict[int, int] = {}
+        self.component: Dict[int, int] = {}
+        self.components: Dict[int, dict] = {}
+        self.next_component = 0
+        self.size = 0
+        
+        vertices = list(vertices if vertices is not None else (graph or {}))
+        for v in vertices:
+            self.graph[v] = set()
+        for v in vertices:
+            for w in (graph or {}).get(v, ()):
+                if w == v:
+                    # Self-loops need no cover vertex and add_edge rejects them
+                    continue
+                self.graph.setdefault(w, set())
+                self.graph[v].add(w)
+                self.graph[w].add(v)
+        seen = set()
+        for v in self.graph:
+            if v not in seen:
+                vertices = self.collect(v)
+                seen.update(vertices)
+                self.add_component(vertices)
+    
+    def add_vertex(self, v: int) -> int:
+        """
+        Add an isolated vertex (no-op if it exists).
+        
+        Args:
+            v: The new vertex
+            
+        Returns:
+            The size of the minimum vertex cover
+        """
+        if v not in self.graph:
+            self.graph[v] = set()
+            self.parent[v] = None
+            self.dp0[v] = 0
+            self.dp1[v] = 1
+        return self.size
+    
+    def add_edge(self, u: int, v: int) -> int:
+        """
+        Add an edge, adding its endpoints if needed, and update the optimum.
+        
+        Joining two trees reroots the tree of v at v (along the path to its
+        old root) and hangs it below u, then updates u's root path. An edge
+        that closes a cycle or touches a cyclic component re-solves the
+        merged component.
+        
+        Args:
+            u: One endpoint
+            v: The other endpoint
+            
+        Returns:
+            The size of the minimum vertex cover
+            
+        Raises:
+            ValueError: If u == v
+        """
+        if u == v:
+            raise ValueError(f"Self-loop on vertex {u}")
+        self.add_vertex(u)
+        self.add_vertex(v)
+        if v in self.graph[u]:
+            return self.size
+        
+        if u not in self.component and v not in self.component:
+            root_u = self.find_root(u)
+            if root_u != self.find_root(v):
+                self.graph[u].add(v)
+                self.graph[v].add(u)
+                self.reroot(v)
+                self.size -= min(self.dp0[v], self.dp1[v])
+                self.parent[v] = u
+                self.update_path(u, self.dp1[v], min(self.dp0[v], self.dp1[v]))
+                return self.size
+        
+        # The merged component has a cycle: drop the old parts and re-solve it
+        for x in (u, v):
+            if x in self.parent or x in self.component:
+                self.remove_component(x)
+        self.graph[u].add(v)
+        self.graph[v].add(u)
+        self.add_component(self.collect(u))
+        return self.size
+    
+    def remove_edge(self, u: int, v: int) -> int:
+        """
+        Remove an edge and update the optimum.
+        
+        In a forest the child endpoint is cut off as a new root and the
+        other endpoint's root path is updated. In a cyclic component the
+        component is split if needed and each part re-solved (or turned into
+        a tree).
+        
+        Args:
+            u: One endpoint
+            v: The other endpoint
+            
+        Returns:
+            The size of the minimum vertex cover
+            
+        Raises:
+            KeyError: If the edge is not in the graph
+        """
+        if v not in self.graph.get(u, ()):
+            raise KeyError(f"No edge ({u}, {v})")
+        
+        if u not in self.component:
+            child, parent = (u, v) if self.parent[u] == v else (v, u)
+            self.graph[u].discard(v)
+            self.graph[v].discard(u)
+            self.parent[child] = None
+            self.size += min(self.dp0[child], self.dp1[child])
+            self.update_path(parent, -self.dp1[child], -min(self.dp0[child], self.dp1[child]))
+            return self.size
+        
+        self.remove_component(u)
+        self.graph[u].discard(v)
+        self.graph[v].discard(u)
+        part = self.collect(u)
+        self.add_component(part)
+        if v not in part:
+            self.add_component(self.collect(v))
+        return self.size
+    
+    def cover(self) -> Set[int]:
+        """
+        Reconstruct a minimum vertex cover of the current graph.
+        
+        Returns:
+            The set of cover vertices
+        """
+        children: Dict[int, List[int]] = {}
+        roots = []
+        for v, p in self.parent.items():
+            if p is None:
+                roots.append(v)
+            else:
+                children.setdefault(p, []).append(v)
+        
+        # Top-down as in main.minimum_vertex_cover_tree
+        cover_set = set()
+        stack = [(root, True) for root in roots]
+        while stack:
+            v, free = stack.pop()
+            in_cover = not free or self.dp1[v] <= self.dp0[v]
+            if in_cover:
+                cover_set.add(v)
+            stack.extend((c, in_cover) for c in children.get(v, ()))
+        for entry in self.components.values():
+            cover_set |= entry["cover"]
+        return cover_set
+    
+    def find_root(self, v: int) -> int:
+        """
+        Find the root of the tree of a forest vertex.
+        
+        Args:
+            v: A vertex in the forest part
+            
+        Returns:
+            The root of its tree
+        """
+        while self.parent[v] is not None:
+            v = self.parent[v]
+        return v
+    
+    def update_path(self, v: int, delta0: int, delta1: int):
+        """
+        Change the DP values of a vertex and propagate up its root path.
+        
+        Stops at the first ancestor whose contribution to its parent does
+        not change; at the root, size absorbs the change of the tree's optimum.
+        
+        Args:
+            v: Forest vertex whose children changed
+            delta0: Change of dp0[v] (the sum of dp1 over its children)
+            delta1: Change of dp1[v] (the sum of min(dp0, dp1) over its children)
+        """
+        while delta0 or delta1:
+            old_min = min(self.dp0[v], self.dp1[v])
+            old_dp1 = self.dp1[v]
+            self.dp0[v] += delta0
+            self.dp1[v] += delta1
+            new_min = min(self.dp0[v], self.dp1[v])
+            p = self.parent[v]
+            if p is None:
+                self.size += new_min - old_min
+                return
+            delta0, delta1 = self.dp1[v] - old_dp1, new_min - old_min
+            v = p
+    
+    def reroot(self, v: int):
+        """
+        Make a forest vertex the root of its tree.
+        
+        Only the vertices on the path from v to the old root change parent,
+        so only their DP values are recomputed, old root first.
+        
+        Args:
+            v: The new root
+        """
+        path = [v]
+        while self.parent[path[-1]] is not None:
+            path.append(self.parent[path[-1]])
+        
+        # path[i + 1] becomes a child of path[i]: it loses child path[i]
+        # (whose old values are still in place) and gains path[i + 1]
+        for i in range(len(path) - 1, -1, -1):
+            x = path[i]
+            if i > 0:
+                child = path[i - 1]
+                self.dp0[x] -= self.dp1[child]
+                self.dp1[x] -= min(self.dp0[child], self.dp1[child])
+            if i + 1 < len(path):
+                child = path[i + 1]
+                self.dp0[x] += self.dp1[child]
+                self.dp1[x] += min(self.dp0[child], self.dp1[child])
+                self.parent[child] = x
+        self.parent[v] = None
+    
+    def collect(self, v: int) -> List[int]:
+        """
+        List the vertices of the connected component of v.
+        
+        Args:
+            v: A vertex of the graph
+            
+        Returns:
+            The vertices of its component
+        """
+        seen = {v}
+        stack = [v]
+        while stack:
+            u = stack.pop()
+            for w in self.graph[u]:
+                if w not in seen:
+                    seen.add(w)
+                    stack.append(w)
+        return list(seen)
+    
+    def remove_component(self, v: int):
+        """
+        Drop the part containing v (its tree or cyclic component) from the solution.
+        
+        The vertices keep their edges; the caller re-adds them with
+        add_component.
+        
+        Args:
+            v: A vertex of the part
+        """
+        if v in self.component:
+            entry = self.components.pop(self.component[v])
+            self.size -= entry["size"]
+            for u in entry["vertices"]:
+                del self.component[u]
+            return
+        root = self.find_root(v)
+        self.size -= min(self.dp0[root], self.dp1[root])
+        for u in self.collect(root):
+            del self.parent[u], self.dp0[u], self.dp1[u]
+    
+    def add_component(self, vertices: List[int]):
+        """
+        Solve a connected component and add it to the solution.
+        
+        A tree gets the tree DP rooted at its first vertex; any other
+        component is solved with main.solve_graph.
+        
+        Args:
+            vertices: The vertices of a connected component
+        """
+        num_edges = sum(1 for u in vertices for w in self.graph[u] if u < w)
+        if num_edges == len(vertices) - 1:
+            root = vertices[0]
+            self.parent[root] = None
+            order = [root]
+            for u in order:
+                for w in self.graph[u]:
+                    if w != self.parent[u]:
+                        self.parent[w] = u
+                        order.append(w)
+            for u in order:
+                self.dp0[u] = 0
+                self.dp1[u] = 1
+            for u in reversed(order):
+                p = self.parent[u]
+                if p is not None:
+                    self.dp0[p] += self.dp1[u]
+                    self.dp1[p] += min(self.dp0[u], self.dp1[u])
+            self.size += min(self.dp0[root], self.dp1[root])
+            return
+        
+        vertices = sorted(vertices)
+        size, cover, _ = solve_graph({u: self.graph[u] for u in vertices}, vertices, self.engine,
+                                     self.use_kernel, **self.engine_options)
+        cid = self.next_component
+        self.next_component += 1
+        self.components[cid] = {"vertices": vertices, "size": size, "cover": cover}
+        for u in vertices:
+            self.component[u] = cid
+        self.size += size
+
+
+def read_updates(filename: str) -> List[Tuple[str, int, int]]:
+    """
+    Read an update stream.
+    
+    Args:
+        filename: File with one update per line: "+ u v", "- u v" or "v u";
+            blank lines and lines starting with # are skipped
+            
+    Returns:
+        A list of (operation, u, v) tuples, v being None for "v"
+    """
+    updates = []
+    with open(filename, "r") as f:
+        for line in f:
+            parts = line.split()
+            if not parts or parts[0].startswith("#"):
+                continue
+            if parts[0] not in ("+", "-", "v") or len(parts) != (2 if parts[0] == "v" else 3):
+                raise ValueError(f"Invalid update line: {line.strip()}")
+            updates.append((parts[0], int(parts[1]), int(parts[2]) if len(parts) == 3 else None))
+    return updates
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Replay edge updates with the incremental solver")
+    parser.add_argument("input_file", help="Initial graph in the input file format")
+    parser.add_argument("updates_file", help="Updates: '+ u v', '- u v' or 'v u' per line")
+    parser.add_argument("--engine", default="array", help="Engine for cyclic components (default: array)")
+    parser.add_argument("--quiet", action="store_true", help="Only print the final size and timings")
+    args = parser.parse_args()
+    
+    start = time.perf_counter()
+    graph, vertices = load_graph(args.input_file)
+    solver = IncrementalSolver(graph, vertices, args.engine)
+    print(f"Initial minimum vertex cover size: {solver.size} ({time.perf_counter() - start:.3f}s)")
+    
+    try:
+        updates = read_updates(args.updates_file)
+        start = time.perf_counter()
+        for operation, u, v in updates:
+            if operation == "+":
+                size = solver.add_edge(u, v)
+            elif operation == "-":
+                size = solver.remove_edge(u, v)
+            else:
+                size = solver.add_vertex(u)
+            if not args.quiet:
+                print(f"{operation} {u}{'' if v is None else f' {v}'}: {size}")
+        elapsed = time.perf_counter() - start
+    except (KeyError, ValueError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    
+    print(f"Minimum vertex cover size: {solver.size}")
+    if updates:
+        print(f"{len(updates)} updates in {elapsed:.3f}s ({1e6 * elapsed / len(updates):.1f} us per update)")
@@ -0,0 +1,249 @@
+"""
+Load generator for the solver server (main.py --serve --socket).
+
+Sends instance files to the server from several concurrent client
+connections and reports throughput and latency percentiles. With
+--compare-subprocess it also times one main.py launch per instance, the
+model run_benchmarks.py --subprocess uses, for comparison.
+"""
+
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from typing import Dict, List
+
+from main import resolve_batch_inputs, SERVER_END
+
+
+def load_payloads(spec: str) -> List[str]:
+    """
+    Read the instances of a batch specification as request payloads.
+    
+    Args:
+        spec: Directory, glob pattern or manifest file (see main.resolve_batch_inputs)
+        
+    Returns:
+        One request per instance: the file contents followed by the END line
+    """
+    payloads = []
+    for input_file, _ in resolve_batch_inputs(spec, "."):
+        with open(input_file, "r") as f:
+            text = f.read()
+        if not text.endswith("\n"):
+            text += "\n"
+        payloads.append(text + SERVER_END + "\n")
+    return payloads
+
+
+def start_server(socket_path: str, engine: str = "array", jobs: int = 1,
+                 startup_timeout: float = 30.0) -> subprocess.Popen:
+    """
+    Start a solver server and wait until its socket accepts connections.
+    
+    Args:
+        socket_path: Path of the Unix socket for the server
+        engine: Solver engine
+        jobs: Worker processes of the server
+        startup_timeout: Seconds to wait for the socket to appear
+        
+    Returns:
+        The server process
+    """
+    script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "main.py")
+    server = subprocess.Popen([sys.executable, script, "--serve", "--socket", socket_path,
+                               "--engine", engine, "--jobs", str(jobs)])
+    deadline = time.perf_counter() + startup_timeout
+    while not os.path.exists(socket_path):
+        if server.poll() is not None or time.perf_counter() > deadline:
+            server.kill()
+            raise RuntimeError("solver server did not start")
+        time.sleep(0.05)
+    return server
+
+
+def run_client(socket_path: str, payloads: List[str], count: int, latencies: List[float],
+               errors: List[str]):
+    """
+    Send requests over one connection, one at a time, and time each reply.
+    
+    Args:
+        socket_path: Path of the server's Unix socket
+        payloads: Request payloads, sent round-robin
+        count: Number of requests to send
+        latencies: List the latency of each request (seconds) is appended to
+        errors: List error messages from the server are appended to
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        with sock.makefile("r") as responses:
+            for i in range(count):
+                start = time.perf_counter()
+                sock.sendall(payloads[i % len(payloads)].encode())
+                response = json.loads(responses.readline())
+                latencies.append(time.perf_counter() - start)
+                if "error" in response:
+                    errors.append(response["error"])
+
+
+def percentile(values: List[float], q: int) -> float:
+    """
+    Compute a percentile of a list of values.
+    
+    Args:
+        values: Non-empty list of values
+        q: Percentile between 1 and 99
+        
+    Returns:
+        The q-th percentile
+    """
+    if len(values) < 2:
+        return values[0]
+    return statistics.quantiles(values, n=100, method="inclusive")[q - 1]
+
+
+def summarize_latencies(latencies: List[float], elapsed: float) -> Dict[str, float]:
+    """
+    Summarize request latencies and throughput.
+    
+    Args:
+        latencies: Latency of each request in seconds
+        elapsed: Wall time for all requests in seconds
+        
+    Returns:
+        A dict with requests, throughput (requests/s) and mean/p50/p90/p99/max latency in ms
+    """
+    return {
+        "requests": len(latencies),
+        "throughput": len(latencies) / elapsed if elapsed > 0 else 0.0,
+        "mean_ms": 1000 * statistics.mean(latencies),
+        "p50_ms": 1000 * percentile(latencies, 50),
+        "p90_ms": 1000 * percentile(latencies, 90),
+        "p99_ms": 1000 * percentile(latencies, 99),
+        "max_ms": 1000 * max(latencies),
+    }
+
+
+def run_server_load(socket_path: str, payloads: List[str], requests: int, clients: int) -> Dict[str, float]:
+    """
+    Drive a running server from concurrent clients.
+    
+    Args:
+        socket_path: Path of the server's Unix socket
+        payloads: Request payloads
+        requests: Total number of requests
+        clients: Number of concurrent connections
+        
+    Returns:
+        The latency summary, plus the number of error responses
+    """
+    latencies = []
+    errors = []
+    per_client = [requests // clients + (1 if i < requests % clients else 0) for i in range(clients)]
+    threads = [threading.Thread(target=run_client, args=(socket_path, payloads, count, latencies, errors))
+               for count in per_client if count]
+    
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    
+    summary = summarize_latencies(latencies, elapsed)
+    summary["errors"] = len(errors)
+    return summary
+
+
+def run_subprocess_load(spec: str, requests: int, engine: str = "array") -> Dict[str, float]:
+    """
+    Solve instances with one main.py launch each, sequentially.
+    
+    Args:
+        spec: Directory, glob pattern or manifest file of instances
+        requests: Number of launches
+        engine: Solver engine
+        
+    Returns:
+        The latency summary
+    """
+    inputs = [input_file for input_file, _ in resolve_batch_inputs(spec, ".")]
+    script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "main.py")
+    latencies = []
+    with tempfile.TemporaryDirectory() as tmp:
+        output_file = os.path.join(tmp, "output.txt")
+        start = time.perf_counter()
+        for i in range(requests):
+            call_start = time.perf_counter()
+            subprocess.run([sys.executable, script, inputs[i % len(inputs)], output_file, "--engine", engine],
+                           capture_output=True)
+            latencies.append(time.perf_counter() - call_start)
+        elapsed = time.perf_counter() - start
+    return summarize_latencies(latencies, elapsed)
+
+
+def print_summary(name: str, summary: Dict[str, float]):
+    """
+    Print one line of load test results.
+    
+    Args:
+        name: Label for the results
+        summary: Latency summary from summarize_latencies
+    """
+    print(f"{name}: {summary['requests']} requests, {summary['throughput']:.1f} req/s, "
+          f"p50 {summary['p50_ms']:.2f} ms, p99 {summary['p99_ms']:.2f} ms, max {summary['max_ms']:.2f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure throughput and latency of the solver server")
+    parser.add_argument("inputs", nargs="?", default="tests",
+                        help="Directory, glob or manifest of instances to send (default: tests)")
+    parser.add_argument("--requests", type=int, default=1000, help="Total requests (default: 1000)")
+    parser.add_argument("--clients", type=int, default=4, help="Concurrent connections (default: 4)")
+    parser.add_argument("--engine", default="array", help="Solver engine for a started server (default: array)")
+    parser.add_argument("--jobs", type=int, default=1, help="Worker processes for a started server (default: 1)")
+    parser.add_argument("--socket", default=None,
+                        help="Socket of an already running server (default: start one)")
+    parser.add_argument("--compare-subprocess", action="store_true",
+                        help="Also time one main.py launch per instance")
+    parser.add_argument("--subprocess-requests", type=int, default=50,
+                        help="Launches for --compare-subprocess (default: 50)")
+    parser.add_argument("--output", default=None, help="Write the results to this JSON file")
+    args = parser.parse_args()
+    
+    payloads = load_payloads(args.inputs)
+    if not payloads:
+        print(f"No instances match {args.inputs}")
+        sys.exit(1)
+    
+    results = {}
+    server = None
+    with tempfile.TemporaryDirectory() as tmp:
+        socket_path = args.socket
+        if socket_path is None:
+            socket_path = os.path.join(tmp, "solver.sock")
+            server = start_server(socket_path, args.engine, args.jobs)
+        try:
+            results["server"] = run_server_load(socket_path, payloads, args.requests, args.clients)
+        finally:
+            if server is not None:
+                server.terminate()
+                server.wait()
+    print_summary("server", results["server"])
+    if results["server"]["errors"]:
+        print(f"  {results['server']['errors']} requests returned an error")
+    
+    if args.compare_subprocess:
+        results["subprocess"] = run_subprocess_load(args.inputs, args.subprocess_requests, args.engine)
+        print_summary("subprocess", results["subprocess"])
+    
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"Results saved to {args.output}")
@@ -6,8 +6,255 @@ of a graph, where vertices represent candidate designated points (cdps) and
 edges represent shared regions that need to be monitored.
 """
 
-from typing import Set, Tuple, List, Dict
+from typing import Set, Tuple, List, Dict, Iterable
+from array import array
+from collections import OrderedDict
+from math import comb
+from multiprocessing import Pool
+from multiprocessing.shared_memory import SharedMemory
+import argparse
+import glob
+import hashlib
+import heapq
+import json
+import mmap
+import os
+import random
+import shutil
+import signal
+import socketserver
+import struct
 import sys
+import time
+
+try:
+    import numpy as np
+except ImportError:  # numpy is only needed by the vectorized engine
+    np = None
+
+
+# Largest DP table (entries, approximate bytes) allocated by any engine in this process
+TABLE_STATS = {"entries": 0, "bytes": 0}
+
+
+def record_table_size(entries: int, nbytes: int):
+    """
+    Record the size of a DP table if it is the largest one so far.
+    
+    Args:
+        entries: Number of states in the table
+        nbytes: Approximate memory used by the table in bytes
+    """
+    if nbytes > TABLE_STATS["bytes"]:
+        TABLE_STATS["entries"] = entries
+        TABLE_STATS["bytes"] = nbytes
+
+
+def physical_memory() -> int:
+    """
+    Return the size of physical memory.
+    
+    Returns:
+        Physical memory in bytes, or None where the platform does not report it
+    """
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+# Largest in-memory DP table (bytes) the subset-DP engines allocate, set with
+# configure_table_limit (--max-table-mb); bigger components are rejected up
+# front instead of failing inside the allocation. None means no limit.
+TABLE_SETTINGS = {"max_bytes": physical_memory()}
+
+
+def configure_table_limit(max_mb: int = None):
+    """
+    Set the size limit of the in-memory subset-DP tables.
+    
+    Args:
+        max_mb: Largest table in MiB (default: the size of physical memory)
+    """
+    TABLE_SETTINGS["max_bytes"] = physical_memory() if max_mb is None else max_mb * 1024 * 1024
+
+
+def check_table_size(n: int, bytes_per_state: int, engine: str, max_bytes: int = None):
+    """
+    Reject a subset DP whose 2^n-state table would exceed max_bytes.
+    
+    Args:
+        n: Number of vertices in the component
+        bytes_per_state: Approximate table size per state in bytes
+        engine: Name of the engine, for the error message
+        max_bytes: Largest table allowed in bytes (default: TABLE_SETTINGS["max_bytes"])
+        
+    Raises:
+        ValueError: If the table would be larger than max_bytes
+    """
+    if max_bytes is None:
+        max_bytes = TABLE_SETTINGS["max_bytes"]
+    if max_bytes is not None and bytes_per_state << n > max_bytes:
+        raise ValueError(f"The {engine} engine needs a {(bytes_per_state << n) >> 20} MiB DP table for a "
+                         f"component with {n} vertices, over the {max_bytes >> 20} MiB limit "
+                         f"(--max-table-mb); use --engine bnb or --engine treewidth, or --time-limit "
+                         f"for an approximate cover")
+
+
+# Hot-path counters, summed over components. masks_evaluated counts the DP
+# states (search nodes for bnb, vertices for the tree DP) each engine computed;
+# edge_searches and edges_scanned are only counted once enable_profiling has run
+PROFILE_COUNTERS = {"masks_evaluated": 0, "edge_searches": 0, "edges_scanned": 0}
+
+# Wall and CPU time per phase collected by enable_profiling: {phase: {"cpu", "wall"}}
+PROFILE_PHASES: Dict[str, Dict[str, float]] = {}
+
+# Top-level phases of a run; reconstruct is part of solve
+PHASE_TOTALS = ("load", "kernelize", "solve", "unfold", "save")
+
+# Phases currently being timed, so nested calls are not counted twice
+PROFILE_ACTIVE: Set[str] = set()
+
+# Functions timed by enable_profiling, with the phase they are charged to
+PROFILED_FUNCTIONS = {
+    "load_graph": "load",
+    "load_graph_csr": "load",
+    "load_graph_binary": "load",
+    "kernelize": "kernelize",
+    "solve_by_components": "solve",
+    "minimum_vertex_cover_tree_csr": "solve",
+    "reconstruct_cover": "reconstruct",
+    "unfold_cover": "unfold",
+    "save_output": "save",
+}
+
+
+def record_phase(phase: str, cpu: float, wall: float):
+    """
+    Add time spent in a phase to PROFILE_PHASES.
+    
+    Args:
+        phase: Name of the phase
+        cpu: CPU seconds
+        wall: Wall-clock seconds
+    """
+    totals = PROFILE_PHASES.setdefault(phase, {"cpu": 0.0, "wall": 0.0})
+    totals["cpu"] += cpu
+    totals["wall"] += wall
+
+
+def profiled(function, phase: str):
+    """
+    Wrap a function so the time spent in it is charged to a phase.
+    
+    Calls nested inside a call charged to the same phase are not timed
+    again (e.g. load_graph reading a binary file via load_graph_binary).
+    
+    Args:
+        function: Function to wrap
+        phase: Phase the time is charged to
+        
+    Returns:
+        The wrapper
+    """
+    def wrapper(*args, **kwargs):
+        if phase in PROFILE_ACTIVE:
+            return function(*args, **kwargs)
+        PROFILE_ACTIVE.add(phase)
+        cpu_start, wall_start = time.process_time(), time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            record_phase(phase, time.process_time() - cpu_start, time.perf_counter() - wall_start)
+            PROFILE_ACTIVE.discard(phase)
+    wrapper.__wrapped__ = function
+    return wrapper
+
+
+def counted_find_edge_in_mask(neighbor_masks: List[int], mask: int) -> Tuple[int, int]:
+    """
+    find_edge_in_mask that also counts searches and scanned neighbor rows.
+    
+    Every vertex of mask up to the one the edge is found at (all of mask
+    if there is none) has its neighbor row scanned once.
+    
+    Args:
+        neighbor_masks: Neighbor bitmask per vertex index (see build_neighbor_masks)
+        mask: Bitmask of the vertex subset
+        
+    Returns:
+        The result of find_edge_in_mask
+    """
+    u_idx, v_idx = counted_find_edge_in_mask.__wrapped__(neighbor_masks, mask)
+    scanned = mask if u_idx == -1 else mask & ((2 << u_idx) - 1)
+    PROFILE_COUNTERS["edge_searches"] += 1
+    PROFILE_COUNTERS["edges_scanned"] += bin(scanned).count("1")
+    return (u_idx, v_idx)
+
+
+def enable_profiling():
+    """
+    Start collecting per-phase times and edge-search counters in this process.
+    
+    Replaces the module-level functions in PROFILED_FUNCTIONS with timed
+    wrappers and find_edge_in_mask with counted_find_edge_in_mask; engines
+    look these up at call time, so nothing is paid while profiling is off.
+    Calls through names imported into other modules are not timed. The
+    parallel engine's worker processes are not counted.
+    """
+    module = globals()
+    if hasattr(module["find_edge_in_mask"], "__wrapped__"):
+        return
+    counted_find_edge_in_mask.__wrapped__ = module["find_edge_in_mask"]
+    module["find_edge_in_mask"] = counted_find_edge_in_mask
+    for name, phase in PROFILED_FUNCTIONS.items():
+        module[name] = profiled(module[name], phase)
+
+
+def reset_profile():
+    """
+    Clear the collected phase times and counters, and the table, cache and engine statistics.
+    """
+    PROFILE_PHASES.clear()
+    for key in PROFILE_COUNTERS:
+        PROFILE_COUNTERS[key] = 0
+    for key in TABLE_STATS:
+        TABLE_STATS[key] = 0
+    for key in CACHE_STATS:
+        CACHE_STATS[key] = 0
+    reset_engine_stats()
+
+
+def reset_engine_stats():
+    """
+    Clear the per-solve statistics of the lazy and treewidth engines, which
+    are aggregated over the components of one instance.
+    """
+    LAZY_STATS["states_touched"] = 0
+    LAZY_STATS["total_states"] = 0
+    TREEWIDTH_STATS["width"] = -1
+    TREEWIDTH_STATS["bags"] = 0
+
+
+def profile_record(phases: Dict[str, Dict[str, float]] = None) -> dict:
+    """
+    Collect the profile of the work done since the last reset_profile.
+    
+    Args:
+        phases: Phase times measured by the caller, merged over PROFILE_PHASES
+        
+    Returns:
+        A JSON-serializable dict with "phases" ({phase: {"cpu", "wall"}}) and
+        "counters": masks_evaluated, edge_searches, edges_scanned, the peak
+        DP table (table_entries, table_bytes) and the result cache counters
+    """
+    merged = {phase: dict(times) for phase, times in PROFILE_PHASES.items()}
+    merged.update(phases or {})
+    counters = dict(PROFILE_COUNTERS)
+    counters["table_entries"] = TABLE_STATS["entries"]
+    counters["table_bytes"] = TABLE_STATS["bytes"]
+    counters.update({f"cache_{key}": value for key, value in CACHE_STATS.items()})
+    return {"phases": merged, "counters": counters}
 
 
 def has_edges(graph: Dict[int, Set[int]], vertex_set: Set[int]) -> bool:
@@ -48,6 +295,61 @@ def find_any_edge(graph: Dict[int, Set[int]], vertex_set: Set[int]) -> Tuple[int
     raise ValueError("No edge found in vertex_set")
 
 
+def build_neighbor_masks(graph: Dict[int, Set[int]], vertices: List[int]) -> List[int]:
+    """
+    Build an integer-bitmask representation of the graph.
+    
+    Self-loops are left out (bit i is never set in entry i): like the
+    baseline DP, the engines only cover edges between distinct vertices.
+    
+    Args:
+        graph: Adjacency list representation of the graph
+        vertices: List of all vertices in the graph; bit i stands for vertices[i]
+        
+    Returns:
+        A list where entry i is the bitmask of the neighbors of vertices[i]
+    """
+    vertex_to_index = {v: i for i, v in enumerate(vertices)}
+    neighbor_masks = [0] * len(vertices)
+    for i, u in enumerate(vertices):
+        for v in graph.get(u, ()):
+            if v in vertex_to_index and v != u:
+                neighbor_masks[i] |= 1 << vertex_to_index[v]
+    return neighbor_masks
+
+
+def find_edge_in_mask(neighbor_masks: List[int], mask: int) -> Tuple[int, int]:
+    """
+    Find an edge in the induced subgraph on mask, in a single pass.
+    
+    Picks the lowest-indexed vertex u of mask that has a neighbor in mask, and
+    the lowest-indexed such neighbor v. Every lower vertex of mask is isolated
+    in the induced subgraph, so u < v always holds.
+    
+    Args:
+        neighbor_masks: Neighbor bitmask per vertex index (see build_neighbor_masks)
+        mask: Bitmask of the vertex subset
+        
+    Returns:
+        A tuple (u_idx, v_idx) of vertex indices, or (-1, -1) if the induced
+        subgraph has no edges
+    """
+    remaining = mask
+    while remaining:
+        low = remaining & -remaining
+        u_idx = low.bit_length() - 1
+        adjacent = neighbor_masks[u_idx] & mask
+        if adjacent:
+            return (u_idx, (adjacent & -adjacent).bit_length() - 1)
+        remaining ^= low
+    return (-1, -1)
+
+
+# Approximate memory per state of the dict engine's table: a dict slot, the
+# (size, parent, removed) tuple and the parent mask int
+DICT_STATE_BYTES = 168
+
+
 def minimum_vertex_cover_dp(graph: Dict[int, Set[int]], vertices: List[int]) -> Tuple[int, Set[int]]:
     """
     Compute minimum vertex cover using dynamic programming over subsets.
@@ -58,7 +360,7 @@ def minimum_vertex_cover_dp(graph: Dict[int, Set[int]], vertices: List[int]) ->
     - If S has no edges: DP[S] = 0
     - Otherwise, choose any edge (u, v) in S:
       DP[S] = 1 + min(DP[S \\ {u}], DP[S \\ {v}])
-    
+      
     Args:
         graph: Adjacency list representation of the graph
         vertices: List of all vertices in the graph
@@ -66,9 +368,13 @@ def minimum_vertex_cover_dp(graph: Dict[int, Set[int]], vertices: List[int]) ->
     Returns:
         A tuple (min_cover_size, min_cover_set) where min_cover_set is the
         actual minimum vertex cover
+        
+    Raises:
+        ValueError: If the table would exceed TABLE_SETTINGS["max_bytes"]
     """
     n = len(vertices)
-    vertex_to_index = {v: i for i, v in enumerate(vertices)}
+    check_table_size(n, DICT_STATE_BYTES, "dict")
+    neighbor_masks = build_neighbor_masks(graph, vertices)
     
     # DP table: dp[mask] = (min_cover_size, parent_mask, removed_vertex)
     # mask is a bitmask representing a subset of vertices
@@ -79,18 +385,15 @@ def minimum_vertex_cover_dp(graph: Dict[int, Set[int]], vertices: List[int]) ->
     
     # Iterate over all subsets in increasing order of size
     for mask in range(1, 1 << n):
-        # Convert mask to vertex set
-        vertex_set = {vertices[i] for i in range(n) if (mask >> i) & 1}
+        # Find any edge (u, v) in the induced subgraph
+        u_idx, v_idx = find_edge_in_mask(neighbor_masks, mask)
         
-        # Check if induced subgraph has edges
-        if not has_edges(graph, vertex_set):
+        if u_idx == -1:
             # No edges: cover size is 0
             dp[mask] = (0, -1, -1)
         else:
-            # Find any edge (u, v) in the induced subgraph
-            u, v = find_any_edge(graph, vertex_set)
-            u_idx = vertex_to_index[u]
-            v_idx = vertex_to_index[v]
+            u = vertices[u_idx]
+            v = vertices[v_idx]
             
             # Try removing u
             mask_without_u = mask & ~(1 << u_idx)
@@ -106,6 +409,9 @@ def minimum_vertex_cover_dp(graph: Dict[int, Set[int]], vertices: List[int]) ->
             else:
                 dp[mask] = (1 + size_without_v, mask_without_v, v)
     
+    record_table_size(len(dp), sys.getsizeof(dp) + len(dp) * sys.getsizeof((0, -1, -1)))
+    PROFILE_COUNTERS["masks_evaluated"] += len(dp)
+    
     # Reconstruct the minimum vertex cover
     full_mask = (1 << n) - 1
     min_size = dp[full_mask][0]
@@ -122,110 +428,3054 @@ def minimum_vertex_cover_dp(graph: Dict[int, Set[int]], vertices: List[int]) ->
     return (min_size, cover_set)
 
 
-def load_graph(filename: str) -> Tuple[Dict[int, Set[int]], List[int]]:
+def minimum_vertex_cover_dp_array(graph: Dict[int, Set[int]], vertices: List[int]) -> Tuple[int, Set[int]]:
     """
-    Load graph from file.
+    Compute minimum vertex cover using DP over subsets with a compact table.
     
-    File format:
-    First line: number of vertices n
-    Next lines: edges as "u v" (one per line)
+    Same recurrence and edge choice as minimum_vertex_cover_dp, but the table
+    is stored as two flat typed arrays indexed by mask instead of a dict of tuples:
+    - sizes[mask]: minimum cover size of the induced subgraph on mask
+    - removed[mask]: index of the vertex added to the cover at mask (-1 if none)
+    
+    The parent mask is not stored; it is mask with the removed vertex's bit
+    cleared. This uses 2 bytes per state instead of a dict slot plus a tuple.
     
     Args:
-        filename: Path to the input file
+        graph: Adjacency list representation of the graph
+        vertices: List of all vertices in the graph
         
     Returns:
-        A tuple (graph, vertices) where graph is an adjacency list and
-        vertices is a list of all vertex labels
+        A tuple (min_cover_size, min_cover_set) where min_cover_set is the
+        actual minimum vertex cover
+        
+    Raises:
+        ValueError: If the table would exceed TABLE_SETTINGS["max_bytes"]
     """
-    graph: Dict[int, Set[int]] = {}
-    vertices_set = set()
+    n = len(vertices)
+    check_table_size(n, 2, "array")
+    neighbor_masks = build_neighbor_masks(graph, vertices)
+    num_states = 1 << n
     
-    with open(filename, 'r') as f:
-        lines = [line.strip() for line in f if line.strip()]
-        if not lines:
-            return (graph, [])
-        
-        # First line: number of vertices (optional, we'll infer from edges)
-        n = int(lines[0]) if lines[0].isdigit() else None
-        
-        # If n is specified, initialize vertices 0 to n-1
-        if n is not None:
-            vertices_set = set(range(n))
-            start_idx = 1
-        else:
-            vertices_set = set()
-            start_idx = 0
-        
-        # Read edges
-        for line in lines[start_idx:]:
-            parts = line.split()
-            if len(parts) >= 2:
-                u = int(parts[0])
-                v = int(parts[1])
-                vertices_set.add(u)
-                vertices_set.add(v)
-                
-                if u not in graph:
-                    graph[u] = set()
-                if v not in graph:
-                    graph[v] = set()
-                
-                graph[u].add(v)
-                graph[v].add(u)
+    # Both tables start in the base case: cover size 0, nothing removed
+    sizes = array('B', bytes(num_states))
+    removed = array('b', [-1]) * num_states
     
-    vertices = sorted(list(vertices_set))
-    return (graph, vertices)
+    for mask in range(1, num_states):
+        u_idx, v_idx = find_edge_in_mask(neighbor_masks, mask)
+        if u_idx == -1:
+            continue
+        
+        size_without_u = sizes[mask & ~(1 << u_idx)]
+        size_without_v = sizes[mask & ~(1 << v_idx)]
+        
+        if size_without_u <= size_without_v:
+            sizes[mask] = 1 + size_without_u
+            removed[mask] = u_idx
+        else:
+            sizes[mask] = 1 + size_without_v
+            removed[mask] = v_idx
+    
+    record_table_size(num_states, (sizes.itemsize + removed.itemsize) * num_states)
+    PROFILE_COUNTERS["masks_evaluated"] += num_states
+    full_mask = num_states - 1
+    return (sizes[full_mask], reconstruct_cover(removed, vertices, full_mask))
 
 
-def save_output(filename: str, min_size: int, cover_set: Set[int]):
+def reconstruct_cover(removed, vertices: List[int], mask: int) -> Set[int]:
     """
-    Save the output to a file.
+    Backtrack through a compact DP table to recover the cover for mask.
     
-    File format:
-    First line: minimum cover size
-    Next lines: vertices in the cover (one per line, sorted)
+    Args:
+        removed: Table mapping each mask to the index of the vertex added to
+            the cover at that mask, or -1 if the induced subgraph has no edges
+        vertices: List of all vertices in the graph
+        mask: Subset whose cover should be reconstructed
+        
+    Returns:
+        Set of vertices in the minimum cover of the induced subgraph on mask
+    """
+    cover_set = set()
+    while mask != 0 and removed[mask] != -1:
+        idx = removed[mask]
+        cover_set.add(vertices[idx])
+        mask &= ~(1 << idx)
+    return cover_set
+
+
+# Masks computed between two checkpoints of minimum_vertex_cover_mmap
+CHECKPOINT_INTERVAL = 1 << 22
+
+
+def write_checkpoint(filename: str, checkpoint: dict):
+    """
+    Atomically replace a JSON checkpoint file.
     
     Args:
-        filename: Path to the output file
-        min_size: Minimum vertex cover size
-        cover_set: Set of vertices in the minimum cover
+        filename: Path to the checkpoint file
+        checkpoint: Checkpoint record to write
     """
-    with open(filename, 'w') as f:
-        f.write(f"{min_size}\n")
-        for vertex in sorted(cover_set):
-            f.write(f"{vertex}\n")
+    tmp_filename = filename + ".tmp"
+    with open(tmp_filename, 'w') as f:
+        json.dump(checkpoint, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_filename, filename)
 
 
-def main():
+def minimum_vertex_cover_mmap(graph: Dict[int, Set[int]], vertices: List[int], table_dir: str = ".",
+                              resume: bool = False,
+                              checkpoint_interval: int = CHECKPOINT_INTERVAL) -> Tuple[int, Set[int]]:
     """
-    Main function: reads graph from file, computes minimum vertex cover,
-    and writes results to output file.
+    Compute minimum vertex cover using DP over subsets with an on-disk table.
+    
+    Same recurrence and edge choice as minimum_vertex_cover_dp_array, but the
+    table is a memory-mapped file with a fixed 2-byte record per mask
+    (cover size, removed vertex index), so tables larger than RAM spill to
+    disk through the page cache. Masks are computed in increasing order;
+    every checkpoint_interval masks the table is flushed and the first
+    unfinished mask is recorded in a checkpoint file next to it. With
+    resume, a run whose checkpoint matches the same graph continues from
+    there instead of starting over. Both files are removed after the cover
+    has been reconstructed.
+    
+    Args:
+        graph: Adjacency list representation of the graph
+        vertices: List of all vertices in the graph
+        table_dir: Directory holding the table and checkpoint files
+        resume: Continue from an existing checkpoint for the same graph
+        checkpoint_interval: Number of masks computed between checkpoints
+        
+    Returns:
+        A tuple (min_cover_size, min_cover_set) where min_cover_set is the
+        actual minimum vertex cover
+        
+    Raises:
+        ValueError: If a new table would not fit in the free space of table_dir
     """
-    if len(sys.argv) < 3:
-        print("Usage: python main.py <input_file> <output_file>")
-        sys.exit(1)
+    n = len(vertices)
+    neighbor_masks = build_neighbor_masks(graph, vertices)
+    num_states = 1 << n
+    full_mask = num_states - 1
     
-    input_file = sys.argv[1]
-    output_file = sys.argv[2]
+    # Table files are named after the graph so a resume cannot mix graphs
+    fingerprint = hashlib.sha1(repr((vertices, neighbor_masks)).encode()).hexdigest()[:16]
+    table_file = os.path.join(table_dir, f"vc_{fingerprint}.dptable")
+    checkpoint_file = table_file + ".ckpt"
     
-    # Load graph
-    graph, vertices = load_graph(input_file)
+    next_mask = 1
+    if resume and os.path.exists(table_file) and os.path.exists(checkpoint_file):
+        with open(checkpoint_file, 'r') as f:
+            checkpoint = json.load(f)
+        if checkpoint.get("fingerprint") == fingerprint:
+            next_mask = checkpoint["next_mask"]
+    else:
+        # Fresh table: every record starts as (0, -1)
+        os.makedirs(table_dir, exist_ok=True)
+        check_table_size(n, 2, "mmap", shutil.disk_usage(table_dir).free)
+        with open(table_file, 'wb') as f:
+            block = b'\x00\xff' * min(num_states, 1 << 20)
+            for start in range(0, num_states, 1 << 20):
+                f.write(block[:2 * min(1 << 20, num_states - start)])
     
-    if not vertices:
-        print("Error: No vertices in graph")
-        sys.exit(1)
+    with open(table_file, 'r+b') as f:
+        table_map = mmap.mmap(f.fileno(), 2 * num_states)
+    record_table_size(num_states, 2 * num_states)
+    table = memoryview(table_map).cast('b')
     
-    # Compute minimum vertex cover
-    min_size, cover_set = minimum_vertex_cover_dp(graph, vertices)
+    try:
+        for mask in range(next_mask, num_states):
+            u_idx, v_idx = find_edge_in_mask(neighbor_masks, mask)
+            if u_idx == -1:
+                table[2 * mask] = 0
+                table[2 * mask + 1] = -1
+            else:
+                size_without_u = table[2 * (mask & ~(1 << u_idx))]
+                size_without_v = table[2 * (mask & ~(1 << v_idx))]
+                if size_without_u <= size_without_v:
+                    table[2 * mask] = 1 + size_without_u
+                    table[2 * mask + 1] = u_idx
+                else:
+                    table[2 * mask] = 1 + size_without_v
+                    table[2 * mask + 1] = v_idx
+            
+            if mask % checkpoint_interval == 0:
+                table_map.flush()
+                write_checkpoint(checkpoint_file, {"fingerprint": fingerprint, "n": n, "next_mask": mask + 1})
+        
+        PROFILE_COUNTERS["masks_evaluated"] += num_states - next_mask
+        min_size = table[2 * full_mask]
+        removed = table[1::2]
+        cover_set = reconstruct_cover(removed, vertices, full_mask)
+        removed.release()
+    finally:
+        table.release()
+        table_map.close()
     
-    # Save output
-    save_output(output_file, min_size, cover_set)
+    os.remove(table_file)
+    if os.path.exists(checkpoint_file):
+        os.remove(checkpoint_file)
+    return (min_size, cover_set)
+
+
+# Components smaller than this are solved serially by minimum_vertex_cover_parallel
+PARALLEL_MIN_VERTICES = 16
+
+# Shared-memory table and neighbor masks of a parallel DP worker process
+PARALLEL_STATE = {}
+
+
+def unrank_combination(n: int, k: int, rank: int) -> int:
+    """
+    Return the k-subset of n bits at the given rank in increasing numeric order.
     
-    # Print summary
-    print(f"Minimum vertex cover size: {min_size}")
-    print(f"Vertices in cover: {sorted(cover_set)}")
+    Uses the combinatorial number system: the rank of a subset with bits
+    c_k > ... > c_1 is the sum of C(c_i, i).
+    
+    Args:
+        n: Number of bits
+        k: Number of set bits
+        rank: Position of the subset among all C(n, k) subsets, from 0
+        
+    Returns:
+        Bitmask of the subset
+    """
+    mask = 0
+    c = n
+    for i in range(k, 0, -1):
+        c -= 1
+        while comb(c, i) > rank:
+            c -= 1
+        mask |= 1 << c
+        rank -= comb(c, i)
+    return mask
 
 
-if __name__ == "__main__":
-    main()
+def init_parallel_worker(shm_name: str, neighbor_masks: List[int]):
+    """
+    Attach a parallel DP worker process to the shared-memory table.
+    
+    Args:
+        shm_name: Name of the shared-memory block holding the DP table
+        neighbor_masks: Neighbor bitmask per vertex index
+    """
+    PARALLEL_STATE["shm"] = SharedMemory(name=shm_name)
+    PARALLEL_STATE["neighbor_masks"] = neighbor_masks
+
+
+def solve_layer_chunk(task: Tuple[int, int, int, int]):
+    """
+    Fill the DP table for a run of masks of one popcount layer.
+    
+    Masks of popcount k only read masks of popcount k - 1, so all chunks of a
+    layer can run at the same time. Consecutive masks with the same popcount
+    are generated with Gosper's hack.
+    
+    Args:
+        task: A tuple (k, start_rank, count, n) selecting count masks of
+            popcount k, starting at start_rank, in a table over n vertices
+    """
+    k, start_rank, count, n = task
+    neighbor_masks = PARALLEL_STATE["neighbor_masks"]
+    num_states = 1 << n
+    buf = PARALLEL_STATE["shm"].buf
+    sizes = buf[:num_states]
+    removed = buf[num_states:2 * num_states].cast('b')
+    
+    mask = unrank_combination(n, k, start_rank)
+    for _ in range(count):
+        u_idx, v_idx = find_edge_in_mask(neighbor_masks, mask)
+        if u_idx != -1:
+            size_without_u = sizes[mask & ~(1 << u_idx)]
+            size_without_v = sizes[mask & ~(1 << v_idx)]
+            if size_without_u <= size_without_v:
+                sizes[mask] = 1 + size_without_u
+                removed[mask] = u_idx
+            else:
+                sizes[mask] = 1 + size_without_v
+                removed[mask] = v_idx
+        
+        # Next mask with the same popcount
+        low = mask & -mask
+        ripple = mask + low
+        mask = (((ripple ^ mask) >> 2) // low) | ripple
+    
+    removed.release()
+    sizes.release()
+
+
+def minimum_vertex_cover_parallel(graph: Dict[int, Set[int]], vertices: List[int],
+                                  workers: int = None) -> Tuple[int, Set[int]]:
+    """
+    Compute minimum vertex cover using a multi-process DP over subsets.
+    
+    Same table layout, recurrence and edge choice as
+    minimum_vertex_cover_dp_array, but the table lives in a shared-memory
+    block and each popcount layer is split into chunks processed by a pool
+    of worker processes. Workers attach to the block by name, so the table
+    is never pickled. Components with fewer than PARALLEL_MIN_VERTICES
+    vertices are solved serially.
+    
+    Args:
+        graph: Adjacency list representation of the graph
+        vertices: List of all vertices in the graph
+        workers: Number of worker processes (default: number of CPUs)
+        
+    Returns:
+        A tuple (min_cover_size, min_cover_set) where min_cover_set is the
+        actual minimum vertex cover
+        
+    Raises:
+        ValueError: If the table would exceed TABLE_SETTINGS["max_bytes"]
+    """
+    n = len(vertices)
+    if n < PARALLEL_MIN_VERTICES:
+        return minimum_vertex_cover_dp_array(graph, vertices)
+    
+    check_table_size(n, 2, "parallel")
+    workers = workers or os.cpu_count() or 1
+    neighbor_masks = build_neighbor_masks(graph, vertices)
+    num_states = 1 << n
+    full_mask = num_states - 1
+    
+    shm = SharedMemory(create=True, size=2 * num_states)
+    record_table_size(num_states, 2 * num_states)
+    try:
+        # Base case everywhere: cover size 0, nothing removed
+        shm.buf[:num_states] = bytes(num_states)
+        shm.buf[num_states:2 * num_states] = b'\xff' * num_states
+        
+        with Pool(workers, initializer=init_parallel_worker, initargs=(shm.name, neighbor_masks)) as pool:
+            # Layers 0 and 1 have no edges
+            for k in range(2, n + 1):
+                total = comb(n, k)
+                chunk = -(-total // (4 * workers))
+                tasks = [(k, start, min(chunk, total - start), n) for start in range(0, total, chunk)]
+                pool.map(solve_layer_chunk, tasks)
+        
+        PROFILE_COUNTERS["masks_evaluated"] += num_states
+        sizes = shm.buf[:num_states]
+        removed = shm.buf[num_states:2 * num_states].cast('b')
+        min_size = sizes[full_mask]
+        cover_set = reconstruct_cover(removed, vertices, full_mask)
+        removed.release()
+        sizes.release()
+    finally:
+        shm.close()
+        shm.unlink()
+    
+    return (min_size, cover_set)
+
+
+# Default number of states kept in the memo cache of minimum_vertex_cover_lazy
+LAZY_CACHE_SIZE = 1 << 22
+
+# States touched and table size of the lazy engine, summed over the components
+# of the current instance (cleared by reset_engine_stats)
+LAZY_STATS = {"states_touched": 0, "total_states": 0}
+
+
+def minimum_vertex_cover_lazy(graph: Dict[int, Set[int]], vertices: List[int],
+                              cache_size: int = LAZY_CACHE_SIZE) -> Tuple[int, Set[int]]:
+    """
+    Compute minimum vertex cover using a lazy top-down DP over subsets.
+    
+    Same recurrence and edge choice as minimum_vertex_cover_dp, but evaluated
+    on demand from the full mask, so only subsets reachable by removing one
+    endpoint of the chosen edge are ever materialized. Vertices that are
+    isolated in a subset change neither its value nor its edge choice, so
+    each subset is reduced to its non-isolated core before lookup; edgeless
+    subsets end immediately and are not stored.
+    
+    The recursion is driven by an explicit stack of frames
+    [mask, mask_without_u, mask_without_v, size_without_u, size_without_v];
+    a finished frame hands its value to its parent directly, so the memo is a
+    bounded LRU cache that only saves recomputation. The number of states
+    evaluated (including any recomputed after eviction) is added to LAZY_STATS.
+    
+    Args:
+        graph: Adjacency list representation of the graph
+        vertices: List of all vertices in the graph
+        cache_size: Maximum number of states kept in the memo cache
+        
+    Returns:
+        A tuple (min_cover_size, min_cover_set) where min_cover_set is the
+        actual minimum vertex cover
+    """
+    n = len(vertices)
+    neighbor_masks = build_neighbor_masks(graph, vertices)
+    memo: OrderedDict = OrderedDict()
+    touched = 0
+    
+    def core(mask):
+        remaining = mask
+        while remaining:
+            low = remaining & -remaining
+            remaining ^= low
+            if not neighbor_masks[low.bit_length() - 1] & mask:
+                mask ^= low
+        return mask
+    
+    def new_frame(mask):
+        u_idx, v_idx = find_edge_in_mask(neighbor_masks, mask)
+        return [mask, core(mask & ~(1 << u_idx)), core(mask & ~(1 << v_idx)), None, None]
+    
+    def evaluate(mask):
+        nonlocal touched
+        mask = core(mask)
+        if not mask:
+            return 0
+        if mask in memo:
+            memo.move_to_end(mask)
+            return memo[mask]
+        stack = [new_frame(mask)]
+        while stack:
+            frame = stack[-1]
+            # Fill the two child slots, descending into children not yet known
+            for slot in (3, 4):
+                if frame[slot] is None:
+                    child = frame[slot - 2]
+                    if not child:
+                        frame[slot] = 0
+                    elif child in memo:
+                        memo.move_to_end(child)
+                        frame[slot] = memo[child]
+                    else:
+                        stack.append(new_frame(child))
+                        break
+            else:
+                stack.pop()
+                value = 1 + min(frame[3], frame[4])
+                touched += 1
+                memo[frame[0]] = value
+                if len(memo) > cache_size:
+                    memo.popitem(last=False)
+                if stack:
+                    # Both children of the parent can reduce to the same core
+                    parent = stack[-1]
+                    for slot in (3, 4):
+                        if parent[slot] is None and parent[slot - 2] == frame[0]:
+                            parent[slot] = value
+        return value
+    
+    full_mask = (1 << n) - 1
+    min_size = evaluate(full_mask)
+    
+    # Reconstruct by repeating the choice made at each state
+    cover_set = set()
+    mask = full_mask
+    while True:
+        u_idx, v_idx = find_edge_in_mask(neighbor_masks, mask)
+        if u_idx == -1:
+            break
+        mask_without_u = mask & ~(1 << u_idx)
+        mask_without_v = mask & ~(1 << v_idx)
+        if evaluate(mask_without_u) <= evaluate(mask_without_v):
+            cover_set.add(vertices[u_idx])
+            mask = mask_without_u
+        else:
+            cover_set.add(vertices[v_idx])
+            mask = mask_without_v
+    
+    record_table_size(len(memo), sys.getsizeof(memo) + len(memo) * sys.getsizeof(full_mask))
+    LAZY_STATS["states_touched"] += touched
+    PROFILE_COUNTERS["masks_evaluated"] += touched
+    LAZY_STATS["total_states"] += 1 << n
+    return (min_size, cover_set)
 
+
+def minimum_vertex_cover_tree(graph: Dict[int, Set[int]], vertices: List[int]) -> Tuple[int, Set[int]]:
+    """
+    Compute minimum vertex cover of a forest using the linear-time tree DP.
+    
+    Each tree is rooted at its lowest vertex and, for every node u:
+    - dp1[u] = size of min vertex cover of the subtree of u if u is included
+    - dp0[u] = size of min vertex cover of the subtree of u if u is excluded
+    
+      dp1[u] = 1 + sum(min(dp0[c], dp1[c])) over children c
+      dp0[u] = sum(dp1[c]) over children c
+      
+    The traversal is iterative (a BFS order processed in reverse), so deep
+    trees do not hit the recursion limit, and per-node state lives in flat
+    arrays indexed by vertex position.
+    
+    Args:
+        graph: Adjacency list representation of the graph
+        vertices: List of all vertices in the forest
+        
+    Returns:
+        A tuple (min_cover_size, min_cover_set) where min_cover_set is the
+        actual minimum vertex cover
+        
+    Raises:
+        ValueError: If the graph induced on vertices contains a cycle
+    """
+    n = len(vertices)
+    vertex_to_index = {v: i for i, v in enumerate(vertices)}
+    parent = array('l', [-1]) * n
+    visited = bytearray(n)
+    order = array('l')
+    
+    # BFS order of every tree; parents always come before their children
+    for root in range(n):
+        if visited[root]:
+            continue
+        visited[root] = 1
+        order.append(root)
+        head = len(order) - 1
+        while head < len(order):
+            u = order[head]
+            head += 1
+            parent_u = parent[u]
+            for w in graph.get(vertices[u], ()):
+                v = vertex_to_index[w]
+                if v == parent_u or v == u:
+                    # Self-loops need no cover vertex, as in the baseline DP
+                    continue
+                if visited[v]:
+                    raise ValueError("Graph contains a cycle; the tree DP only applies to forests")
+                visited[v] = 1
+                parent[v] = u
+                order.append(v)
+    
+    # Bottom-up: fold each node into its parent
+    dp0 = array('l', [0]) * n
+    dp1 = array('l', [1]) * n
+    for u in reversed(order):
+        p = parent[u]
+        if p != -1:
+            excluded = dp0[u]
+            included = dp1[u]
+            dp0[p] += included
+            dp1[p] += excluded if excluded < included else included
+    
+    # Top-down: a node may be left out only if its parent is in the cover
+    min_size = 0
+    in_cover = bytearray(n)
+    for u in order:
+        p = parent[u]
+        if p == -1 or in_cover[p]:
+            excluded = dp0[u]
+            included = dp1[u]
+            if included <= excluded:
+                in_cover[u] = 1
+            if p == -1:
+                min_size += excluded if excluded < included else included
+        else:
+            in_cover[u] = 1
+    
+    record_table_size(n, 4 * parent.itemsize * n + 2 * n)
+    PROFILE_COUNTERS["masks_evaluated"] += n
+    cover_set = {vertices[i] for i in range(n) if in_cover[i]}
+    return (min_size, cover_set)
+
+
+def matching_lower_bound(neighbor_masks: List[int], mask: int) -> int:
+    """
+    Lower-bound the minimum cover of the induced subgraph on mask.
+    
+    A cover needs a distinct vertex for every edge of a matching, so the
+    size of a greedy maximal matching is a lower bound.
+    
+    Args:
+        neighbor_masks: Neighbor bitmask per vertex index (see build_neighbor_masks)
+        mask: Bitmask of the vertex subset
+        
+    Returns:
+        The size of a maximal matching of the induced subgraph
+    """
+    matched = 0
+    available = mask
+    while available:
+        low = available & -available
+        available ^= low
+        adjacent = neighbor_masks[low.bit_length() - 1] & available
+        if adjacent:
+            available ^= adjacent & -adjacent
+            matched += 1
+    return matched
+
+
+def greedy_cover_mask(neighbor_masks: List[int], mask: int) -> int:
+    """
+    Build a vertex cover of the induced subgraph on mask greedily.
+    
+    Repeatedly takes a vertex of maximum degree in the remaining graph.
+    
+    Args:
+        neighbor_masks: Neighbor bitmask per vertex index (see build_neighbor_masks)
+        mask: Bitmask of the vertex subset
+        
+    Returns:
+        Bitmask of the cover
+    """
+    cover = 0
+    while True:
+        best_degree = 0
+        best = -1
+        remaining = mask
+        while remaining:
+            low = remaining & -remaining
+            remaining ^= low
+            i = low.bit_length() - 1
+            degree = bin(neighbor_masks[i] & mask).count("1")
+            if degree > best_degree:
+                best_degree = degree
+                best = i
+        if best == -1:
+            return cover
+        cover |= 1 << best
+        mask &= ~(1 << best)
+
+
+def minimum_vertex_cover_bnb(graph: Dict[int, Set[int]], vertices: List[int],
+                             deadline: float = None) -> Tuple[int, Set[int]]:
+    """
+    Compute minimum vertex cover by depth-first branch and bound.
+    
+    Each search node is a pair (remaining vertices, cover so far) kept as
+    bitmasks. Degree-0 vertices are dropped and the neighbor of every
+    degree-1 vertex is taken. Otherwise the node branches on a vertex v of
+    maximum degree: either v is in the cover, or all of N(v) is. A node is
+    pruned when its cover size plus a matching lower bound cannot beat the
+    best cover found so far, which starts as a greedy cover.
+    
+    The search uses an explicit stack holding at most two nodes per level,
+    so memory stays polynomial where the 2^n table cannot be allocated.
+    
+    Args:
+        graph: Adjacency list representation of the graph
+        vertices: List of all vertices in the graph
+        deadline: time.perf_counter() value after which the search gives up
+        
+    Returns:
+        A tuple (min_cover_size, min_cover_set) where min_cover_set is the
+        actual minimum vertex cover
+        
+    Raises:
+        TimeoutError: If the deadline passes before the search finishes
+    """
+    n = len(vertices)
+    neighbor_masks = build_neighbor_masks(graph, vertices)
+    
+    best_cover = greedy_cover_mask(neighbor_masks, (1 << n) - 1)
+    best_size = bin(best_cover).count("1")
+    
+    stack = [((1 << n) - 1, 0, 0)]
+    max_stack = 1
+    nodes = 0
+    while stack:
+        max_stack = max(max_stack, len(stack))
+        nodes += 1
+        if deadline is not None and time.perf_counter() > deadline:
+            raise TimeoutError("Branch and bound search ran out of time")
+        mask, cover, size = stack.pop()
+        
+        # Drop isolated vertices and take the neighbor of every leaf
+        changed = True
+        while changed:
+            changed = False
+            remaining = mask
+            while remaining:
+                low = remaining & -remaining
+                remaining ^= low
+                if not mask & low:
+                    continue
+                adjacent = neighbor_masks[low.bit_length() - 1] & mask
+                if not adjacent:
+                    mask ^= low
+                elif adjacent & (adjacent - 1) == 0:
+                    mask &= ~(low | adjacent)
+                    cover |= adjacent
+                    size += 1
+                    changed = True
+        
+        if size + matching_lower_bound(neighbor_masks, mask) >= best_size:
+            continue
+        if not mask:
+            best_size = size
+            best_cover = cover
+            continue
+        
+        # Branch on a vertex of maximum degree
+        best_degree = 0
+        branch = 0
+        remaining = mask
+        while remaining:
+            low = remaining & -remaining
+            remaining ^= low
+            degree = bin(neighbor_masks[low.bit_length() - 1] & mask).count("1")
+            if degree > best_degree:
+                best_degree = degree
+                branch = low
+        neighbors = neighbor_masks[branch.bit_length() - 1] & mask
+        
+        # Explore "v in the cover" first
+        stack.append((mask & ~(branch | neighbors), cover | neighbors, size + best_degree))
+        stack.append((mask & ~branch, cover | branch, size + 1))
+    
+    record_table_size(max_stack, max_stack * (sys.getsizeof((0, 0, 0)) + 2 * sys.getsizeof(best_cover)))
+    PROFILE_COUNTERS["masks_evaluated"] += nodes
+    cover_set = {vertices[i] for i in range(n) if (best_cover >> i) & 1}
+    return (best_size, cover_set)
+
+
+# Number of masks processed per vectorized step in minimum_vertex_cover_numpy
+NUMPY_CHUNK_SIZE = 1 << 20
+
+
+def minimum_vertex_cover_numpy(graph: Dict[int, Set[int]], vertices: List[int]) -> Tuple[int, Set[int]]:
+    """
+    Compute minimum vertex cover using a NumPy-vectorized DP over subsets.
+    
+    Uses the recurrence on the highest vertex h of S instead of an edge of S:
+    either h is in the cover, or all of its neighbors in S are.
+    
+      DP[S] = min(1 + DP[S \\ {h}], |N(h) & S| + DP[S \\ N[h]])
+      
+    Both S \\ {h} and S \\ N[h] are below 2^h, so all masks whose highest
+    bit is h are computed at once from the already finished prefix of the
+    table. The table holds one byte per mask; the choice made at each mask
+    is recomputed during reconstruction instead of being stored.
+    
+    Args:
+        graph: Adjacency list representation of the graph
+        vertices: List of all vertices in the graph
+        
+    Returns:
+        A tuple (min_cover_size, min_cover_set) where min_cover_set is the
+        actual minimum vertex cover
+        
+    Raises:
+        ImportError: If numpy is not installed
+        ValueError: If the table would exceed TABLE_SETTINGS["max_bytes"]
+    """
+    if np is None:
+        raise ImportError("The numpy engine requires numpy. Install with: pip install numpy")
+    
+    n = len(vertices)
+    check_table_size(n, 2, "numpy")
+    neighbor_masks = build_neighbor_masks(graph, vertices)
+    # Only neighbors below h can be in a mask whose highest bit is h
+    lower_masks = [neighbor_masks[h] & ((1 << h) - 1) for h in range(n)]
+    
+    dp = np.zeros(1 << n, dtype=np.uint8)
+    popcount = np.zeros(1 << n, dtype=np.uint8)
+    record_table_size(1 << n, dp.nbytes + popcount.nbytes)
+    PROFILE_COUNTERS["masks_evaluated"] += 1 << n
+    
+    for h in range(n):
+        low = 1 << h
+        lower = lower_masks[h]
+        for start in range(0, low, NUMPY_CHUNK_SIZE):
+            stop = min(start + NUMPY_CHUNK_SIZE, low)
+            rest = np.arange(start, stop, dtype=np.int64)
+            popcount[low + start:low + stop] = popcount[start:stop] + 1
+            
+            take_h = dp[start:stop] + 1
+            if lower:
+                take_neighbors = popcount[rest & lower] + dp[rest & ~lower]
+                dp[low + start:low + stop] = np.minimum(take_h, take_neighbors)
+            else:
+                # h is isolated in every such mask
+                dp[low + start:low + stop] = dp[start:stop]
+    
+    # Reconstruct the cover by repeating the choice made at each mask
+    cover_set = set()
+    mask = (1 << n) - 1
+    while mask:
+        h = mask.bit_length() - 1
+        rest = mask ^ (1 << h)
+        neighbors = lower_masks[h] & rest
+        if dp[mask] == bin(neighbors).count("1") + dp[rest & ~neighbors]:
+            cover_set.update(vertices[i] for i in range(h) if (neighbors >> i) & 1)
+            mask = rest & ~neighbors
+        else:
+            cover_set.add(vertices[h])
+            mask = rest
+    
+    return (int(dp[(1 << n) - 1]), cover_set)
+
+
+# Largest graph minimum_vertex_cover_batch accepts
+BATCH_MAX_VERTICES = 20
+
+# DP states (graphs x 2^n) processed together by minimum_vertex_cover_batch;
+# larger chunks fall out of cache
+BATCH_CHUNK_STATES = 1 << 18
+
+
+def minimum_vertex_cover_batch(graphs: List[Tuple[Dict[int, Set[int]], List[int]]]) -> List[Tuple[int, Set[int]]]:
+    """
+    Compute minimum vertex covers of many small graphs at once with NumPy.
+    
+    Runs the recurrence of minimum_vertex_cover_numpy on a (graphs x 2^n)
+    table: graphs with the same number of vertices are grouped, their
+    neighbor bitmasks are packed into an array, and every step of the DP
+    (all masks with highest bit h) is one vectorized operation across the
+    whole group. Reconstruction walks all graphs of the group in lockstep,
+    so the Python work per step is independent of the number of graphs.
+    Groups are processed in chunks of about BATCH_CHUNK_STATES table entries.
+    
+    Args:
+        graphs: List of (graph, vertices) pairs, each with at most
+            BATCH_MAX_VERTICES vertices
+            
+    Returns:
+        One (min_cover_size, min_cover_set) tuple per graph, in input order
+        
+    Raises:
+        ValueError: If a graph has more than BATCH_MAX_VERTICES vertices
+    """
+    if np is None:
+        raise ImportError("Batched solving requires numpy. Install with: pip install numpy")
+    
+    groups: Dict[int, List[int]] = {}
+    for index, (_, vertices) in enumerate(graphs):
+        if len(vertices) > BATCH_MAX_VERTICES:
+            raise ValueError(f"Graph {index} has {len(vertices)} vertices; "
+                             f"batched solving supports at most {BATCH_MAX_VERTICES}")
+        groups.setdefault(len(vertices), []).append(index)
+    
+    results: List[Tuple[int, Set[int]]] = [(0, set()) for _ in graphs]
+    for n, indices in groups.items():
+        if n == 0:
+            continue
+        num_states = 1 << n
+        masks = np.arange(num_states, dtype=np.int32)
+        popcount = np.zeros(num_states, dtype=np.uint8)
+        highest = np.zeros(num_states, dtype=np.int64)
+        for h in range(n):
+            popcount[1 << h:2 << h] = popcount[:1 << h] + 1
+            highest[1 << h:2 << h] = h
+        
+        chunk = max(1, BATCH_CHUNK_STATES >> n)
+        for start in range(0, len(indices), chunk):
+            batch = indices[start:start + chunk]
+            # lower[b, h]: neighbors of vertex h below h in graph b
+            lower = np.array([[m & ((1 << h) - 1) for h, m in enumerate(build_neighbor_masks(*graphs[i]))]
+                              for i in batch], dtype=np.int64)
+            dp = np.zeros((len(batch), num_states), dtype=np.uint8)
+            record_table_size(dp.size, dp.nbytes)
+            PROFILE_COUNTERS["masks_evaluated"] += dp.size
+            
+            # Gathers index the flattened table, row b starting at b * 2^n
+            table = dp.reshape(-1)
+            row_offsets = (np.arange(len(batch), dtype=np.int32) * num_states)[:, None]
+            lower_columns = lower.astype(np.int32)
+            for h in range(n):
+                low = 1 << h
+                rest = masks[:low]
+                column = lower_columns[:, h:h + 1]
+                take_neighbors = popcount[rest & column] + table[(rest & ~column) + row_offsets]
+                dp[:, low:2 * low] = np.minimum(dp[:, :low] + 1, take_neighbors)
+            
+            # Reconstruct every cover in lockstep, repeating the choice made at each mask
+            rows = np.arange(len(batch))
+            mask = np.full(len(batch), num_states - 1, dtype=np.int64)
+            cover = np.zeros(len(batch), dtype=np.int64)
+            for _ in range(n):
+                h = highest[mask]
+                bit = np.where(mask != 0, np.left_shift(1, h), 0)
+                rest = mask ^ bit
+                neighbors = lower[rows, h] & rest
+                take_neighbors = dp[rows, mask] == popcount[neighbors] + dp[rows, rest & ~neighbors]
+                cover |= np.where(take_neighbors, neighbors, bit)
+                mask = np.where(take_neighbors, rest & ~neighbors, rest)
+            
+            sizes = dp[:, num_states - 1]
+            for row, i in enumerate(batch):
+                vertices = graphs[i][1]
+                bits = int(cover[row])
+                results[i] = (int(sizes[row]), {vertices[j] for j in range(n) if (bits >> j) & 1})
+    return results
+
+
+# Heuristics for the elimination ordering of the treewidth engine
+ELIMINATION_HEURISTICS = ("min-degree", "min-fill")
+
+# Largest width the treewidth engine accepts: its tables have 2^width entries
+TREEWIDTH_MAX_WIDTH = 24
+
+# Width of the decompositions built by the treewidth engine (max over the
+# components of the current instance; cleared by reset_engine_stats)
+TREEWIDTH_STATS = {"width": -1, "bags": 0}
+
+
+def fill_in(adjacency: List[Set[int]], u: int) -> int:
+    """
+    Count the edges elimination of a vertex would add between its neighbors.
+    
+    Args:
+        adjacency: Adjacency sets indexed by vertex position
+        u: Position of the vertex
+        
+    Returns:
+        The number of non-adjacent pairs of neighbors of u
+    """
+    neighbors = list(adjacency[u])
+    missing = 0
+    for i, a in enumerate(neighbors):
+        adjacent = adjacency[a]
+        for b in neighbors[i + 1:]:
+            if b not in adjacent:
+                missing += 1
+    return missing
+
+
+def elimination_order(graph: Dict[int, Set[int]], vertices: List[int],
+                      heuristic: str = "min-degree") -> Tuple[List[int], List[List[int]]]:
+    """
+    Compute a greedy elimination ordering of the graph.
+    
+    Repeatedly eliminates the vertex of minimum degree (or minimum fill-in)
+    in the current graph: its neighbors are made a clique and it is removed.
+    A priority queue with lazily invalidated entries keeps each step
+    logarithmic; on a forest every step removes a leaf.
+    
+    Args:
+        graph: Adjacency list representation of the graph
+        vertices: List of all vertices in the graph
+        heuristic: "min-degree" or "min-fill"
+        
+    Returns:
+        A tuple (order, later) where order lists vertex positions in
+        elimination order and later[u] lists the neighbors of u at the time
+        it was eliminated (all eliminated after u); the bag of u is u plus
+        later[u], so the width is the largest len(later[u])
+    """
+    if heuristic not in ELIMINATION_HEURISTICS:
+        raise ValueError(f"Unknown elimination heuristic: {heuristic}")
+    n = len(vertices)
+    vertex_to_index = {v: i for i, v in enumerate(vertices)}
+    adjacency = [{vertex_to_index[w] for w in graph.get(v, ()) if w in vertex_to_index and w != v}
+                 for v in vertices]
+    score = fill_in if heuristic == "min-fill" else (lambda adjacency, u: len(adjacency[u]))
+    
+    keys = [score(adjacency, u) for u in range(n)]
+    heap = [(keys[u], u) for u in range(n)]
+    heapq.heapify(heap)
+    eliminated = bytearray(n)
+    order = []
+    later = [None] * n
+    while heap:
+        key, u = heapq.heappop(heap)
+        if eliminated[u] or key != keys[u]:
+            continue
+        eliminated[u] = 1
+        order.append(u)
+        neighbors = list(adjacency[u])
+        later[u] = neighbors
+        changed = set(neighbors)
+        for i, a in enumerate(neighbors):
+            adjacency[a].discard(u)
+            for b in neighbors[i + 1:]:
+                if b not in adjacency[a]:
+                    adjacency[a].add(b)
+                    adjacency[b].add(a)
+                    if heuristic == "min-fill":
+                        # The new edge closes a missing pair of every common neighbor
+                        changed |= adjacency[a] & adjacency[b]
+        adjacency[u] = set()
+        for w in changed:
+            keys[w] = score(adjacency, w)
+            heapq.heappush(heap, (keys[w], w))
+    return (order, later)
+
+
+def minimum_vertex_cover_treewidth(graph: Dict[int, Set[int]], vertices: List[int],
+                                   heuristic: str = "min-degree",
+                                   max_width: int = TREEWIDTH_MAX_WIDTH) -> Tuple[int, Set[int]]:
+    """
+    Compute minimum vertex cover by DP over a heuristic tree decomposition.
+    
+    An elimination ordering (elimination_order) defines a tree decomposition
+    whose bag for vertex u is u plus its later neighbors S(u); the bag's
+    parent is the bag of the first of S(u) to be eliminated, which contains
+    all of S(u). Eliminating u produces a table over S(u):
+    
+      f_u(A) = min over x in {0, 1} of x + sum of f_c(A + {u: x}) over child bags c
+      
+    where x = 0 is only allowed if A covers every original edge from u to
+    S(u). Tables have 2^|S(u)| entries, so the time is O(n * 2^width) and
+    graphs of small treewidth solve exactly however large they are; on a
+    forest the decomposition has width 1 and this is the tree DP. The best
+    choice of x per entry is kept to rebuild the cover top-down. The width
+    is recorded in TREEWIDTH_STATS.
+    
+    Args:
+        graph: Adjacency list representation of the graph
+        vertices: List of all vertices in the graph
+        heuristic: Elimination heuristic, "min-degree" or "min-fill"
+        max_width: Largest width to run the DP on
+        
+    Returns:
+        A tuple (min_cover_size, min_cover_set) where min_cover_set is the
+        actual minimum vertex cover
+        
+    Raises:
+        ValueError: If the decomposition found is wider than max_width
+    """
+    n = len(vertices)
+    order, later = elimination_order(graph, vertices, heuristic)
+    width = max((len(bag) for bag in later), default=0)
+    TREEWIDTH_STATS["width"] = max(TREEWIDTH_STATS["width"], width)
+    TREEWIDTH_STATS["bags"] += n
+    if width > max_width:
+        raise ValueError(f"Tree decomposition of width {width} exceeds the limit of {max_width}")
+    
+    position = [0] * n
+    for step, u in enumerate(order):
+        position[u] = step
+    vertex_to_index = {v: i for i, v in enumerate(vertices)}
+    
+    children = [[] for _ in range(n)]
+    tables = [None] * n
+    choices = [None] * n
+    min_size = 0
+    entries = 0
+    for u in order:
+        scope = later[u]
+        k = len(scope)
+        # Bag assignments are masks with u at bit 0 and scope[j] at bit j + 1
+        bit = {w: j + 1 for j, w in enumerate(scope)}
+        bit[u] = 0
+        required = 0
+        for w in graph.get(vertices[u], ()):
+            j = bit.get(vertex_to_index.get(w, -1))
+            if j:
+                required |= 1 << (j - 1)
+        
+        totals = [0] * (2 << k)
+        for c in children[u]:
+            child_table = tables[c]
+            bits = [bit[w] for w in later[c]]
+            for mask in range(2 << k):
+                index = 0
+                for j, b in enumerate(bits):
+                    index |= ((mask >> b) & 1) << j
+                totals[mask] += child_table[index]
+            tables[c] = None
+        
+        table = [0] * (1 << k)
+        choice = bytearray(1 << k)
+        for assignment in range(1 << k):
+            included = 1 + totals[(assignment << 1) | 1]
+            if assignment & required == required and totals[assignment << 1] <= included:
+                table[assignment] = totals[assignment << 1]
+            else:
+                table[assignment] = included
+                choice[assignment] = 1
+        tables[u] = table
+        choices[u] = choice
+        entries += 1 << k
+        
+        if scope:
+            children[min(scope, key=position.__getitem__)].append(u)
+        else:
+            min_size += table[0]
+    
+    # Top-down: later vertices are decided first, so each scope is assigned
+    in_cover = bytearray(n)
+    for u in reversed(order):
+        assignment = 0
+        for j, w in enumerate(later[u]):
+            assignment |= in_cover[w] << j
+        in_cover[u] = choices[u][assignment]
+    
+    record_table_size(entries, 2 * entries)
+    PROFILE_COUNTERS["masks_evaluated"] += entries
+    cover_set = {vertices[i] for i in range(n) if in_cover[i]}
+    return (min_size, cover_set)
+
+
+# Available engines for the exact DP, selectable with --engine
+ENGINES = {
+    "dict": minimum_vertex_cover_dp,
+    "array": minimum_vertex_cover_dp_array,
+    "bnb": minimum_vertex_cover_bnb,
+    "lazy": minimum_vertex_cover_lazy,
+    "mmap": minimum_vertex_cover_mmap,
+    "numpy": minimum_vertex_cover_numpy,
+    "parallel": minimum_vertex_cover_parallel,
+    "tree": minimum_vertex_cover_tree,
+    "treewidth": minimum_vertex_cover_treewidth,
+}
+
+
+# Loop iterations between deadline checks in connected_components, kernelize
+# and the anytime heuristics
+DEADLINE_CHECK_INTERVAL = 1024
+
+
+def connected_components(graph: Dict[int, Set[int]], vertices: List[int],
+                         deadline: float = None) -> List[List[int]]:
+    """
+    Split the graph into connected components, dropping isolated vertices.
+    
+    Isolated vertices never need to be in a cover, so they are left out.
+    
+    Args:
+        graph: Adjacency list representation of the graph
+        vertices: List of all vertices in the graph
+        deadline: time.perf_counter() value to give up at, or None
+        
+    Returns:
+        A list of components, each a sorted list of at least two vertices
+        
+    Raises:
+        TimeoutError: If the deadline passes before every component is found
+    """
+    components = []
+    seen = set()
+    steps = 0
+    for start in vertices:
+        if start in seen or not graph.get(start):
+            continue
+        seen.add(start)
+        component = [start]
+        stack = [start]
+        while stack:
+            steps += 1
+            if deadline is not None and not steps % DEADLINE_CHECK_INTERVAL and time.perf_counter() > deadline:
+                raise TimeoutError("component search ran past the deadline")
+            u = stack.pop()
+            for v in graph[u]:
+                if v not in seen:
+                    seen.add(v)
+                    component.append(v)
+                    stack.append(v)
+        components.append(sorted(component))
+    return components
+
+
+# Component result cache: in-memory LRU tier and optional on-disk tier.
+# memory_entries = 0 disables the cache; disk_dir = None keeps it in memory only.
+CACHE_SETTINGS = {"memory_entries": 0, "disk_dir": None, "disk_bytes": 0, "max_vertices": 0}
+
+# Cache lookups since the cache was configured
+CACHE_STATS = {"hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0}
+
+# Canonical key -> (cover size, cover positions in canonical order)
+RESULT_CACHE: OrderedDict = OrderedDict()
+
+# Default cap of the on-disk tier in MiB
+CACHE_DISK_MB = 256
+
+# Largest component looked up in the cache by default. canonical_component is
+# roughly quadratic (~40 ms at 128 vertices, ~0.4 s for a 400-cycle), which
+# only pays off for components the exponential engines find expensive
+CACHE_MAX_VERTICES = 128
+
+# Bytes in the on-disk tier as counted by this process: set by the directory
+# scan in evict_disk_cache, then advanced by each store (None until the first)
+DISK_CACHE_USAGE = {"bytes": None}
+
+# Fraction of the cap the on-disk tier is trimmed to, so the next directory
+# scan only happens after that much new data has been stored
+CACHE_DISK_LOW_WATER = 0.9
+
+
+def configure_cache(memory_entries: int = 1 << 16, disk_dir: str = None, disk_mb: int = CACHE_DISK_MB,
+                    max_vertices: int = CACHE_MAX_VERTICES):
+    """
+    Enable the component result cache used by solve_by_components.
+    
+    Args:
+        memory_entries: Components kept in the in-memory LRU tier (0 disables the cache)
+        disk_dir: Directory of the on-disk tier, or None for memory only
+        disk_mb: Size cap of the on-disk tier in MiB; least recently used
+            entries are deleted beyond it
+        max_vertices: Larger components are solved without the cache, since
+            computing their canonical form costs more than it saves
+    """
+    CACHE_SETTINGS["memory_entries"] = memory_entries
+    CACHE_SETTINGS["disk_dir"] = disk_dir
+    CACHE_SETTINGS["disk_bytes"] = disk_mb * 1024 * 1024
+    CACHE_SETTINGS["max_vertices"] = max_vertices
+    RESULT_CACHE.clear()
+    DISK_CACHE_USAGE["bytes"] = None
+    for key in CACHE_STATS:
+        CACHE_STATS[key] = 0
+    if disk_dir is not None:
+        os.makedirs(disk_dir, exist_ok=True)
+
+
+def canonical_component(graph: Dict[int, Set[int]], component: List[int]) -> Tuple[str, List[int]]:
+    """
+    Compute a relabeling-invariant key and vertex order for a component.
+    
+    Vertices are partitioned by color refinement (start from degrees, then
+    split classes by the multiset of neighbor colors until stable). While a
+    class still holds several vertices, its lowest-labeled vertex is given a
+    color of its own and the partition is refined again. The final colors
+    order the vertices, and the key hashes the edge list in that order, so
+    equal keys always mean the same graph up to the returned orders. When
+    refinement separates the vertex orbits, as for most graphs, relabeled
+    copies of a component get the same key.
+    
+    Args:
+        graph: Adjacency list representation of the graph
+        component: Sorted vertices of a connected component
+        
+    Returns:
+        A tuple (key, order) where order lists the component's vertices in
+        canonical order
+    """
+    colors = {v: len(graph[v]) for v in component}
+    num_colors = 0
+    while True:
+        # Refine until the number of classes stops growing
+        while True:
+            signatures = {v: (colors[v], tuple(sorted(colors[u] for u in graph[v]))) for v in component}
+            palette = {signature: i for i, signature in enumerate(sorted(set(signatures.values())))}
+            colors = {v: palette[signatures[v]] for v in component}
+            if len(palette) == num_colors:
+                break
+            num_colors = len(palette)
+        if num_colors == len(component):
+            break
+        
+        # Individualize the lowest-labeled vertex of the first non-singleton class
+        class_sizes = {}
+        for v in component:
+            class_sizes[colors[v]] = class_sizes.get(colors[v], 0) + 1
+        tied = min(color for color, size in class_sizes.items() if size > 1)
+        chosen = min(v for v in component if colors[v] == tied)
+        colors = {v: 2 * colors[v] + (1 if v == chosen else 0) for v in component}
+    
+    order = sorted(component, key=lambda v: colors[v])
+    position = {v: i for i, v in enumerate(order)}
+    edges = sorted((min(position[u], position[v]), max(position[u], position[v]))
+                   for u in component for v in graph[u] if u < v)
+    text = f"{len(order)}:" + ",".join(f"{a}-{b}" for a, b in edges)
+    return (hashlib.sha1(text.encode()).hexdigest(), order)
+
+
+def cache_lookup(key: str):
+    """
+    Look up a component result in the memory tier, then the disk tier.
+    
+    Args:
+        key: Canonical key from canonical_component
+        
+    Returns:
+        A tuple (cover size, cover positions) or None on a miss
+    """
+    if key in RESULT_CACHE:
+        RESULT_CACHE.move_to_end(key)
+        CACHE_STATS["hits"] += 1
+        return RESULT_CACHE[key]
+    
+    disk_dir = CACHE_SETTINGS["disk_dir"]
+    if disk_dir is not None:
+        filename = os.path.join(disk_dir, key + ".json")
+        try:
+            with open(filename, 'r') as f:
+                entry = json.load(f)
+            os.utime(filename)
+        except (OSError, ValueError):
+            entry = None
+        if entry is not None:
+            CACHE_STATS["disk_hits"] += 1
+            result = (entry["size"], entry["cover"])
+            remember_result(key, result)
+            return result
+    
+    CACHE_STATS["misses"] += 1
+    return None
+
+
+def remember_result(key: str, result: Tuple[int, List[int]]):
+    """
+    Insert a result into the memory tier, evicting the least recently used entry.
+    
+    Args:
+        key: Canonical key from canonical_component
+        result: A tuple (cover size, cover positions)
+    """
+    RESULT_CACHE[key] = result
+    RESULT_CACHE.move_to_end(key)
+    while len(RESULT_CACHE) > CACHE_SETTINGS["memory_entries"]:
+        RESULT_CACHE.popitem(last=False)
+
+
+def cache_store(key: str, result: Tuple[int, List[int]]):
+    """
+    Store a freshly solved component result in both tiers.
+    
+    The disk tier's size is tracked in DISK_CACHE_USAGE instead of being
+    rescanned on every store; the directory is only scanned (and trimmed)
+    the first time and whenever the running count passes the cap, which also
+    picks up entries written by other processes.
+    
+    Args:
+        key: Canonical key from canonical_component
+        result: A tuple (cover size, cover positions)
+    """
+    remember_result(key, result)
+    disk_dir = CACHE_SETTINGS["disk_dir"]
+    if disk_dir is None:
+        return
+    
+    # Write under a per-process temporary name so concurrent workers never see partial files
+    filename = os.path.join(disk_dir, key + ".json")
+    tmp_filename = f"{filename}.{os.getpid()}.tmp"
+    data = json.dumps({"size": result[0], "cover": result[1]})
+    with open(tmp_filename, 'w') as f:
+        f.write(data)
+    os.replace(tmp_filename, filename)
+    
+    usage = DISK_CACHE_USAGE["bytes"]
+    if usage is None or usage + len(data) > CACHE_SETTINGS["disk_bytes"]:
+        DISK_CACHE_USAGE["bytes"] = evict_disk_cache(disk_dir, CACHE_SETTINGS["disk_bytes"])
+    else:
+        DISK_CACHE_USAGE["bytes"] = usage + len(data)
+
+
+def evict_disk_cache(disk_dir: str, max_bytes: int) -> int:
+    """
+    Scan the disk tier and, if it exceeds its size cap, delete least recently
+    used entries until it is below CACHE_DISK_LOW_WATER of the cap.
+    
+    Args:
+        disk_dir: Directory of the on-disk tier
+        max_bytes: Size cap in bytes
+        
+    Returns:
+        Total size of the remaining entries in bytes
+    """
+    entries = []
+    total = 0
+    with os.scandir(disk_dir) as it:
+        for entry in it:
+            if entry.name.endswith(".json"):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+    if total <= max_bytes:
+        return total
+    
+    target = int(max_bytes * CACHE_DISK_LOW_WATER)
+    for _, size, path in sorted(entries):
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+        CACHE_STATS["evictions"] += 1
+        total -= size
+        if total <= target:
+            break
+    return total
+
+
+def format_cache_stats(stats: Dict[str, int]) -> str:
+    """
+    Format result cache counters for the console.
+    
+    Args:
+        stats: Counters with the keys of CACHE_STATS
+        
+    Returns:
+        A one-line summary
+    """
+    lookups = stats["hits"] + stats["disk_hits"] + stats["misses"]
+    hit_rate = 100.0 * (stats["hits"] + stats["disk_hits"]) / lookups if lookups else 0.0
+    return (f"Component cache: {stats['hits']} memory hits, {stats['disk_hits']} disk hits, "
+            f"{stats['misses']} misses ({hit_rate:.1f}% hit rate), {stats['evictions']} disk evictions")
+
+
+def solve_by_components(graph: Dict[int, Set[int]], vertices: List[int], engine: str = "array",
+                        **engine_options) -> Tuple[int, Set[int]]:
+    """
+    Compute minimum vertex cover by solving each connected component separately.
+    
+    The minimum cover of a graph is the union of the minimum covers of its
+    components, so the exponential cost becomes the sum of 2^|component|
+    instead of 2^n. Acyclic components (|E| = |V| - 1) are always solved
+    with the linear-time tree DP; only cyclic ones go to the selected engine.
+    When the result cache is enabled (configure_cache), cyclic components of
+    up to CACHE_SETTINGS["max_vertices"] vertices are looked up by their
+    canonical form first, so a component repeated within or across inputs,
+    even relabeled, is solved once.
+    
+    Args:
+        graph: Adjacency list representation of the graph
+        vertices: List of all vertices in the graph
+        engine: Name of the engine in ENGINES used for each component
+        **engine_options: Extra keyword arguments for the engine
+        
+    Returns:
+        A tuple (min_cover_size, min_cover_set) where min_cover_set is the
+        actual minimum vertex cover
+    """
+    solver = ENGINES[engine]
+    min_size = 0
+    cover_set = set()
+    for component in connected_components(graph, vertices):
+        num_edges = sum(1 for u in component for w in graph[u] if u < w)
+        if num_edges == len(component) - 1:
+            size, cover = minimum_vertex_cover_tree(graph, component)
+        elif CACHE_SETTINGS["memory_entries"] and len(component) <= CACHE_SETTINGS["max_vertices"]:
+            key, order = canonical_component(graph, component)
+            result = cache_lookup(key)
+            if result is None:
+                size, cover = solver(graph, component, **engine_options)
+                position = {v: i for i, v in enumerate(order)}
+                cache_store(key, (size, sorted(position[v] for v in cover)))
+            else:
+                size, cover = result[0], {order[i] for i in result[1]}
+        else:
+            size, cover = solver(graph, component, **engine_options)
+        min_size += size
+        cover_set |= cover
+    return (min_size, cover_set)
+
+
+def remove_vertex(graph: Dict[int, Set[int]], v: int) -> Set[int]:
+    """
+    Remove a vertex and its incident edges from the graph in place.
+    
+    Args:
+        graph: Adjacency list representation of the graph
+        v: Vertex to remove
+        
+    Returns:
+        The former neighbors of v
+    """
+    neighbors = graph.pop(v)
+    for u in neighbors:
+        graph[u].discard(v)
+    return neighbors
+
+
+def maximal_matching(graph: Dict[int, Set[int]]) -> List[Tuple[int, int]]:
+    """
+    Greedily build a maximal matching.
+    
+    Args:
+        graph: Adjacency list representation of the graph
+        
+    Returns:
+        A list of matched edges (u, v)
+    """
+    matched = set()
+    matching = []
+    for u in graph:
+        if u in matched:
+            continue
+        for v in graph[u]:
+            if v not in matched:
+                matched.add(u)
+                matched.add(v)
+                matching.append((u, v))
+                break
+    return matching
+
+
+def lp_reduction(graph: Dict[int, Set[int]]) -> Tuple[Set[int], Set[int]]:
+    """
+    Find the vertices fixed by a half-integral optimum of the vertex cover LP.
+    
+    Builds the bipartite double cover (left copy u, right copy v for every
+    edge in both directions), finds a maximum matching with Hopcroft-Karp and
+    turns it into a minimum vertex cover C with König's theorem. Setting
+    x[v] = (|{left v, right v} & C|) / 2 gives an optimal LP solution, and by
+    the Nemhauser-Trotter theorem some minimum cover contains every vertex
+    with x = 1 and none with x = 0. This subsumes the crown reduction.
+    
+    Args:
+        graph: Adjacency list representation of the graph
+        
+    Returns:
+        A tuple (in_cover, out_of_cover) of the vertices with x = 1 and x = 0
+    """
+    left_match: Dict[int, int] = {}
+    right_match: Dict[int, int] = {}
+    
+    while True:
+        # BFS layers from the free left vertices over alternating paths
+        layer = {u: 0 for u in graph if u not in left_match}
+        queue = list(layer)
+        found = False
+        for u in queue:
+            for v in graph[u]:
+                w = right_match.get(v)
+                if w is None:
+                    found = True
+                elif w not in layer:
+                    layer[w] = layer[u] + 1
+                    queue.append(w)
+        if not found:
+            break
+        
+        # Iterative DFS for vertex-disjoint shortest augmenting paths
+        iterators = {}
+        for root in [u for u in graph if u not in left_match]:
+            stack = [root]
+            iterators[root] = iter(graph[root])
+            while stack:
+                u = stack[-1]
+                for v in iterators[u]:
+                    w = right_match.get(v)
+                    if w is None:
+                        # Augment along the stack
+                        for i in range(len(stack) - 1, -1, -1):
+                            x = stack[i]
+                            previous = left_match.get(x)
+                            left_match[x] = v
+                            right_match[v] = x
+                            v = previous
+                        stack = []
+                        break
+                    if layer.get(w) == layer[u] + 1 and w not in iterators:
+                        iterators[w] = iter(graph[w])
+                        stack.append(w)
+                        break
+                else:
+                    stack.pop()
+    
+    # König: Z = vertices reachable from free left vertices by alternating paths
+    reached_left = {u for u in graph if u not in left_match}
+    reached_right = set()
+    queue = list(reached_left)
+    for u in queue:
+        for v in graph[u]:
+            if v not in reached_right:
+                reached_right.add(v)
+                w = right_match.get(v)
+                if w is not None and w not in reached_left:
+                    reached_left.add(w)
+                    queue.append(w)
+    
+    # Cover C = (left \ Z) | (right & Z)
+    in_cover = {v for v in graph if v not in reached_left and v in reached_right}
+    out_of_cover = {v for v in graph if v in reached_left and v not in reached_right}
+    return (in_cover, out_of_cover)
+
+
+def kernelize(graph: Dict[int, Set[int]], vertices: List[int],
+              deadline: float = None) -> Tuple[Dict[int, Set[int]], List[int], Set[int], List[Tuple[int, int, int, int]]]:
+    """
+    Apply the standard vertex cover reductions exhaustively.
+    
+    Rules, applied until none of them changes the graph:
+    - Degree 0: remove the vertex.
+    - Degree 1: put its neighbor in the cover.
+    - Degree 2 with adjacent neighbors u, w: put u and w in the cover.
+    - Degree 2 with non-adjacent neighbors u, w: fold v, u, w into a new
+      vertex f adjacent to N(u) | N(w) minus v; the cover shrinks by one.
+    - High degree: a vertex with more neighbors than an upper bound on the
+      minimum cover (twice a maximal matching) is in every minimum cover.
+    - LP / crown: vertices fixed by the LP relaxation (see lp_reduction).
+    
+    Folded vertices get fresh labels above every existing label. The input
+    graph is not modified; use unfold_cover to lift a cover of the kernel
+    back to a cover of the input graph.
+    
+    Args:
+        graph: Adjacency list representation of the graph
+        vertices: List of all vertices in the graph
+        deadline: time.perf_counter() value to give up at, or None
+        
+    Returns:
+        A tuple (kernel_graph, kernel_vertices, forced, folds) where forced is
+        the set of vertices already in the cover and folds lists the fold
+        operations (v, u, w, f) in the order they were applied
+        
+    Raises:
+        TimeoutError: If the deadline passes before the kernel is complete
+    """
+    # Copy in chunks so that a deadline also bounds the copy of a large graph
+    kernel = {}
+    for i in range(0, len(vertices), DEADLINE_CHECK_INTERVAL):
+        if deadline is not None and time.perf_counter() > deadline:
+            raise TimeoutError("kernelization ran past the deadline")
+        kernel.update((v, set(graph.get(v, ()))) for v in vertices[i:i + DEADLINE_CHECK_INTERVAL])
+    for v, neighbors in kernel.items():
+        neighbors.discard(v)  # Self-loops need no cover vertex
+    forced: Set[int] = set()
+    folds: List[Tuple[int, int, int, int]] = []
+    next_label = max(vertices) + 1 if vertices else 0
+    
+    queue = list(kernel)
+    steps = 0
+    while True:
+        while queue:
+            steps += 1
+            if deadline is not None and not steps % DEADLINE_CHECK_INTERVAL and time.perf_counter() > deadline:
+                raise TimeoutError("kernelization ran past the deadline")
+            v = queue.pop()
+            if v not in kernel:
+                continue
+            degree = len(kernel[v])
+            if degree == 0:
+                del kernel[v]
+            elif degree == 1:
+                u = next(iter(kernel[v]))
+                forced.add(u)
+                queue.extend(remove_vertex(kernel, u))
+            elif degree == 2:
+                u, w = kernel[v]
+                if w in kernel[u]:
+                    forced.add(u)
+                    forced.add(w)
+                    queue.extend(remove_vertex(kernel, u))
+                    queue.extend(remove_vertex(kernel, w))
+                else:
+                    f = next_label
+                    next_label += 1
+                    remove_vertex(kernel, v)
+                    neighbors = remove_vertex(kernel, u) | remove_vertex(kernel, w)
+                    kernel[f] = neighbors
+                    for x in neighbors:
+                        kernel[x].add(f)
+                    folds.append((v, u, w, f))
+                    queue.append(f)
+                    queue.extend(neighbors)
+        
+        if deadline is not None and time.perf_counter() > deadline:
+            raise TimeoutError("kernelization ran past the deadline")
+        upper_bound = 2 * len(maximal_matching(kernel))
+        high_degree = [v for v in kernel if len(kernel[v]) > upper_bound]
+        if high_degree:
+            for v in high_degree:
+                forced.add(v)
+                queue.extend(remove_vertex(kernel, v))
+            continue
+        
+        in_cover, out_of_cover = lp_reduction(kernel)
+        if not in_cover and not out_of_cover:
+            break
+        for v in in_cover:
+            forced.add(v)
+            queue.extend(remove_vertex(kernel, v))
+        for v in out_of_cover:
+            if v in kernel:
+                queue.extend(remove_vertex(kernel, v))
+    
+    return (kernel, sorted(kernel), forced, folds)
+
+
+def unfold_cover(cover_set: Set[int], forced: Set[int], folds: List[Tuple[int, int, int, int]]) -> Set[int]:
+    """
+    Lift a cover of the kernel back to a cover of the original graph.
+    
+    Args:
+        cover_set: Vertex cover of the kernel graph
+        forced: Vertices put in the cover by kernelize
+        folds: Fold operations (v, u, w, f) recorded by kernelize
+        
+    Returns:
+        A vertex cover of the original graph of size
+        |cover_set| + |forced| + |folds|
+    """
+    cover_set = cover_set | forced
+    for v, u, w, f in reversed(folds):
+        if f in cover_set:
+            cover_set.discard(f)
+            cover_set.add(u)
+            cover_set.add(w)
+        else:
+            cover_set.add(v)
+    return cover_set
+
+
+def solve_graph(graph: Dict[int, Set[int]], vertices: List[int], engine: str = "array",
+                use_kernel: bool = True, **engine_options) -> Tuple[int, Set[int], int]:
+    """
+    Run the full pipeline on a loaded graph: kernelize, solve by components, unfold.
+    
+    Args:
+        graph: Adjacency list representation of the graph
+        vertices: List of all vertices in the graph
+        engine: Name of the engine in ENGINES
+        use_kernel: Whether to apply the reduction rules first
+        **engine_options: Extra keyword arguments for the engine
+        
+    Returns:
+        A tuple (min_cover_size, min_cover_set, kernel_vertex_count)
+    """
+    if use_kernel:
+        kernel, kernel_vertices, forced, folds = kernelize(graph, vertices)
+    else:
+        kernel, kernel_vertices, forced, folds = graph, vertices, set(), []
+    
+    kernel_size, kernel_cover = solve_by_components(kernel, kernel_vertices, engine, **engine_options)
+    min_size = kernel_size + len(forced) + len(folds)
+    cover_set = unfold_cover(kernel_cover, forced, folds)
+    return (min_size, cover_set, len(kernel_vertices))
+
+
+# Share of an anytime time limit spent on local search before exact refinement
+ANYTIME_SEARCH_SHARE = 0.5
+
+# Cover vertices sampled per removal step of local_search_cover
+LOCAL_SEARCH_SAMPLES = 50
+
+# Largest kernel solve_anytime tries to solve exactly; bnb setup alone is quadratic
+ANYTIME_EXACT_MAX_VERTICES = 500
+
+
+def greedy_cover(graph: Dict[int, Set[int]], vertices: List[int], deadline: float = None) -> Set[int]:
+    """
+    Build a vertex cover greedily, then drop redundant vertices.
+    
+    While the remaining graph has a degree-1 vertex its neighbor is taken
+    (always safe, and optimal on forests); otherwise a vertex of maximum
+    remaining degree is taken. Degrees only decrease, so a bucket queue with
+    lazily invalidated entries makes this O(n + m). A cover vertex whose
+    neighbors are all in the cover is then removed.
+    
+    Args:
+        graph: Adjacency list representation of the graph
+        vertices: List of all vertices in the graph
+        deadline: time.perf_counter() value to give up at, or None
+        
+    Returns:
+        A vertex cover of the graph; when the deadline passes during the
+        removal of redundant vertices, the cover is returned as it is
+        
+    Raises:
+        TimeoutError: If the deadline passes before the cover is complete
+    """
+    degree = {v: len(graph.get(v, ())) for v in vertices}
+    top = max(degree.values(), default=0)
+    buckets = [[] for _ in range(max(top, 1) + 1)]
+    for v, d in degree.items():
+        buckets[d].append(v)
+    leaves = list(buckets[1])
+    cover = set()
+    done = set()
+    
+    def take(v):
+        cover.add(v)
+        done.add(v)
+        for w in graph[v]:
+            if w not in done:
+                degree[w] -= 1
+                buckets[degree[w]].append(w)
+                if degree[w] == 1:
+                    leaves.append(w)
+    
+    steps = 0
+    while True:
+        steps += 1
+        if deadline is not None and not steps % DEADLINE_CHECK_INTERVAL and time.perf_counter() > deadline:
+            raise TimeoutError("greedy cover ran past the deadline")
+        if leaves:
+            v = leaves.pop()
+            if v not in done and degree[v] == 1:
+                done.add(v)
+                take(next(w for w in graph[v] if w not in done))
+            continue
+        while top > 0 and not buckets[top]:
+            top -= 1
+        if top == 0:
+            break
+        v = buckets[top].pop()
+        if v not in done and degree[v] == top:
+            take(v)
+    
+    # Remove vertices whose edges are all covered from the other side
+    for steps, v in enumerate(sorted(cover, key=lambda v: len(graph[v])), 1):
+        if deadline is not None and not steps % DEADLINE_CHECK_INTERVAL and time.perf_counter() > deadline:
+            break
+        if all(w in cover for w in graph[v]):
+            cover.discard(v)
+    return cover
+
+
+def local_search_cover(graph: Dict[int, Set[int]], vertices: List[int], cover: Set[int],
+                       deadline: float, lower_bound: int = 0, seed: int = 0) -> Set[int]:
+    """
+    Shrink a vertex cover by FastVC-style local search until a deadline.
+    
+    Whenever the current set is a cover it is recorded and a vertex is
+    dropped to look for a cover one smaller. Otherwise one step swaps two
+    vertices: a cover vertex with the smallest loss leaves (chosen among
+    LOCAL_SEARCH_SAMPLES random cover vertices), then the endpoint of a
+    random uncovered edge with the larger gain enters; ties go to the vertex
+    that changed longest ago. Loss (edges only that vertex covers) and gain
+    (uncovered edges it would cover) are maintained incrementally as one
+    score, dscore. Building the edge index is O(n + m) and also stops at
+    the deadline, returning the initial cover.
+    
+    Args:
+        graph: Adjacency list representation of the graph
+        vertices: List of all vertices in the graph
+        cover: Initial vertex cover
+        deadline: time.perf_counter() value to stop at
+        lower_bound: Stop early when a cover of this size is found
+        seed: Seed for the random choices
+        
+    Returns:
+        The smallest vertex cover found
+    """
+    rng = random.Random(seed)
+    n = len(vertices)
+    vertex_to_index = {v: i for i, v in enumerate(vertices)}
+    ends = []
+    incident = [[] for _ in range(n)]
+    for i, v in enumerate(vertices):
+        if not (i + 1) % DEADLINE_CHECK_INTERVAL and time.perf_counter() >= deadline:
+            return set(cover)
+        for w in graph.get(v, ()):
+            j = vertex_to_index.get(w, -1)
+            if j > i:
+                incident[i].append(len(ends) // 2)
+                incident[j].append(len(ends) // 2)
+                ends.extend((i, j))
+    m = len(ends) // 2
+    
+    in_cover = bytearray(n)
+    cover_list = []
+    cover_position = [-1] * n
+    for v in cover:
+        i = vertex_to_index[v]
+        in_cover[i] = 1
+        cover_position[i] = len(cover_list)
+        cover_list.append(i)
+    
+    # dscore: for a cover vertex minus the number of edges only it covers,
+    # otherwise the number of uncovered edges it would cover
+    dscore = [0] * n
+    uncovered = []
+    uncovered_position = [-1] * m
+    for e in range(m):
+        a, b = ends[2 * e], ends[2 * e + 1]
+        if in_cover[a] and not in_cover[b]:
+            dscore[a] -= 1
+        elif in_cover[b] and not in_cover[a]:
+            dscore[b] -= 1
+        elif not in_cover[a]:
+            dscore[a] += 1
+            dscore[b] += 1
+            uncovered_position[e] = len(uncovered)
+            uncovered.append(e)
+    age = [0] * n
+    
+    def add(i):
+        in_cover[i] = 1
+        cover_position[i] = len(cover_list)
+        cover_list.append(i)
+        dscore[i] = -dscore[i]
+        for e in incident[i]:
+            j = ends[2 * e] + ends[2 * e + 1] - i
+            if in_cover[j]:
+                dscore[j] += 1
+            else:
+                dscore[j] -= 1
+                last = uncovered.pop()
+                if last != e:
+                    uncovered[uncovered_position[e]] = last
+                    uncovered_position[last] = uncovered_position[e]
+                uncovered_position[e] = -1
+    
+    def remove(i):
+        in_cover[i] = 0
+        last = cover_list.pop()
+        if last != i:
+            cover_list[cover_position[i]] = last
+            cover_position[last] = cover_position[i]
+        cover_position[i] = -1
+        dscore[i] = -dscore[i]
+        for e in incident[i]:
+            j = ends[2 * e] + ends[2 * e + 1] - i
+            if in_cover[j]:
+                dscore[j] -= 1
+            else:
+                dscore[j] += 1
+                uncovered_position[e] = len(uncovered)
+                uncovered.append(e)
+    
+    def least_loss(exclude):
+        if len(cover_list) <= LOCAL_SEARCH_SAMPLES:
+            candidates = cover_list
+        else:
+            candidates = [rng.choice(cover_list) for _ in range(LOCAL_SEARCH_SAMPLES)]
+        best = -1
+        for i in candidates:
+            if i != exclude and (best == -1 or dscore[i] > dscore[best]
+                                 or (dscore[i] == dscore[best] and age[i] < age[best])):
+                best = i
+        return best
+    
+    best_cover = set(cover)
+    step = 0
+    added = -1
+    while cover_list and time.perf_counter() < deadline:
+        step += 1
+        if not uncovered:
+            best_cover = {vertices[i] for i in cover_list}
+            if len(best_cover) <= lower_bound:
+                break
+            i = least_loss(-1)
+            remove(i)
+            age[i] = step
+            continue
+        
+        i = least_loss(added)
+        if i == -1:
+            break
+        remove(i)
+        age[i] = step
+        
+        e = uncovered[rng.randrange(len(uncovered))]
+        a, b = ends[2 * e], ends[2 * e + 1]
+        if dscore[b] > dscore[a] or (dscore[b] == dscore[a] and age[b] < age[a]):
+            a = b
+        add(a)
+        age[a] = step
+        added = a
+    return best_cover
+
+
+def solve_anytime(graph: Dict[int, Set[int]], vertices: List[int], time_limit: float,
+                  seed: int = 0) -> Tuple[int, Set[int], int]:
+    """
+    Compute the best vertex cover found within a time budget, with a lower bound.
+    
+    Runs in four stages, each improving on the last:
+    1. The endpoints of a maximal matching (a 2-approximation) are the
+       first cover, and the matching size is the lower bound. This O(n + m)
+       pass is the only work not bounded by the deadline.
+    2. A greedy cover (greedy_cover) of the whole graph is built and the
+       graph is split into components, both stopping at the deadline. Each
+       component keeps the smaller of its greedy and matching covers; on a
+       tree the greedy cover is optimal, which solves the component.
+    3. Local search (local_search_cover) shrinks the unsolved components
+       until ANYTIME_SEARCH_SHARE of the budget is used, split by component
+       size. Remaining components, smallest first, are then kernelized and,
+       if the kernel has at most ANYTIME_EXACT_MAX_VERTICES vertices, solved
+       exactly by the bnb engine until the deadline; each success replaces
+       both the component's cover and its lower bound by the optimum.
+    4. Any time left goes back to local search on the unsolved components.
+    
+    Args:
+        graph: Adjacency list representation of the graph
+        vertices: List of all vertices in the graph
+        time_limit: Budget in seconds
+        seed: Seed for the local search
+        
+    Returns:
+        A tuple (cover_size, cover_set, lower_bound); the cover is optimal
+        when cover_size == lower_bound
+    """
+    start = time.perf_counter()
+    deadline = start + time_limit
+    
+    matching = maximal_matching(graph)
+    matched = {u for edge in matching for u in edge}
+    best = matched
+    try:
+        if time.perf_counter() >= deadline:
+            raise TimeoutError("the matching used up the time limit")
+        greedy = greedy_cover(graph, vertices, deadline)
+        if len(greedy) < len(best):
+            best = greedy
+        components = connected_components(graph, vertices, deadline)
+    except TimeoutError:
+        return (len(best), best, len(matching))
+    
+    # Each part is [component, cover, lower bound, solved exactly]; every
+    # matching edge lies within one component
+    parts = []
+    for component in sorted(components, key=len):
+        cover = {u for u in component if u in matched}
+        bound = len(cover) // 2
+        greedy_part = {u for u in component if u in greedy}
+        if sum(1 for u in component for w in graph[u] if u < w) == len(component) - 1:
+            parts.append([component, greedy_part, len(greedy_part), True])
+        else:
+            parts.append([component, min(cover, greedy_part, key=len), bound, False])
+    
+    def search(search_deadline):
+        # Local search, each component getting a share of the time proportional to its size
+        open_parts = [part for part in parts if not part[3] and len(part[1]) > part[2]]
+        remaining = sum(len(part[0]) for part in open_parts)
+        for part in open_parts:
+            now = time.perf_counter()
+            if now >= search_deadline:
+                break
+            part_deadline = now + (search_deadline - now) * len(part[0]) / remaining
+            remaining -= len(part[0])
+            part[1] = local_search_cover(graph, part[0], part[1], part_deadline, part[2], seed)
+    
+    search(start + ANYTIME_SEARCH_SHARE * time_limit)
+    
+    # Exact refinement until the deadline
+    for part in parts:
+        if len(part[1]) == part[2]:
+            part[3] = True
+        if part[3] or time.perf_counter() >= deadline:
+            continue
+        try:
+            kernel, kernel_vertices, forced, folds = kernelize(graph, part[0], deadline)
+            if len(kernel_vertices) > ANYTIME_EXACT_MAX_VERTICES:
+                continue
+            kernel_size, kernel_cover = solve_by_components(kernel, kernel_vertices, "bnb", deadline=deadline)
+        except TimeoutError:
+            break
+        part[1] = unfold_cover(kernel_cover, forced, folds)
+        part[2] = kernel_size + len(forced) + len(folds)
+        part[3] = True
+    
+    search(deadline)
+    
+    cover_set = set()
+    lower_bound = 0
+    for _, cover, bound, _ in parts:
+        cover_set |= cover
+        lower_bound += bound
+    return (len(cover_set), cover_set, lower_bound)
+
+
+def parse_graph(lines: Iterable[str]) -> Tuple[Dict[int, Set[int]], List[int]]:
+    """
+    Parse a graph in the input file format.
+    
+    A self-loop "u u" adds u as a vertex but no edge: like the baseline
+    DP, which only looks at edges u < v, the solvers ignore it.
+    
+    Args:
+        lines: Lines of the input file (blank lines are ignored)
+        
+    Returns:
+        A tuple (graph, vertices) where graph is an adjacency list and
+        vertices is a list of all vertex labels
+    """
+    graph: Dict[int, Set[int]] = {}
+    vertices_set = set()
+    
+    lines = [line.strip() for line in lines if line.strip()]
+    if not lines:
+        return (graph, [])
+    
+    # First line: number of vertices (optional, we'll infer from edges)
+    n = int(lines[0]) if lines[0].isdigit() else None
+    
+    # If n is specified, initialize vertices 0 to n-1
+    if n is not None:
+        vertices_set = set(range(n))
+        start_idx = 1
+    else:
+        vertices_set = set()
+        start_idx = 0
+    
+    # Read edges
+    for line in lines[start_idx:]:
+        parts = line.split()
+        if len(parts) >= 2:
+            u = int(parts[0])
+            v = int(parts[1])
+            vertices_set.add(u)
+            vertices_set.add(v)
+            if u == v:
+                continue
+            
+            if u not in graph:
+                graph[u] = set()
+            if v not in graph:
+                graph[v] = set()
+            
+            graph[u].add(v)
+            graph[v].add(u)
+    
+    vertices = sorted(list(vertices_set))
+    return (graph, vertices)
+
+
+def load_graph(filename: str) -> Tuple[Dict[int, Set[int]], List[int]]:
+    """
+    Load graph from file.
+    
+    File format:
+    First line: number of vertices n
+    Next lines: edges as "u v" (one per line)
+    
+    Binary graph files (see load_graph_binary) are accepted as well and
+    converted to the same adjacency list.
+    
+    Args:
+        filename: Path to the input file
+        
+    Returns:
+        A tuple (graph, vertices) where graph is an adjacency list and
+        vertices is a list of all vertex labels
+    """
+    if is_binary_file(filename, GRAPH_MAGIC):
+        vertices, offsets, neighbors = load_graph_binary(filename)
+        graph = {vertices[i]: {vertices[j] for j in neighbors[offsets[i]:offsets[i + 1]] if j != i}
+                 for i in range(len(vertices)) if offsets[i + 1] > offsets[i]}
+        return (graph, list(vertices))
+    with open(filename, 'r') as f:
+        return parse_graph(f)
+
+
+# Bytes read per chunk by the streaming CSR loader
+CSR_CHUNK_SIZE = 1 << 24
+
+
+# Characters of the vertex labels, deleted by parse_edge_chunk to check the line layout
+EDGE_DIGITS = b"0123456789+-"
+
+
+def parse_edge_chunk(chunk: bytes, ends: array):
+    """
+    Append the endpoints of the "u v" lines in a chunk to a flat array.
+    
+    The common case, where every line is exactly "u v" with one space, is
+    parsed in bulk. It is detected by deleting the digits and signs: what
+    remains must be one space and one newline per line, and the chunk must
+    hold two tokens per line. Any other chunk (blank lines, extra tokens,
+    tabs or CRLF) is parsed line by line with the same rules as parse_graph.
+    
+    Args:
+        chunk: Whole lines of the input file
+        ends: Flat endpoint array u0, v0, u1, v1, ... to extend
+    """
+    tokens = chunk.split()
+    lines = chunk.count(b"\n")
+    layout = b" \n" * lines
+    if not chunk.endswith(b"\n"):
+        lines += 1
+        layout += b" "
+    if len(tokens) == 2 * lines and chunk.translate(None, EDGE_DIGITS) == layout:
+        ends.extend(map(int, tokens))
+        return
+    for line in chunk.splitlines():
+        parts = line.split()
+        if len(parts) >= 2:
+            ends.append(int(parts[0]))
+            ends.append(int(parts[1]))
+
+
+def build_csr(n: int, ends: array) -> Tuple[array, array]:
+    """
+    Build a compressed sparse row adjacency from a flat endpoint array.
+    
+    Neighbors of vertex i are neighbors[offsets[i]:offsets[i + 1]], sorted
+    and without duplicates (repeated edges in the input are merged and
+    self-loops dropped, as in parse_graph). Uses numpy's sort when available and a counting sort
+    otherwise.
+    
+    Args:
+        n: Number of vertices (indices 0 to n-1)
+        ends: Flat endpoint array u0, v0, u1, v1, ... of vertex indices
+        
+    Returns:
+        A tuple (offsets, neighbors) of typed arrays
+    """
+    if np is not None and ends:
+        # Sort and deduplicate all (source, target) pairs as single integer keys
+        pairs = np.frombuffer(ends, dtype=np.int64).reshape(-1, 2)
+        pairs = pairs[pairs[:, 0] != pairs[:, 1]]
+        keys = np.concatenate((pairs[:, 0] * n + pairs[:, 1], pairs[:, 1] * n + pairs[:, 0]))
+        keys.sort()
+        keep = np.ones(len(keys), dtype=bool)
+        keep[1:] = keys[1:] != keys[:-1]
+        keys = keys[keep]
+        counts = np.bincount(keys // n, minlength=n)
+        offsets = array('q', bytes(8))
+        offsets.frombytes(np.cumsum(counts, dtype=np.int64).tobytes())
+        neighbors = array('i', (keys % n).astype(np.int32).tobytes())
+        return (offsets, neighbors)
+    
+    offsets = array('q', bytes(8 * (n + 1)))
+    for k in range(0, len(ends), 2):
+        if ends[k] != ends[k + 1]:
+            offsets[ends[k] + 1] += 1
+            offsets[ends[k + 1] + 1] += 1
+    for i in range(n):
+        offsets[i + 1] += offsets[i]
+    
+    # Scatter both directions of every edge, then sort each row
+    fill = array('q', offsets)
+    neighbors = array('i', bytes(4 * offsets[n]))
+    for k in range(0, len(ends), 2):
+        u = ends[k]
+        v = ends[k + 1]
+        if u == v:
+            continue
+        neighbors[fill[u]] = v
+        fill[u] += 1
+        neighbors[fill[v]] = u
+        fill[v] += 1
+    
+    # Sort rows and squeeze out duplicate edges in place
+    write = 0
+    start = 0
+    for i in range(n):
+        end = offsets[i + 1]
+        row = sorted(set(neighbors[start:end])) if end - start > 1 else neighbors[start:end]
+        neighbors[write:write + len(row)] = array('i', row)
+        offsets[i] = write
+        write += len(row)
+        start = end
+    offsets[n] = write
+    del neighbors[write:]
+    return (offsets, neighbors)
+
+
+def load_graph_csr(filename: str) -> Tuple[List[int], array, array]:
+    """
+    Load a graph file into a compact CSR adjacency without dict-of-sets.
+    
+    The file is streamed in CSR_CHUNK_SIZE chunks and the endpoints are kept
+    in typed arrays, so memory is a few bytes per edge instead of several
+    Python objects. The format and rules are those of load_graph. When the
+    labels are 0 to n-1 they are used as indices directly; other labels are
+    mapped to indices in sorted order.
+    
+    Args:
+        filename: Path to the input file
+        
+    Returns:
+        A tuple (vertices, offsets, neighbors) where vertices maps indices to
+        labels and the neighbors of index i are neighbors[offsets[i]:offsets[i + 1]]
+    """
+    ends = array('q')
+    n = 0
+    with open(filename, 'rb') as f:
+        first = f.readline()
+        while first and not first.strip():
+            first = f.readline()
+        if first.strip().isdigit():
+            n = int(first)
+        else:
+            parse_edge_chunk(first, ends)
+        
+        leftover = b""
+        while True:
+            chunk = f.read(CSR_CHUNK_SIZE)
+            if not chunk:
+                break
+            chunk = leftover + chunk
+            cut = chunk.rfind(b"\n") + 1
+            leftover = chunk[cut:]
+            if cut:
+                parse_edge_chunk(chunk[:cut], ends)
+        if leftover:
+            parse_edge_chunk(leftover, ends)
+    
+    if ends and (min(ends) < 0 or max(ends) >= n):
+        vertices = sorted(set(ends) | set(range(n)))
+        index = {v: i for i, v in enumerate(vertices)}
+        ends = array('q', [index[x] for x in ends])
+    else:
+        vertices = range(n)
+    
+    offsets, neighbors = build_csr(len(vertices), ends)
+    return (vertices, offsets, neighbors)
+
+
+def minimum_vertex_cover_tree_csr(offsets: array, neighbors: array, vertices: List[int]) -> Tuple[int, Set[int]]:
+    """
+    Compute minimum vertex cover of a forest stored as CSR.
+    
+    Same DP and tie-breaking as minimum_vertex_cover_tree, reading
+    neighbors straight from the CSR arrays.
+    
+    Args:
+        offsets: CSR row offsets (length n + 1)
+        neighbors: CSR neighbor indices
+        vertices: Labels of the n vertices
+        
+    Returns:
+        A tuple (min_cover_size, min_cover_set) where min_cover_set is the
+        actual minimum vertex cover
+        
+    Raises:
+        ValueError: If the graph contains a cycle
+    """
+    n = len(offsets) - 1
+    parent = array('i', [-1]) * n
+    visited = bytearray(n)
+    order = array('i')
+    
+    # BFS order of every tree; parents always come before their children
+    for root in range(n):
+        if visited[root]:
+            continue
+        visited[root] = 1
+        order.append(root)
+        head = len(order) - 1
+        while head < len(order):
+            u = order[head]
+            head += 1
+            parent_u = parent[u]
+            for v in neighbors[offsets[u]:offsets[u + 1]]:
+                if v == parent_u:
+                    continue
+                if visited[v]:
+                    raise ValueError("Graph contains a cycle; the tree DP only applies to forests")
+                visited[v] = 1
+                parent[v] = u
+                order.append(v)
+    
+    # Bottom-up: fold each node into its parent
+    dp0 = array('i', [0]) * n
+    dp1 = array('i', [1]) * n
+    for u in reversed(order):
+        p = parent[u]
+        if p != -1:
+            excluded = dp0[u]
+            included = dp1[u]
+            dp0[p] += included
+            dp1[p] += excluded if excluded < included else included
+    
+    # Top-down: a node may be left out only if its parent is in the cover
+    min_size = 0
+    in_cover = bytearray(n)
+    for u in order:
+        p = parent[u]
+        if p == -1 or in_cover[p]:
+            excluded = dp0[u]
+            included = dp1[u]
+            if included <= excluded:
+                in_cover[u] = 1
+            if p == -1:
+                min_size += excluded if excluded < included else included
+        else:
+            in_cover[u] = 1
+    
+    record_table_size(n, 4 * parent.itemsize * n + 2 * n)
+    PROFILE_COUNTERS["masks_evaluated"] += n
+    cover_set = {vertices[i] for i in range(n) if in_cover[i]}
+    return (min_size, cover_set)
+
+
+def solve_csr(vertices: List[int], offsets: array, neighbors: array, engine: str = "array",
+              use_kernel: bool = True, **engine_options) -> Tuple[int, Set[int]]:
+    """
+    Compute minimum vertex cover of a CSR graph.
+    
+    A forest goes straight to minimum_vertex_cover_tree_csr without building
+    any dicts. Otherwise components are found on the CSR arrays, each cyclic
+    component is copied into an adjacency dict and solved with solve_graph
+    (kernel and engine), and the acyclic remainder is solved on CSR.
+    
+    Args:
+        vertices: Labels of the n vertices
+        offsets: CSR row offsets (length n + 1)
+        neighbors: CSR neighbor indices
+        engine: Name of the engine in ENGINES for cyclic components
+        use_kernel: Whether to apply the reduction rules to cyclic components
+        **engine_options: Extra keyword arguments for the engine
+        
+    Returns:
+        A tuple (min_cover_size, min_cover_set) where min_cover_set is the
+        actual minimum vertex cover
+    """
+    # Forest inputs need no component pass: the tree DP rejects any cycle
+    try:
+        return minimum_vertex_cover_tree_csr(offsets, neighbors, vertices)
+    except ValueError:
+        pass
+    
+    n = len(offsets) - 1
+    component_of = array('i', [-1]) * n
+    cyclic = []
+    stack = array('i')
+    for start in range(n):
+        if component_of[start] != -1:
+            continue
+        component_id = len(cyclic)
+        component_of[start] = component_id
+        stack.append(start)
+        size = 0
+        degree_sum = 0
+        while stack:
+            u = stack.pop()
+            size += 1
+            degree_sum += offsets[u + 1] - offsets[u]
+            for v in neighbors[offsets[u]:offsets[u + 1]]:
+                if component_of[v] == -1:
+                    component_of[v] = component_id
+                    stack.append(v)
+        cyclic.append(degree_sum // 2 != size - 1)
+    
+    # Solve cyclic components through the dict pipeline and keep the forest on CSR
+    members = {}
+    for i in range(n):
+        if cyclic[component_of[i]]:
+            members.setdefault(component_of[i], []).append(i)
+    min_size = 0
+    cover_set = set()
+    for component in members.values():
+        graph = {vertices[i]: {vertices[j] for j in neighbors[offsets[i]:offsets[i + 1]] if j != i}
+                 for i in component}
+        size, cover, _ = solve_graph(graph, [vertices[i] for i in component], engine, use_kernel, **engine_options)
+        min_size += size
+        cover_set |= cover
+    
+    forest = [i for i in range(n) if not cyclic[component_of[i]]]
+    index = {i: k for k, i in enumerate(forest)}
+    ends = array('q')
+    for i in forest:
+        for j in neighbors[offsets[i]:offsets[i + 1]]:
+            if i < j:
+                ends.append(index[i])
+                ends.append(index[j])
+    forest_offsets, forest_neighbors = build_csr(len(forest), ends)
+    size, cover = minimum_vertex_cover_tree_csr(forest_offsets, forest_neighbors, [vertices[i] for i in forest])
+    return (min_size + size, cover_set | cover)
+
+
+# Binary formats: a little-endian header (magic, flags, n, m or cover size)
+# followed by packed arrays; files named *.bin are read and written in them
+BINARY_HEADER = struct.Struct("<4sIqq")
+BINARY_SUFFIX = ".bin"
+GRAPH_MAGIC = b"VCG1"
+COVER_MAGIC = b"VCC1"
+GRAPH_LABELS = 1  # an int64 label per vertex follows the CSR arrays
+COVER_BITMAP = 1  # the cover is a bitmap over labels 0..n-1 instead of packed int64 labels
+
+
+def is_binary_file(filename: str, magic: bytes) -> bool:
+    """
+    Check whether a file starts with the given binary format magic.
+    
+    Args:
+        filename: Path to the file
+        magic: GRAPH_MAGIC or COVER_MAGIC
+        
+    Returns:
+        True if the file is in that binary format
+    """
+    with open(filename, 'rb') as f:
+        return f.read(len(magic)) == magic
+
+
+def load_graph_binary(filename: str):
+    """
+    Memory-map a binary graph file without copying or parsing it.
+    
+    Layout after the header (GRAPH_MAGIC, flags, n, m): int64 offsets[n + 1],
+    int32 neighbors[2m] (the CSR of load_graph_csr) and, with the
+    GRAPH_LABELS flag, int64 labels[n]; without it the labels are 0 to n-1.
+    The returned arrays are memoryviews into the mapping, so loading costs
+    no time or memory proportional to the graph until the data is used.
+    
+    Args:
+        filename: Path to the binary graph file
+        
+    Returns:
+        A tuple (vertices, offsets, neighbors) as returned by load_graph_csr
+        
+    Raises:
+        ValueError: If the file is not a binary graph file
+    """
+    with open(filename, 'rb') as f:
+        mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    magic, flags, n, m = BINARY_HEADER.unpack_from(mapping, 0)
+    if magic != GRAPH_MAGIC:
+        raise ValueError(f"{filename} is not a binary graph file")
+    
+    view = memoryview(mapping)
+    start = BINARY_HEADER.size
+    offsets = view[start:start + 8 * (n + 1)].cast('q')
+    start += 8 * (n + 1)
+    neighbors = view[start:start + 8 * m].cast('i')
+    start += 8 * m
+    vertices = view[start:start + 8 * n].cast('q') if flags & GRAPH_LABELS else range(n)
+    return (vertices, offsets, neighbors)
+
+
+def save_output_binary(filename: str, min_size: int, cover_set: Set[int]):
+    """
+    Save a cover in the binary format.
+    
+    The cover is stored as a bitmap over labels 0..max when that is smaller
+    than packed sorted int64 labels (dense covers of 0..n-1 labeled graphs),
+    and as the packed labels otherwise.
+    
+    Args:
+        filename: Path to the output file
+        min_size: Minimum vertex cover size
+        cover_set: Set of vertices in the minimum cover
+    """
+    cover = sorted(cover_set)
+    with open(filename, 'wb') as f:
+        if cover and cover[0] >= 0 and (cover[-1] + 8) // 8 < 8 * len(cover):
+            n = cover[-1] + 1
+            bitmap = bytearray((n + 7) // 8)
+            for v in cover:
+                bitmap[v >> 3] |= 1 << (v & 7)
+            f.write(BINARY_HEADER.pack(COVER_MAGIC, COVER_BITMAP, min_size, n))
+            f.write(bitmap)
+        else:
+            f.write(BINARY_HEADER.pack(COVER_MAGIC, 0, min_size, len(cover)))
+            f.write(array('q', cover).tobytes())
+
+
+def load_output(filename: str) -> Tuple[int, List[int]]:
+    """
+    Load an output file written by save_output, in text or binary format.
+    
+    Args:
+        filename: Path to the output file
+        
+    Returns:
+        A tuple (min_cover_size, sorted cover vertices)
+    """
+    if not is_binary_file(filename, COVER_MAGIC):
+        with open(filename, 'r') as f:
+            values = [int(line) for line in f if line.strip()]
+        return (values[0], values[1:])
+    
+    with open(filename, 'rb') as f:
+        data = f.read()
+    _, flags, min_size, count = BINARY_HEADER.unpack_from(data, 0)
+    payload = data[BINARY_HEADER.size:]
+    if flags & COVER_BITMAP:
+        return (min_size, [v for v in range(count) if payload[v >> 3] >> (v & 7) & 1])
+    return (min_size, array('q', payload[:8 * count]).tolist())
+
+
+def save_output(filename: str, min_size: int, cover_set: Set[int]):
+    """
+    Save the output to a file.
+    
+    File format:
+    First line: minimum cover size
+    Next lines: vertices in the cover (one per line, sorted)
+    
+    Files named *.bin are written with save_output_binary instead.
+    
+    Args:
+        filename: Path to the output file
+        min_size: Minimum vertex cover size
+        cover_set: Set of vertices in the minimum cover
+    """
+    if filename.endswith(BINARY_SUFFIX):
+        save_output_binary(filename, min_size, cover_set)
+        return
+    with open(filename, 'w') as f:
+        f.write(f"{min_size}\n")
+        f.writelines(f"{vertex}\n" for vertex in sorted(cover_set))
+
+
+def batch_output_name(input_file: str) -> str:
+    """
+    Derive the output file name for a batch input.
+    
+    Follows the naming of the tests and benchmarks directories, where
+    instance_XX.txt is answered by output_XX.txt; other files get an
+    "_output" suffix.
+    
+    Args:
+        input_file: Path to the input graph file
+        
+    Returns:
+        The base name of the output file
+    """
+    name = os.path.basename(input_file)
+    if name.startswith("instance"):
+        return "output" + name[len("instance"):]
+    stem, ext = os.path.splitext(name)
+    return f"{stem}_output{ext}"
+
+
+def resolve_batch_inputs(spec: str, output_dir: str) -> List[Tuple[str, str]]:
+    """
+    Expand a batch specification into (input_file, output_file) pairs.
+    
+    The specification is one of:
+    - a directory: its instance_* files, or every file if there are none
+    - a glob pattern such as "benchmarks/size_*/instance_*.txt"
+    - a manifest file: one "input_file [output_file]" pair per line; blank
+      lines and lines starting with "#" are ignored
+      
+    Outputs without an explicit path are written under output_dir, mirroring
+    the inputs' directories relative to their common parent so that inputs
+    with the same name in different directories do not collide.
+    
+    Args:
+        spec: Directory, glob pattern or manifest file
+        output_dir: Directory for outputs not named in a manifest
+        
+    Returns:
+        A list of (input_file, output_file) pairs in a stable order
+    """
+    pairs = []
+    if os.path.isdir(spec):
+        names = sorted(name for name in os.listdir(spec) if os.path.isfile(os.path.join(spec, name)))
+        instances = [name for name in names if name.startswith("instance")]
+        inputs = [os.path.join(spec, name) for name in (instances or names)]
+    elif glob.has_magic(spec):
+        inputs = sorted(path for path in glob.glob(spec) if os.path.isfile(path))
+    else:
+        inputs = []
+        base = os.path.dirname(spec)
+        with open(spec, "r") as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                parts = line.split()
+                input_file = os.path.join(base, parts[0])
+                if len(parts) >= 2:
+                    pairs.append((input_file, os.path.join(base, parts[1])))
+                else:
+                    inputs.append(input_file)
+    
+    if inputs:
+        root = os.path.commonpath([os.path.dirname(os.path.abspath(path)) for path in inputs])
+        for input_file in inputs:
+            subdir = os.path.relpath(os.path.dirname(os.path.abspath(input_file)), root)
+            pairs.append((input_file, os.path.normpath(os.path.join(output_dir, subdir, batch_output_name(input_file)))))
+    return pairs
+
+
+def solve_batch_instance(task: Tuple[str, str, str, bool, dict]) -> dict:
+    """
+    Solve one batch instance and time each phase.
+    
+    Errors are reported in the returned record instead of raised, so one bad
+    input does not stop the rest of the batch.
+    
+    Args:
+        task: A tuple (input_file, output_file, engine, use_kernel, engine_options)
+        
+    Returns:
+        A record with the input and output paths, status ("ok" or "error"),
+        cover size, vertex and kernel counts, per-phase {"cpu", "wall"} times
+        in seconds, the decomposition width with the treewidth engine and,
+        with the result cache enabled, its counters
+    """
+    input_file, output_file, engine, use_kernel, engine_options = task
+    record = {"input": input_file, "output": output_file, "status": "ok", "phases": {}}
+    cache_start = dict(CACHE_STATS)
+    reset_engine_stats()
+    cpu_start, wall_start = time.process_time(), time.perf_counter()
+    
+    def finish(phase):
+        nonlocal cpu_start, wall_start
+        cpu_end, wall_end = time.process_time(), time.perf_counter()
+        record["phases"][phase] = {"cpu": cpu_end - cpu_start, "wall": wall_end - wall_start}
+        cpu_start, wall_start = cpu_end, wall_end
+    
+    try:
+        graph, vertices = load_graph(input_file)
+        if not vertices:
+            raise ValueError("No vertices in graph")
+        finish("load")
+        
+        if use_kernel:
+            kernel, kernel_vertices, forced, folds = kernelize(graph, vertices)
+        else:
+            kernel, kernel_vertices, forced, folds = graph, vertices, set(), []
+        finish("kernelize")
+        
+        kernel_size, kernel_cover = solve_by_components(kernel, kernel_vertices, engine, **engine_options)
+        min_size = kernel_size + len(forced) + len(folds)
+        cover_set = unfold_cover(kernel_cover, forced, folds)
+        finish("solve")
+        
+        os.makedirs(os.path.dirname(output_file) or ".", exist_ok=True)
+        save_output(output_file, min_size, cover_set)
+        finish("save")
+    except (OSError, ValueError) as e:
+        record["status"] = "error"
+        record["error"] = str(e)
+        return record
+    
+    record["min_size"] = min_size
+    record["vertices"] = len(vertices)
+    record["kernel_vertices"] = len(kernel_vertices)
+    record["cpu"] = sum(phase["cpu"] for phase in record["phases"].values())
+    record["wall"] = sum(phase["wall"] for phase in record["phases"].values())
+    if engine == "treewidth":
+        record["width"] = TREEWIDTH_STATS["width"]
+    if CACHE_SETTINGS["memory_entries"]:
+        record["cache"] = {key: CACHE_STATS[key] - cache_start[key] for key in CACHE_STATS}
+    return record
+
+
+def solve_batch(pairs: List[Tuple[str, str]], engine: str = "array", use_kernel: bool = True,
+                jobs: int = 1, **engine_options):
+    """
+    Solve many instances in this process or across a worker pool.
+    
+    Records are yielded as soon as each instance finishes (in completion
+    order when jobs > 1), and each output file is written by then, so callers
+    can stream results without waiting for the whole batch.
+    
+    Args:
+        pairs: (input_file, output_file) pairs, e.g. from resolve_batch_inputs
+        engine: Name of the engine in ENGINES
+        use_kernel: Whether to apply the reduction rules first
+        jobs: Number of worker processes (1 solves everything in this process)
+        **engine_options: Extra keyword arguments for the engine
+        
+    Yields:
+        One record per instance as returned by solve_batch_instance
+    """
+    tasks = [(input_file, output_file, engine, use_kernel, engine_options) for input_file, output_file in pairs]
+    if jobs <= 1 or len(tasks) <= 1:
+        for task in tasks:
+            yield solve_batch_instance(task)
+        return
+    
+    with Pool(processes=jobs) as pool:
+        for record in pool.imap_unordered(solve_batch_instance, tasks):
+            yield record
+
+
+def run_batch(spec: str, output_dir: str, summary_file: str, engine: str = "array",
+              use_kernel: bool = True, jobs: int = 1, **engine_options) -> int:
+    """
+    Solve every instance of a batch specification and write a summary file.
+    
+    Prints one line per instance as it finishes. The summary is a JSON file
+    with the batch settings, totals (including result cache counters when
+    the cache is enabled) and the per-instance records in input order.
+    
+    Args:
+        spec: Directory, glob pattern or manifest file (see resolve_batch_inputs)
+        output_dir: Directory for the output files
+        summary_file: Path to the JSON summary file
+        engine: Name of the engine in ENGINES
+        use_kernel: Whether to apply the reduction rules first
+        jobs: Number of worker processes
+        **engine_options: Extra keyword arguments for the engine
+        
+    Returns:
+        The number of instances that failed
+    """
+    pairs = resolve_batch_inputs(spec, output_dir)
+    if not pairs:
+        print(f"Error: No input files match {spec}")
+        return 1
+    
+    records = {}
+    wall_start = time.perf_counter()
+    for record in solve_batch(pairs, engine, use_kernel, jobs, **engine_options):
+        records[record["input"]] = record
+        if record["status"] == "ok":
+            print(f"{record['input']}: size {record['min_size']} ({record['wall']:.4f}s)", flush=True)
+        else:
+            print(f"{record['input']}: error: {record['error']}", flush=True)
+    wall = time.perf_counter() - wall_start
+    
+    ordered = [records[input_file] for input_file, _ in pairs]
+    failures = sum(1 for record in ordered if record["status"] != "ok")
+    summary = {
+        "engine": engine,
+        "kernel": use_kernel,
+        "jobs": jobs,
+        "count": len(ordered),
+        "failures": failures,
+        "wall": wall,
+        "cpu": sum(record.get("cpu", 0.0) for record in ordered),
+        "instances": ordered,
+    }
+    if CACHE_SETTINGS["memory_entries"]:
+        summary["cache"] = {key: sum(record.get("cache", {}).get(key, 0) for record in ordered)
+                            for key in CACHE_STATS}
+    os.makedirs(os.path.dirname(summary_file) or ".", exist_ok=True)
+    with open(summary_file, "w") as f:
+        json.dump(summary, f, indent=2)
+    
+    print(f"Solved {len(ordered) - failures} of {len(ordered)} instances in {wall:.2f}s")
+    if "cache" in summary:
+        print(format_cache_stats(summary["cache"]))
+    print(f"Summary saved to {summary_file}")
+    return failures
+
+
+# Line that ends a graph in the server protocol
+SERVER_END = "END"
+
+
+def solve_request(task: Tuple[List[str], str, bool, float, dict]) -> str:
+    """
+    Solve one server request and format its response line.
+    
+    Args:
+        task: A tuple (lines, engine, use_kernel, time_limit, engine_options)
+            where lines hold a graph in the input file format and time_limit
+            is None or the budget for solve_anytime in seconds
+            
+    Returns:
+        A JSON object {"min_size": k, "cover": [...]} (with a time limit also
+        "lower_bound" and "gap") or {"error": message}
+    """
+    lines, engine, use_kernel, time_limit, engine_options = task
+    reset_engine_stats()
+    try:
+        graph, vertices = parse_graph(lines)
+        if not vertices:
+            raise ValueError("No vertices in graph")
+        if time_limit is not None:
+            min_size, cover_set, lower_bound = solve_anytime(graph, vertices, time_limit)
+            return json.dumps({"min_size": min_size, "cover": sorted(cover_set),
+                               "lower_bound": lower_bound, "gap": min_size - lower_bound})
+        min_size, cover_set, _ = solve_graph(graph, vertices, engine, use_kernel, **engine_options)
+    except ValueError as e:
+        return json.dumps({"error": str(e)})
+    return json.dumps({"min_size": min_size, "cover": sorted(cover_set)})
+
+
+def read_requests(stream):
+    """
+    Split a text stream into server requests.
+    
+    Each request is a graph in the input file format followed by a line
+    containing only END.
+    
+    Args:
+        stream: Readable text stream
+        
+    Yields:
+        The lines of each request
+    """
+    lines = []
+    for line in stream:
+        if line.strip() == SERVER_END:
+            yield lines
+            lines = []
+        else:
+            lines.append(line)
+
+
+def serve_stream(in_stream, out_stream, solve):
+    """
+    Answer every request read from in_stream on out_stream, in order.
+    
+    Args:
+        in_stream: Readable text stream of requests
+        out_stream: Writable text stream for the response lines
+        solve: Function mapping an iterable of requests to response lines
+    """
+    for response in solve(read_requests(in_stream)):
+        out_stream.write(response + "\n")
+        out_stream.flush()
+
+
+def run_server(engine: str = "array", use_kernel: bool = True, jobs: int = 1,
+               socket_path: str = None, time_limit: float = None, **engine_options):
+    """
+    Serve minimum vertex cover requests until interrupted.
+    
+    Requests are read from stdin (answers on stdout) or, with socket_path,
+    from any number of concurrent connections to a Unix socket. The solver
+    modules stay loaded between requests, and with jobs > 1 requests are
+    solved by a pool of worker processes started once up front; responses
+    on each stream keep the request order. On stdin requests are pipelined
+    through the pool with imap. A connection's handler thread instead reads
+    each request itself and submits it on its own, because the pool's single
+    task-feeding thread would otherwise block reading from an idle
+    connection and stall every other client.
+    
+    Args:
+        engine: Name of the engine in ENGINES
+        use_kernel: Whether to apply the reduction rules first
+        jobs: Number of worker processes (1 solves requests in this process)
+        socket_path: Path of the Unix socket to listen on, or None for stdin
+        time_limit: Answer each request with solve_anytime within this many
+            seconds instead of solving it exactly
+        **engine_options: Extra keyword arguments for the engine
+    """
+    pool = Pool(processes=jobs) if jobs > 1 else None
+    
+    def solve(requests):
+        tasks = ((lines, engine, use_kernel, time_limit, engine_options) for lines in requests)
+        return pool.imap(solve_request, tasks) if pool else map(solve_request, tasks)
+    
+    def solve_each(requests):
+        for lines in requests:
+            task = (lines, engine, use_kernel, time_limit, engine_options)
+            yield pool.apply_async(solve_request, (task,)).get() if pool else solve_request(task)
+    
+    class RequestHandler(socketserver.StreamRequestHandler):
+        def handle(self):
+            with self.request.makefile("r") as in_stream, self.request.makefile("w") as out_stream:
+                serve_stream(in_stream, out_stream, solve_each)
+    
+    # Exit cleanly (closing the pool and removing the socket) when terminated
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    try:
+        if socket_path is None:
+            serve_stream(sys.stdin, sys.stdout, solve)
+        else:
+            if os.path.exists(socket_path):
+                os.unlink(socket_path)
+            with socketserver.ThreadingUnixStreamServer(socket_path, RequestHandler) as server:
+                server.daemon_threads = True
+                print(f"Listening on {socket_path}", file=sys.stderr, flush=True)
+                server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if pool is not None:
+            pool.terminate()
+        if socket_path is not None and os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+
+def main():
+    """
+    Main function: reads graph from file, computes minimum vertex cover,
+    and writes results to output file.
+    """
+    parser = argparse.ArgumentParser(description="Minimum vertex cover using dynamic programming")
+    parser.add_argument("input_file", nargs="?",
+                        help="Path to the input graph file (with --batch: a directory, glob or manifest)")
+    parser.add_argument("output_file", nargs="?",
+                        help="Path to the output file (with --batch: the output directory)")
+    parser.add_argument("--engine", choices=sorted(ENGINES), default=None,
+                        help="DP engine to use (default: array; with --time-limit only bnb)")
+    parser.add_argument("--no-kernel", action="store_true",
+                        help="Skip the reduction-rule preprocessing")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Worker processes for the parallel engine (default: number of CPUs)")
+    parser.add_argument("--table-dir", default=".",
+                        help="Directory for the on-disk table of the mmap engine (default: .)")
+    parser.add_argument("--resume", action="store_true",
+                        help="Resume an interrupted mmap run from its last checkpoint")
+    parser.add_argument("--elimination", choices=ELIMINATION_HEURISTICS, default="min-degree",
+                        help="Elimination ordering heuristic of the treewidth engine (default: min-degree)")
+    parser.add_argument("--batch", action="store_true",
+                        help="Solve every instance matched by input_file in one process")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="Worker processes for --batch and --serve (default: 1)")
+    parser.add_argument("--summary", default=None,
+                        help="JSON summary file for --batch (default: <output_dir>/batch_summary.json)")
+    parser.add_argument("--csr", action="store_true",
+                        help="Stream the input into a compact CSR adjacency (for very large sparse graphs)")
+    parser.add_argument("--cache", action="store_true",
+                        help="Reuse results of components seen before (in memory)")
+    parser.add_argument("--cache-dir", default=None,
+                        help="Also keep component results on disk in this directory (implies --cache)")
+    parser.add_argument("--cache-mb", type=int, default=CACHE_DISK_MB,
+                        help=f"Size cap of the on-disk cache in MiB (default: {CACHE_DISK_MB})")
+    parser.add_argument("--cache-max-vertices", type=int, default=CACHE_MAX_VERTICES,
+                        help="Solve larger components without the cache, whose canonical form "
+                             f"is too costly to compute (default: {CACHE_MAX_VERTICES})")
+    parser.add_argument("--max-table-mb", type=int, default=None,
+                        help="Largest in-memory DP table of the array, dict, numpy and parallel engines "
+                             "in MiB; larger components are rejected (default: physical memory)")
+    parser.add_argument("--time-limit", type=float, default=None,
+                        help="Return the best cover found within this many seconds, with a lower "
+                             "bound and the gap, instead of solving exactly")
+    parser.add_argument("--profile", default=None, metavar="FILE",
+                        help="Write per-phase times and hot-path counters as JSON to FILE ('-' for stdout)")
+    parser.add_argument("--serve", action="store_true",
+                        help="Answer requests from stdin (or --socket) until interrupted")
+    parser.add_argument("--socket", default=None,
+                        help="Unix socket path for --serve (default: stdin/stdout)")
+    args = parser.parse_args()
+    if not args.serve and (args.input_file is None or args.output_file is None):
+        parser.error("input_file and output_file are required unless --serve is given")
+    if args.time_limit is not None and args.batch:
+        parser.error("--time-limit cannot be combined with --batch")
+    if args.time_limit is not None and args.engine not in (None, "bnb"):
+        # solve_anytime's exact stage needs an engine that stops at the deadline
+        parser.error("--time-limit solves kernels with the bnb engine and cannot be combined "
+                     f"with --engine {args.engine}")
+    args.engine = args.engine or "array"
+    if args.profile is not None and (args.batch or args.serve):
+        parser.error("--profile applies to a single input file")
+    if args.profile is not None:
+        enable_profiling()
+    
+    engine_options = {}
+    if args.engine == "parallel":
+        engine_options = {"workers": args.workers}
+    elif args.engine == "mmap":
+        engine_options = {"table_dir": args.table_dir, "resume": args.resume}
+    elif args.engine == "treewidth":
+        engine_options = {"heuristic": args.elimination}
+    
+    if args.max_table_mb is not None:
+        configure_table_limit(args.max_table_mb)
+    if args.cache or args.cache_dir is not None:
+        configure_cache(disk_dir=args.cache_dir, disk_mb=args.cache_mb, max_vertices=args.cache_max_vertices)
+    
+    if args.engine == "parallel" and args.jobs > 1:
+        print("Error: the parallel engine cannot run inside --jobs worker processes")
+        sys.exit(1)
+    
+    if args.serve:
+        if args.socket is not None and not hasattr(socketserver, "ThreadingUnixStreamServer"):
+            print("Error: Unix sockets are not available on this platform")
+            sys.exit(1)
+        run_server(args.engine, not args.no_kernel, args.jobs, args.socket, args.time_limit, **engine_options)
+        return
+    
+    if args.batch:
+        summary_file = args.summary or os.path.join(args.output_file, "batch_summary.json")
+        failures = run_batch(args.input_file, args.output_file, summary_file, args.engine,
+                             not args.no_kernel, args.jobs, **engine_options)
+        sys.exit(1 if failures else 0)
+    
+    # Load graph (binary graph files are mapped straight into CSR form)
+    use_csr = args.time_limit is None and (args.csr or is_binary_file(args.input_file, GRAPH_MAGIC))
+    if use_csr:
+        if is_binary_file(args.input_file, GRAPH_MAGIC):
+            vertices, offsets, neighbors = load_graph_binary(args.input_file)
+        else:
+            vertices, offsets, neighbors = load_graph_csr(args.input_file)
+    else:
+        graph, vertices = load_graph(args.input_file)
+    
+    if not vertices:
+        print("Error: No vertices in graph")
+        sys.exit(1)
+    
+    # Shrink the graph with reduction rules, then compute minimum vertex cover
+    try:
+        if args.time_limit is not None:
+            min_size, cover_set, lower_bound = solve_anytime(graph, vertices, args.time_limit)
+        elif use_csr:
+            min_size, cover_set = solve_csr(vertices, offsets, neighbors, args.engine,
+                                            not args.no_kernel, **engine_options)
+        else:
+            min_size, cover_set, kernel_vertex_count = solve_graph(graph, vertices, args.engine,
+                                                                   not args.no_kernel, **engine_options)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    
+    # Save output
+    save_output(args.output_file, min_size, cover_set)
+    
+    if args.profile is not None:
+        record = {"input": args.input_file, "engine": args.engine, "min_size": min_size, **profile_record()}
+        record["cpu"] = sum(phase["cpu"] for name, phase in record["phases"].items() if name in PHASE_TOTALS)
+        record["wall"] = sum(phase["wall"] for name, phase in record["phases"].items() if name in PHASE_TOTALS)
+        if args.profile == "-":
+            print(json.dumps(record))
+        else:
+            with open(args.profile, "w") as f:
+                json.dump(record, f, indent=2)
+    
+    # Print summary
+    if args.time_limit is not None:
+        gap = min_size - lower_bound
+        print(f"Lower bound: {lower_bound}")
+        print(f"Gap: {gap}" + (" (optimal)" if gap == 0 else f" ({100 * gap / min_size:.1f}%)"))
+    elif use_csr:
+        print(f"Graph: {len(vertices)} vertices, {len(neighbors) // 2} edges")
+    else:
+        print(f"Kernel size: {kernel_vertex_count} of {len(vertices)} vertices")
+    if args.engine == "lazy":
+        print(f"States touched: {LAZY_STATS['states_touched']} of {LAZY_STATS['total_states']}")
+    if args.engine == "treewidth" and TREEWIDTH_STATS["width"] >= 0:
+        print(f"Tree decomposition width: {TREEWIDTH_STATS['width']} ({args.elimination})")
+    if CACHE_SETTINGS["memory_entries"]:
+        print(format_cache_stats(CACHE_STATS))
+    if args.time_limit is not None and min_size > lower_bound:
+        print(f"Best vertex cover size: {min_size}")
+    else:
+        print(f"Minimum vertex cover size: {min_size}")
+    print(f"Vertices in cover: {sorted(cover_set)}")
+
+
+if __name__ == "__main__":
+    main()
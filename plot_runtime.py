@@ -1,48 +1,111 @@
 """
-Generate runtime plot from benchmark results.
+Generate runtime and memory plots from benchmark results.
 """
 
+import argparse
 import json
 import matplotlib.pyplot as plt
 import numpy as np
 
 
-def plot_runtime():
+# Axes results can be plotted against; all but n need tier metadata
+X_AXES = {
+    "n": "Input Size (Number of Vertices)",
+    "m": "Number of Edges",
+    "components": "Number of Connected Components",
+    "cyclomatic": "Cyclomatic Number (m - n + components)",
+}
+
+
+def load_results(results_file: str, x: str = "n"):
     """
-    Load benchmark results and create a plot of CPU time vs input size.
+    Load a benchmark results file.
+    
+    Args:
+        results_file: Path to a JSON file written by run_benchmarks.py
+        x: Structural parameter to use as the x value (see X_AXES); results
+            of a large-scale tier take it from their metadata, size-keyed
+            results only support n
+            
+    Returns:
+        A tuple (label, keys, xs, results) where label names the engine (or
+        the file for older results), keys lists the result keys with at least
+        one successful run, xs their x values and results is the parsed JSON
     """
-    # Load results
-    with open("benchmark_results.json", "r") as f:
+    with open(results_file, "r") as f:
         results = json.load(f)
     
-    # Extract data
-    sizes = sorted([int(k) for k in results.keys()])
-    avg_times = [results[str(n)]["average"] for n in sizes]
-    min_times = [results[str(n)]["min"] for n in sizes]
-    max_times = [results[str(n)]["max"] for n in sizes]
+    # Sizes where every instance timed out have no timings
+    keys = [k for k in results.keys() if results[k].get("count")]
+    if all("metadata" in results[k] for k in keys):
+        points = sorted((results[k]["metadata"][x], k) for k in keys)
+    elif x == "n":
+        points = sorted((int(k), k) for k in keys)
+    else:
+        raise ValueError(f"{results_file} has no structural metadata to plot against {x}")
+    xs = [point[0] for point in points]
+    keys = [point[1] for point in points]
+    label = results[keys[0]].get("engine", results_file) if keys else results_file
+    if keys and "tier" in results[keys[0]]:
+        label = f"{label} ({results[keys[0]]['tier']})"
+    return (label, keys, xs, results)
+
+
+def use_log_x(xs: list):
+    """
+    Switch the x axis to log scale when the x values span several decades.
+    
+    Args:
+        xs: Plotted x values
+    """
+    if xs and min(xs) > 0 and max(xs) / min(xs) >= 100:
+        plt.xscale('log')
+
+
+def plot_runtime(results_files=("benchmark_results.json",), x: str = "n"):
+    """
+    Load benchmark results and create a plot of CPU time vs input size.
     
+    Args:
+        results_files: Results files to plot, one series per file (engine)
+        x: Structural parameter for the x axis (see X_AXES)
+    """
     # Create plot
     plt.figure(figsize=(10, 6))
+    all_xs = []
     
-    # Plot average times
-    plt.plot(sizes, avg_times, 'b-o', label='Average CPU Time', linewidth=2, markersize=6)
-    
-    # Plot error bars (min-max range)
-    plt.fill_between(sizes, min_times, max_times, alpha=0.2, color='blue', label='Min-Max Range')
-    
-    # Plot theoretical O(2^n) curve (scaled to fit)
-    # Scale factor to match the data
-    if avg_times:
-        scale_factor = avg_times[-1] / (2 ** sizes[-1])
-        theoretical = [scale_factor * (2 ** n) for n in sizes]
-        plt.plot(sizes, theoretical, 'r--', label='Theoretical O(2^n) (scaled)', linewidth=2)
+    for index, results_file in enumerate(results_files):
+        label, keys, xs, results = load_results(results_file, x)
+        all_xs.extend(xs)
+        
+        # Extract data
+        avg_times = [results[k]["average"] for k in keys]
+        min_times = [results[k]["min"] for k in keys]
+        max_times = [results[k]["max"] for k in keys]
+        
+        # Plot average times
+        prefix = f"{label}: " if len(results_files) > 1 else ""
+        line, = plt.plot(xs, avg_times, '-o', label=f'{prefix}Average CPU Time', linewidth=2, markersize=6)
+        
+        # Plot error bars (min-max range)
+        plt.fill_between(xs, min_times, max_times, alpha=0.2, color=line.get_color(),
+                         label=f'{prefix}Min-Max Range')
+        
+        # Plot theoretical O(2^n) curve (scaled to fit the first series)
+        # Scale factor to match the data; only meaningful for the exponential
+        # subset DP benchmarks, not for the large-scale tiers
+        if index == 0 and avg_times and x == "n" and "metadata" not in results[keys[0]]:
+            scale_factor = avg_times[-1] / (2 ** xs[-1])
+            theoretical = [scale_factor * (2 ** n) for n in xs]
+            plt.plot(xs, theoretical, 'r--', label='Theoretical O(2^n) (scaled)', linewidth=2)
     
-    plt.xlabel('Input Size (Number of Vertices)', fontsize=12)
+    plt.xlabel(X_AXES[x], fontsize=12)
     plt.ylabel('CPU Time (seconds)', fontsize=12)
     plt.title('Empirical Runtime Analysis: Minimum Vertex Cover DP Algorithm', fontsize=14, fontweight='bold')
     plt.legend(fontsize=10)
     plt.grid(True, alpha=0.3)
     plt.yscale('log')  # Use log scale for better visualization
+    use_log_x(all_xs)
     plt.tight_layout()
     
     # Save plot
@@ -54,11 +117,73 @@ def plot_runtime():
     print("Plot saved to plot_runtime.pdf")
 
 
+def plot_memory(results_files=("benchmark_results.json",), x: str = "n"):
+    """
+    Load benchmark results and create a plot of peak memory vs input size.
+    
+    Plots the average peak RSS of the solving process and, where recorded,
+    the largest DP table the engine allocated.
+    
+    Args:
+        results_files: Results files to plot, one series per file (engine)
+        x: Structural parameter for the x axis (see X_AXES)
+    """
+    plt.figure(figsize=(10, 6))
+    plotted = False
+    all_xs = []
+    
+    for results_file in results_files:
+        label, keys, xs, results = load_results(results_file, x)
+        prefix = f"{label}: " if len(results_files) > 1 else ""
+        
+        rss_points = [(v, k) for v, k in zip(xs, keys) if "peak_rss_mb" in results[k]]
+        if rss_points:
+            rss_xs = [v for v, _ in rss_points]
+            rss = [results[k]["peak_rss_mb"] for _, k in rss_points]
+            line, = plt.plot(rss_xs, rss, '-o', label=f'{prefix}Peak RSS', linewidth=2, markersize=6)
+            all_xs.extend(rss_xs)
+            plotted = True
+            
+            table_points = [(v, k) for v, k in rss_points if results[k].get("table_bytes")]
+            if table_points:
+                table_xs = [v for v, _ in table_points]
+                table_mb = [results[k]["table_bytes"] / (1024 * 1024) for _, k in table_points]
+                plt.plot(table_xs, table_mb, '--s', color=line.get_color(),
+                         label=f'{prefix}DP table', linewidth=1.5, markersize=5)
+    
+    if not plotted:
+        print("No memory measurements in the results. Rerun run_benchmarks.py to record them.")
+        plt.close()
+        return
+    
+    plt.xlabel(X_AXES[x], fontsize=12)
+    plt.ylabel('Memory (MiB)', fontsize=12)
+    plt.title('Empirical Memory Analysis: Minimum Vertex Cover DP Algorithm', fontsize=14, fontweight='bold')
+    plt.legend(fontsize=10)
+    plt.grid(True, alpha=0.3)
+    plt.yscale('log')
+    use_log_x(all_xs)
+    plt.tight_layout()
+    
+    plt.savefig('plot_memory.png', dpi=300, bbox_inches='tight')
+    print("Plot saved to plot_memory.png")
+    
+    plt.savefig('plot_memory.pdf', bbox_inches='tight')
+    print("Plot saved to plot_memory.pdf")
+
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Plot runtime and memory from benchmark results")
+    parser.add_argument("files", nargs="*", default=["benchmark_results.json"],
+                        help="Results files, one series per file (default: benchmark_results.json)")
+    parser.add_argument("--x", choices=list(X_AXES), default="n",
+                        help="Structural parameter on the x axis; all but n need results of a "
+                             "large-scale tier (run_benchmarks.py --tier) (default: n)")
+    args = parser.parse_args()
     try:
-        plot_runtime()
+        plot_runtime(args.files, args.x)
+        plot_memory(args.files, args.x)
     except ImportError:
         print("matplotlib not available. Install with: pip install matplotlib")
     except FileNotFoundError:
         print("benchmark_results.json not found. Run run_benchmarks.py first.")
-
@@ -1,34 +1,73 @@
 """
 Run benchmark suite and measure CPU time.
+
+By default each instance is solved inside this process, so the timings
+exclude interpreter startup and imports. CPU time (time.process_time) and
+wall time (time.perf_counter) are recorded separately for every phase.
 """
 
+import argparse
+import multiprocessing
 import os
+import signal
 import subprocess
+import statistics
 import sys
 import time
 import json
 from collections import defaultdict
+from multiprocessing.connection import wait
+from typing import Dict, Iterator, List, Tuple
+
+from main import (load_graph, kernelize, solve_by_components, unfold_cover, save_output, TABLE_STATS,
+                  is_binary_file, load_graph_binary, solve_csr, GRAPH_MAGIC, enable_profiling, reset_profile,
+                  profile_record, minimum_vertex_cover_batch, ENGINES)
+from utils import limit_memory, peak_rss_mb, generate_random_graph
+
+
+# Phases timed by the in-process harness, in execution order
+PHASES = ("load", "kernelize", "solve", "save")
+
+# Structural parameters recorded in the metadata.json of large-scale tiers
+METADATA_FIELDS = ("n", "m", "components", "cyclomatic")
 
+# Directory of the large-scale tiers written by generate_benchmarks.py --tier
+LARGE_BENCHMARK_DIR = "benchmarks_large"
 
-def run_benchmark_instance(input_file: str, output_file: str) -> float:
+
+def run_benchmark_instance(input_file: str, output_file: str, engine: str = "array",
+                           timeout: float = None, profile_file: str = None) -> float:
     """
-    Run a single benchmark instance and measure CPU time.
+    Run a single benchmark instance in a subprocess and measure wall time.
+    
+    The result includes interpreter startup and imports; prefer
+    run_benchmark_instance_in_process for timing the algorithm itself.
     
     Args:
         input_file: Path to input graph file
         output_file: Path to output file
+        engine: Solver engine passed to main.py
+        timeout: Seconds after which the subprocess is killed (default: none)
+        profile_file: Have main.py write its --profile record to this file
         
     Returns:
-        CPU time in seconds
+        Wall time in seconds
+        
+    Raises:
+        subprocess.TimeoutExpired: If the subprocess exceeds the timeout
     """
+    command = [sys.executable, "main.py", input_file, output_file, "--engine", engine]
+    if profile_file is not None:
+        command += ["--profile", profile_file]
     start_time = time.perf_counter()
     
     try:
         result = subprocess.run(
-            [sys.executable, "main.py", input_file, output_file],
+            command,
             cwd=".",
             capture_output=True,
-            text=True
+            text=True,
+            timeout=timeout
         )
         
         end_time = time.perf_counter()
@@ -39,26 +78,407 @@ def run_benchmark_instance(input_file: str, output_file: str) -> float:
         else:
             print(f"Error running {input_file}: {result.stderr}")
             return -1
+    except subprocess.TimeoutExpired:
+        raise
     except Exception as e:
         print(f"Exception running {input_file}: {e}")
         return -1
 
 
-def run_benchmark_suite():
+def time_phases(input_file: str, output_file: str, engine: str = "array") -> Dict[str, Dict[str, float]]:
+    """
+    Solve one instance in this process and time each phase.
+    
+    Binary graph files are memory-mapped and solved on the CSR path, as
+    main.py does; their kernel is applied per cyclic component inside the
+    solve phase, so "kernelize" is zero for them.
+    
+    Args:
+        input_file: Path to input graph file
+        output_file: Path to output file
+        engine: Name of the solver engine in main.ENGINES
+        
+    Returns:
+        A dict mapping each phase in PHASES to {"cpu": seconds, "wall": seconds}
+    """
+    timings = {}
+    cpu_start, wall_start = time.process_time(), time.perf_counter()
+    
+    def finish(phase):
+        nonlocal cpu_start, wall_start
+        cpu_end, wall_end = time.process_time(), time.perf_counter()
+        timings[phase] = {"cpu": cpu_end - cpu_start, "wall": wall_end - wall_start}
+        cpu_start, wall_start = cpu_end, wall_end
+    
+    if is_binary_file(input_file, GRAPH_MAGIC):
+        vertices, offsets, neighbors = load_graph_binary(input_file)
+        finish("load")
+        finish("kernelize")
+        min_size, cover_set = solve_csr(vertices, offsets, neighbors, engine)
+        finish("solve")
+    else:
+        graph, vertices = load_graph(input_file)
+        finish("load")
+        
+        kernel, kernel_vertices, forced, folds = kernelize(graph, vertices)
+        finish("kernelize")
+        
+        kernel_size, kernel_cover = solve_by_components(kernel, kernel_vertices, engine)
+        min_size = kernel_size + len(forced) + len(folds)
+        cover_set = unfold_cover(kernel_cover, forced, folds)
+        finish("solve")
+    
+    save_output(output_file, min_size, cover_set)
+    finish("save")
+    
+    return timings
+
+
+def summarize(values: List[float]) -> Dict[str, float]:
+    """
+    Compute the median and interquartile range of a list of timings.
+    
+    Args:
+        values: Timings in seconds
+        
+    Returns:
+        A dict with keys "median", "iqr", "min" and "max"
+    """
+    if len(values) > 1:
+        q1, _, q3 = statistics.quantiles(values, n=4)
+    else:
+        q1 = q3 = values[0]
+    return {
+        "median": statistics.median(values),
+        "iqr": q3 - q1,
+        "min": min(values),
+        "max": max(values),
+    }
+
+
+def run_benchmark_instance_in_process(input_file: str, output_file: str, engine: str = "array",
+                                      warmup: int = 1, repeats: int = 5) -> Dict:
+    """
+    Run a single benchmark instance in this process with warmups and repeats.
+    
+    Args:
+        input_file: Path to input graph file
+        output_file: Path to output file
+        engine: Name of the solver engine in main.ENGINES
+        warmup: Number of untimed runs before measuring
+        repeats: Number of timed runs
+        
+    Returns:
+        A dict with "cpu" and "wall" summaries of the total time (see
+        summarize) and "phases" mapping each phase to its median CPU and
+        wall time
+    """
+    for _ in range(warmup):
+        time_phases(input_file, output_file, engine)
+    
+    runs = [time_phases(input_file, output_file, engine) for _ in range(repeats)]
+    
+    return {
+        "cpu": summarize([sum(run[phase]["cpu"] for phase in PHASES) for run in runs]),
+        "wall": summarize([sum(run[phase]["wall"] for phase in PHASES) for run in runs]),
+        "phases": {
+            phase: {
+                "cpu": statistics.median(run[phase]["cpu"] for run in runs),
+                "wall": statistics.median(run[phase]["wall"] for run in runs),
+            }
+            for phase in PHASES
+        },
+    }
+
+
+def run_instance_worker(conn, input_file: str, output_file: str, engine: str, warmup: int,
+                        repeats: int, in_process: bool, timeout: float, memory_limit: int,
+                        profile: bool = False):
+    """
+    Benchmark one instance in a worker process and send back its record.
+    
+    Args:
+        conn: Write end of a pipe to the parent process
+        input_file: Path to input graph file
+        output_file: Path to output file
+        engine: Solver engine to benchmark
+        warmup: Untimed runs before measuring (in-process only)
+        repeats: Timed runs (in-process only)
+        in_process: Solve in this worker instead of launching main.py
+        timeout: Per-instance time budget in seconds, or None
+        memory_limit: Per-instance memory budget in MiB, or None
+        profile: Add a "profile" record (see main.profile_record) from one
+            extra profiled run, so the timed runs carry no profiling overhead
+    """
+    if hasattr(os, "setpgrp"):
+        # Lead a process group, so killing the group on a timeout also kills
+        # the main.py this worker launches with in_process=False
+        os.setpgrp()
+    if memory_limit:
+        limit_memory(memory_limit)
+    
+    try:
+        if in_process:
+            stats = run_benchmark_instance_in_process(input_file, output_file, engine, warmup, repeats)
+            record = {
+                "status": "ok",
+                "cpu": stats["cpu"]["median"],
+                "cpu_iqr": stats["cpu"]["iqr"],
+                "wall": stats["wall"]["median"],
+                "phases": {phase: stats["phases"][phase]["cpu"] for phase in PHASES},
+                "peak_rss_mb": peak_rss_mb(),
+                "table_entries": TABLE_STATS["entries"],
+                "table_bytes": TABLE_STATS["bytes"],
+            }
+            if profile:
+                enable_profiling()
+                reset_profile()
+                record["profile"] = profile_record(time_phases(input_file, output_file, engine))
+        else:
+            profile_file = output_file + ".profile.json" if profile else None
+            elapsed = run_benchmark_instance(input_file, output_file, engine, timeout, profile_file)
+            record = {"status": "ok", "wall": elapsed} if elapsed >= 0 else {"status": "error"}
+            record["peak_rss_mb"] = peak_rss_mb(children=True)
+            if profile_file is not None and os.path.exists(profile_file):
+                with open(profile_file, "r") as f:
+                    record["profile"] = {key: value for key, value in json.load(f).items()
+                                         if key in ("phases", "counters")}
+                os.remove(profile_file)
+    except subprocess.TimeoutExpired:
+        record = {"status": "timeout"}
+    except MemoryError:
+        record = {"status": "memory"}
+    except Exception as e:
+        record = {"status": "error", "error": str(e)}
+    
+    conn.send(record)
+    conn.close()
+
+
+def kill_worker(process: multiprocessing.Process):
+    """
+    Kill a worker of run_instances_in_pool together with its process group.
+    
+    Args:
+        process: The worker process
+    """
+    try:
+        os.killpg(process.pid, signal.SIGKILL)
+    except (AttributeError, OSError):
+        # No process groups on this platform, or the worker has not called setpgrp yet
+        pass
+    process.kill()
+    process.join()
+
+
+def run_instances_in_pool(tasks: List[Tuple[int, str, str]], worker_args: tuple, workers: int,
+                          timeout: float = None) -> Iterator[Tuple[Tuple[int, str, str], Dict]]:
+    """
+    Run benchmark instances across worker processes, one process per instance.
+    
+    A worker that exceeds the time budget is killed with its process group
+    (including a main.py it launched) and reported as a timeout; a worker
+    that dies without reporting (e.g. killed for running out of memory) is
+    reported as an error.
+    
+    Args:
+        tasks: List of (size, input_file, output_file) tuples
+        worker_args: Arguments (engine, warmup, repeats, in_process, timeout,
+            memory_limit, profile) passed to run_instance_worker after the file names
+        workers: Maximum number of instances running at once
+        timeout: Per-instance time budget in seconds, or None
+        
+    Returns:
+        An iterator of (task, record) pairs in completion order
+    """
+    pending = list(tasks)
+    running = {}
+    
+    try:
+        while pending or running:
+            while pending and len(running) < workers:
+                task = pending.pop(0)
+                parent_conn, child_conn = multiprocessing.Pipe(duplex=False)
+                process = multiprocessing.Process(target=run_instance_worker,
+                                                  args=(child_conn, task[1], task[2]) + worker_args)
+                process.start()
+                child_conn.close()
+                running[parent_conn] = (task, process, time.perf_counter())
+            
+            for conn in wait(list(running), timeout=0.1):
+                task, process, _ = running.pop(conn)
+                try:
+                    record = conn.recv()
+                except EOFError:
+                    record = {"status": "error", "error": "worker died"}
+                process.join()
+                if process.exitcode and record["status"] == "error":
+                    record["exitcode"] = process.exitcode
+                conn.close()
+                yield task, record
+            
+            if timeout is not None:
+                now = time.perf_counter()
+                for conn, (task, process, start) in list(running.items()):
+                    if now - start > timeout:
+                        kill_worker(process)
+                        conn.close()
+                        del running[conn]
+                        yield task, {"status": "timeout"}
+    finally:
+        # Workers lead their own process groups and miss a Ctrl-C sent to ours
+        for _, process, _ in running.values():
+            kill_worker(process)
+
+
+def average_profiles(profiles: List[Dict]) -> Dict:
+    """
+    Average profile records (see main.profile_record) over instances.
+    
+    Args:
+        profiles: Profile records with "phases" and "counters"
+        
+    Returns:
+        A record of the same shape holding the mean of every phase time and
+        counter; a phase missing from an instance counts as zero
+    """
+    phases = sorted({phase for profile in profiles for phase in profile["phases"]})
+    counters = sorted({counter for profile in profiles for counter in profile["counters"]})
+    return {
+        "count": len(profiles),
+        "phases": {
+            phase: {
+                kind: sum(profile["phases"].get(phase, {}).get(kind, 0.0) for profile in profiles) / len(profiles)
+                for kind in ("cpu", "wall")
+            }
+            for phase in phases
+        },
+        "counters": {
+            counter: sum(profile["counters"].get(counter, 0) for profile in profiles) / len(profiles)
+            for counter in counters
+        },
+    }
+
+
+def load_run_log(log_file: str, settings: Dict = None) -> Dict[Tuple[str, str], Dict]:
+    """
+    Load the per-instance records appended by earlier benchmark runs.
+    
+    Args:
+        log_file: Path to the JSON-lines run log
+        settings: Run settings (see run_benchmark_suite) a record must have
+            been logged with to be kept, or None to keep every record
+            
+    Returns:
+        A dict mapping (engine, input_file) to the latest matching record
+    """
+    records = {}
+    if os.path.exists(log_file):
+        with open(log_file, "r") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # partial line from an interrupted run
+                if settings is not None and record.get("settings") != settings:
+                    continue  # timed or budgeted differently, so it is run again
+                records[(record["engine"], record["instance"])] = record
+    return records
+
+
+def collect_tier_tasks(tier_dir: str) -> Tuple[List[Tuple[str, str, str]], Dict[str, Dict[str, int]]]:
+    """
+    Collect the instances of a large-scale tier and their metadata.
+    
+    Args:
+        tier_dir: Directory of the tier, holding one subdirectory per entry
+            with instance files and a metadata.json
+            
+    Returns:
+        A tuple (tasks, metadata) where tasks are (entry label, input_file,
+        output_file) tuples and metadata maps each input_file to its n, m,
+        component count and cyclomatic number
+    """
+    tasks = []
+    metadata = {}
+    for label in sorted(os.listdir(tier_dir)):
+        entry_dir = os.path.join(tier_dir, label)
+        metadata_file = os.path.join(entry_dir, "metadata.json")
+        if not os.path.exists(metadata_file):
+            continue
+        with open(metadata_file, "r") as f:
+            entry = json.load(f)
+        for instance_file, instance_metadata in sorted(entry["instances"].items()):
+            input_file = os.path.join(entry_dir, instance_file)
+            output_file = os.path.join(entry_dir, instance_file.replace("instance_", "output_"))
+            tasks.append((label, input_file, output_file))
+            metadata[input_file] = instance_metadata
+    return (tasks, metadata)
+
+
+def run_benchmark_suite(engine: str = "array", results_file: str = "benchmark_results.json",
+                        sizes: List[int] = None, warmup: int = 1, repeats: int = 5,
+                        in_process: bool = True, workers: int = None, timeout: float = None,
+                        memory_limit: int = None, log_file: str = "benchmark_runs.jsonl",
+                        resume: bool = True, tier: str = None, profile: bool = False):
     """
     Run all benchmark instances and collect timing data.
+    
+    Instances run in separate worker processes, up to workers at a time, each
+    within an optional time and memory budget. Every finished instance is
+    appended to log_file right away; with resume, instances already logged
+    for this engine with the same run mode, warmups, repeats, budgets and
+    profiling are skipped, so an interrupted suite picks up where it
+    stopped. Records logged with other settings are run again.
+    
+    For each size, "average", "min" and "max" are taken over the per-instance
+    median CPU times (wall times with in_process=False, where CPU time of the
+    child is not measured). In-process runs also record the median and IQR
+    across instances, wall-time statistics and the mean CPU time per phase.
+    Instances over budget are counted under "timeouts" and "failures".
+    Memory is reported as the average and largest peak RSS of the solving
+    process ("peak_rss_mb", "peak_rss_mb_max") and, in-process, the largest
+    DP table allocated by the engine ("table_bytes", "table_entries").
+    
+    With tier, the instances of benchmarks_large/<tier>/ are run instead and
+    results are keyed by tier entry; each entry also records the mean of its
+    instances' structural metadata (n, m, components, cyclomatic) so results
+    can be plotted against any of them.
+    
+    With profile, each instance also records the per-phase times and
+    hot-path counters of main.profile_record, averaged per size under "profile".
+    
+    Args:
+        engine: Solver engine to benchmark
+        results_file: Path of the JSON file to write the results to
+        sizes: Benchmark sizes to run (default: every benchmarks/size_* directory)
+        warmup: Untimed runs per instance before measuring (in-process only)
+        repeats: Timed runs per instance (in-process only)
+        in_process: Solve inside the worker instead of launching main.py
+        workers: Instances run at once (default: number of CPUs)
+        timeout: Per-instance time budget in seconds, covering warmups and repeats
+        memory_limit: Per-instance memory budget in MiB
+        log_file: Path of the JSON-lines log of per-instance records
+        resume: Skip instances already recorded in log_file for this engine
+            with the same settings
+        tier: Large-scale tier to run (see generate_benchmarks.TIERS), or None
+            for the benchmarks/size_* suite
+        profile: Collect main.py's profile record for every instance
     """
-    base_dir = "benchmarks"
+    base_dir = "benchmarks" if tier is None else os.path.join(LARGE_BENCHMARK_DIR, tier)
     
     if not os.path.exists(base_dir):
         print(f"Error: {base_dir} directory not found")
         return
     
-    # Collect timing data by size
-    timing_data = defaultdict(list)
-    
-    # Iterate over size directories
-    for size_dir in sorted(os.listdir(base_dir)):
+    # Collect the instances to run
+    tasks = []
+    metadata = {}
+    size_dirs = sorted(os.listdir(base_dir))
+    if tier is not None:
+        tasks, metadata = collect_tier_tasks(base_dir)
+        size_dirs = []
+    for size_dir in size_dirs:
         size_path = os.path.join(base_dir, size_dir)
         if not os.path.isdir(size_path):
             continue
@@ -69,41 +489,216 @@ def run_benchmark_suite():
         except:
             continue
         
-        print(f"Running benchmarks for size {n}...")
+        if sizes and n not in sizes:
+            continue
         
-        # Run all instances for this size
         instance_files = sorted([f for f in os.listdir(size_path) if f.startswith("instance_")])
-        
         for instance_file in instance_files:
             input_file = os.path.join(size_path, instance_file)
             output_file = os.path.join(size_path, instance_file.replace("instance_", "output_"))
+            tasks.append((n, input_file, output_file))
+    
+    settings = {"in_process": in_process, "warmup": warmup, "repeats": repeats,
+                "timeout": timeout, "memory_limit": memory_limit, "profile": profile}
+    records = load_run_log(log_file, settings) if resume else {}
+    if not resume and os.path.exists(log_file):
+        os.remove(log_file)
+    pending = [task for task in tasks if (engine, task[1]) not in records]
+    print(f"Running {len(pending)} of {len(tasks)} instances ({len(tasks) - len(pending)} already logged)")
+    
+    worker_args = (engine, warmup, repeats, in_process, timeout, memory_limit, profile)
+    with open(log_file, "a") as log:
+        for (n, input_file, _), record in run_instances_in_pool(pending, worker_args,
+                                                                workers or os.cpu_count() or 1, timeout):
+            record.update({"engine": engine, "size": n, "instance": input_file, "settings": settings})
+            records[(engine, input_file)] = record
+            log.write(json.dumps(record) + "\n")
+            log.flush()
             
-            elapsed = run_benchmark_instance(input_file, output_file)
-            if elapsed >= 0:
-                timing_data[n].append(elapsed)
-                print(f"  {instance_file}: {elapsed:.4f}s")
+            if record["status"] != "ok":
+                print(f"  {input_file}: {record['status'].upper()}")
+            elif in_process:
+                print(f"  {input_file}: cpu={record['cpu']:.4f}s "
+                      f"(IQR {record['cpu_iqr']:.4f}s), wall={record['wall']:.4f}s")
+            else:
+                print(f"  {input_file}: {record['wall']:.4f}s")
+    
+    # Collect timing data by size
+    timing_data = defaultdict(list)
+    wall_data = defaultdict(list)
+    phase_data = defaultdict(lambda: defaultdict(list))
+    rss_data = defaultdict(list)
+    table_data = defaultdict(list)
+    profile_data = defaultdict(list)
+    timed_out = defaultdict(list)
+    failures = defaultdict(int)
+    for n, input_file, _ in tasks:
+        record = records[(engine, input_file)]
+        # A record without the timing this mode reports counts as a failure
+        timing = record.get("cpu" if in_process else "wall")
+        if record["status"] == "ok" and timing is not None:
+            timing_data[n].append(timing)
+            rss_data[n].append(record.get("peak_rss_mb", 0.0))
+            if "profile" in record:
+                profile_data[n].append(record["profile"])
+            if in_process:
+                wall_data[n].append(record.get("wall", timing))
+                table_data[n].append((record.get("table_bytes", 0), record.get("table_entries", 0)))
+                for phase in PHASES:
+                    phase_data[n][phase].append(record.get("phases", {}).get(phase, 0.0))
+        elif record["status"] == "timeout":
+            timed_out[n].append(os.path.basename(input_file))
+        else:
+            failures[n] += 1
+    
+    # Structural metadata of each tier entry, averaged over its instances
+    group_metadata = {}
+    for n, input_file, _ in tasks:
+        if input_file in metadata:
+            group_metadata.setdefault(n, []).append(metadata[input_file])
+    for n, entries in group_metadata.items():
+        group_metadata[n] = {field: sum(entry[field] for entry in entries) / len(entries)
+                             for field in METADATA_FIELDS}
     
     # Calculate averages
     results = {}
-    for n in sorted(timing_data.keys()):
+    groups = {task[0] for task in tasks}
+    if tier is None:
+        groups = sorted(groups)
+    else:
+        groups = sorted(groups, key=lambda n: tuple(group_metadata[n][field]
+                                                    for field in ("n", "components", "cyclomatic", "m")))
+    label = "Size" if tier is None else tier
+    for n in groups:
         times = timing_data[n]
-        avg_time = sum(times) / len(times) if times else 0
-        results[n] = {
-            "average": avg_time,
-            "min": min(times) if times else 0,
-            "max": max(times) if times else 0,
-            "count": len(times)
-        }
-        print(f"Size {n}: avg={avg_time:.4f}s, min={min(times):.4f}s, max={max(times):.4f}s, count={len(times)}")
+        results[n] = {"engine": engine, "count": len(times)}
+        if n in group_metadata:
+            results[n].update({"tier": tier, "metadata": group_metadata[n]})
+        if times:
+            avg_time = sum(times) / len(times)
+            results[n].update({"average": avg_time, "min": min(times), "max": max(times)})
+            results[n].update({
+                "peak_rss_mb": sum(rss_data[n]) / len(rss_data[n]),
+                "peak_rss_mb_max": max(rss_data[n]),
+            })
+            print(f"{label} {n}: avg={avg_time:.4f}s, min={min(times):.4f}s, max={max(times):.4f}s, count={len(times)}")
+        if in_process and times:
+            spread = summarize(times)
+            results[n].update({
+                "median": spread["median"],
+                "iqr": spread["iqr"],
+                "wall_average": sum(wall_data[n]) / len(wall_data[n]),
+                "wall_median": statistics.median(wall_data[n]),
+                "phases": {phase: sum(phase_data[n][phase]) / len(times) for phase in PHASES},
+                "table_bytes": max(table_data[n])[0],
+                "table_entries": max(table_data[n])[1],
+                "warmup": warmup,
+                "repeats": repeats,
+            })
+        if profile_data[n]:
+            results[n]["profile"] = average_profiles(profile_data[n])
+        if timed_out[n]:
+            results[n]["timeouts"] = len(timed_out[n])
+            results[n]["timed_out"] = timed_out[n]
+            print(f"{label} {n}: {len(timed_out[n])} instance(s) timed out")
+        if failures[n]:
+            results[n]["failures"] = failures[n]
     
     # Save results to JSON
-    with open("benchmark_results.json", "w") as f:
+    with open(results_file, "w") as f:
         json.dump(results, f, indent=2)
     
-    print(f"\nResults saved to benchmark_results.json")
+    print(f"\nResults saved to {results_file}")
     return results
 
 
-if __name__ == "__main__":
-    run_benchmark_suite()
+def run_batch_comparison(sizes: List[int] = (4, 8, 12, 16), count: int = 10000, engine: str = "array",
+                         edge_probability: float = 0.3, results_file: str = "batch_results.json"):
+    """
+    Compare the throughput of batched solving with a loop over a scalar engine.
+    
+    For each size, count random graphs are solved once by
+    main.minimum_vertex_cover_batch and once by calling the engine on each
+    graph (without the kernel, so both do the full subset DP). The cover
+    sizes must agree.
+    
+    Args:
+        sizes: Vertex counts to test (at most main.BATCH_MAX_VERTICES)
+        count: Graphs per size
+        engine: Scalar engine in main.ENGINES for the loop
+        edge_probability: Edge probability of the random graphs
+        results_file: Path of the JSON file to write the results to
+        
+    Returns:
+        A dict mapping each size to graphs, batched and scalar throughput
+        (graphs per second) and the speedup
+    """
+    solver = ENGINES[engine]
+    results = {}
+    for n in sizes:
+        graphs = [generate_random_graph(n, edge_probability, seed=i) for i in range(count)]
+        
+        start = time.perf_counter()
+        batched = minimum_vertex_cover_batch(graphs)
+        batched_time = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        scalar = [solver(graph, vertices) for graph, vertices in graphs]
+        scalar_time = time.perf_counter() - start
+        
+        if [size for size, _ in batched] != [size for size, _ in scalar]:
+            raise RuntimeError(f"Batched and {engine} results differ for n = {n}")
+        results[n] = {
+            "graphs": count,
+            "engine": engine,
+            "batched_per_sec": count / batched_time,
+            "scalar_per_sec": count / scalar_time,
+            "speedup": scalar_time / batched_time,
+        }
+        print(f"n={n}: batched {results[n]['batched_per_sec']:.0f} graphs/s, "
+              f"{engine} loop {results[n]['scalar_per_sec']:.0f} graphs/s ({results[n]['speedup']:.1f}x)")
+    
+    with open(results_file, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"\nResults saved to {results_file}")
+    return results
 
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the benchmark suite")
+    parser.add_argument("--engine", default="array", help="Solver engine (default: array)")
+    parser.add_argument("--output", default="benchmark_results.json", help="Results file (default: benchmark_results.json)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=None,
+                        help="Benchmark sizes to run (default: all benchmarks/size_* directories)")
+    parser.add_argument("--tier", default=None,
+                        help="Run a large-scale tier from benchmarks_large/ (forest, neartree, components)")
+    parser.add_argument("--repeats", type=int, default=5, help="Timed runs per instance (default: 5)")
+    parser.add_argument("--warmup", type=int, default=1, help="Untimed runs per instance (default: 1)")
+    parser.add_argument("--subprocess", action="store_true",
+                        help="Time a main.py subprocess per instance instead of solving in-process")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Instances run at once (default: number of CPUs)")
+    parser.add_argument("--timeout", type=float, default=None,
+                        help="Per-instance time budget in seconds (default: none)")
+    parser.add_argument("--memory-limit", type=int, default=None,
+                        help="Per-instance memory budget in MiB (default: none)")
+    parser.add_argument("--log", default="benchmark_runs.jsonl",
+                        help="Per-instance results log used for resuming (default: benchmark_runs.jsonl)")
+    parser.add_argument("--profile", action="store_true",
+                        help="Record per-phase times and hot-path counters of every instance")
+    parser.add_argument("--batched", action="store_true",
+                        help="Compare batched solving of many random graphs with a loop over --engine "
+                             "(sizes from --sizes, default 4 8 12 16)")
+    parser.add_argument("--batch-count", type=int, default=10000,
+                        help="Random graphs per size for --batched (default: 10000)")
+    parser.add_argument("--fresh", action="store_true",
+                        help="Discard the results log instead of resuming from it")
+    args = parser.parse_args()
+    if args.batched:
+        run_batch_comparison(args.sizes or [4, 8, 12, 16], args.batch_count, args.engine,
+                             results_file=args.output)
+        sys.exit(0)
+    run_benchmark_suite(args.engine, args.output, args.sizes, args.warmup, args.repeats,
+                        in_process=not args.subprocess, workers=args.workers, timeout=args.timeout,
+                        memory_limit=args.memory_limit, log_file=args.log, resume=not args.fresh,
+                        tier=args.tier, profile=args.profile)
@@ -2,32 +2,115 @@
 Run all functional test cases and generate output files.
 """
 
+import argparse
+import glob
+import json
 import os
+import random
+import socket
 import subprocess
 import sys
+import tempfile
+import time
+from typing import Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
+import main as solver
+from incremental import IncrementalSolver
+from load_generator import start_server
+from main import (CACHE_STATS, ENGINES, PROFILE_COUNTERS, SERVER_END, configure_cache, load_graph,
+                  load_graph_csr, load_output, minimum_vertex_cover_dp_array, minimum_vertex_cover_lazy,
+                  minimum_vertex_cover_mmap, solve_anytime, solve_batch_instance, solve_by_components,
+                  solve_graph)
+from utils import generate_connected_graph
 
-def run_test(test_id: int):
+# Runs main.py with a memory limit the child sets on itself (argv: limit in
+# MiB, then main.py's arguments); preexec_fn is not safe from worker threads
+LIMITED_MAIN = ("import sys, utils; utils.limit_memory(int(sys.argv.pop(1))); "
+                "import main; sys.argv[0] = 'main.py'; main.main()")
+# Largest instance check_engines runs every engine on without the kernel
+ENGINE_CHECK_MAX_VERTICES = 16
+
+# Graph (vertices, edges), time limit and allowed overrun in seconds of check_anytime
+ANYTIME_CHECK_GRAPH = (5000, 12500)
+ANYTIME_CHECK_LIMIT = 0.5
+ANYTIME_CHECK_SLACK = 0.25
+
+# Irregular inputs check_loaders reads with both loaders: extra tokens, a
+# one-token line, blank lines, tabs, CRLF, a self-loop and no final newline
+LOADER_CHECK_INPUTS = [
+    b"0 1 2\n3\n",
+    b"4\n0 1 2\n3\n1 3\n",
+    b"5\n\n0 1\n  \n2\t3\r\n3  4 \n",
+    b"3\n0 0\n0 1\n1 2",
+]
+
+# Cycle length check_cache expects to bypass the cache (above CACHE_MAX_VERTICES)
+CACHE_CHECK_LARGE_CYCLE = 400
+
+# Cycle length check_table_limit solves without the kernel under a 1 MiB
+# --max-table-mb, which the array engine's 2 bytes per subset exceed
+TABLE_CHECK_CYCLE = 21
+
+# Vertices, initial edges and updates of the random graph check_incremental edits
+INCREMENTAL_CHECK_GRAPH = (12, 10, 60)
+
+# Vertices, checkpoint interval and checkpoints written before check_mmap_resume
+# interrupts the mmap engine
+MMAP_CHECK_RUN = (12, 256, 4)
+
+# Seconds check_server waits for the busy client's reply while another
+# connection sits idle in the middle of a request
+SERVER_CHECK_TIMEOUT = 5.0
+
+
+def test_paths(test_id: int) -> Tuple[str, str]:
     """
-    Run a single test case.
+    Return the instance and output file of a test case.
     
     Args:
         test_id: Test case number
+        
+    Returns:
+        A tuple (input_file, output_file)
     """
     input_file = f"tests/instance_{test_id:02d}.txt"
     output_file = f"tests/output_{test_id:02d}.txt"
+    if not os.path.exists(input_file) and os.path.exists(f"tests/instance_{test_id:02d}.bin"):
+        # Instances generated with generate_tests.py --binary
+        input_file = f"tests/instance_{test_id:02d}.bin"
+        output_file = f"tests/output_{test_id:02d}.bin"
+    return (input_file, output_file)
+
+
+def run_test(test_id: int, timeout: float = None, memory_limit: int = None):
+    """
+    Run a single test case.
+    
+    Args:
+        test_id: Test case number
+        timeout: Seconds after which the solver is killed (default: none)
+        memory_limit: Memory budget of the solver in MiB (default: none)
+    """
+    input_file, output_file = test_paths(test_id)
     
     if not os.path.exists(input_file):
         print(f"Warning: {input_file} not found")
         return False
     
+    if memory_limit:
+        command = [sys.executable, "-c", LIMITED_MAIN, str(memory_limit), input_file, output_file]
+    else:
+        command = [sys.executable, "main.py", input_file, output_file]
+    
     try:
         # Run the main algorithm
         result = subprocess.run(
-            [sys.executable, "main.py", input_file, output_file],
+            command,
             cwd=".",
             capture_output=True,
-            text=True
+            text=True,
+            timeout=timeout
         )
         
         if result.returncode == 0:
@@ -36,26 +119,443 @@ def run_test(test_id: int):
         else:
             print(f"Test {test_id:02d}: FAILED - {result.stderr}")
             return False
+    except subprocess.TimeoutExpired:
+        print(f"Test {test_id:02d}: TIMEOUT after {timeout}s")
+        return False
     except Exception as e:
         print(f"Test {test_id:02d}: ERROR - {e}")
         return False
 
 
+def check_engines(test_id: int, input_file: str, output_file: str) -> bool:
+    """
+    Check that every engine finds a valid cover of the size main.py wrote.
+    
+    Each engine runs with and without the kernel, and once more without it
+    after a self-loop is added at every vertex, which must not change the
+    optimum (the solvers ignore self-loops, as the baseline DP does).
+    
+    Args:
+        test_id: Test case number
+        input_file: Instance file of the test
+        output_file: Output file main.py wrote for it
+        
+    Returns:
+        True if every engine agrees with the output file
+    """
+    graph, vertices = load_graph(input_file)
+    if len(vertices) > ENGINE_CHECK_MAX_VERTICES:
+        return True
+    expected, _ = load_output(output_file)
+    looped = {v: graph.get(v, set()) | {v} for v in vertices}
+    runs = [(engine, kernel, loops) for engine in ENGINES for kernel, loops in
+            ((True, False), (False, False), (False, True))]
+    for engine, kernel, loops in runs:
+        try:
+            size, cover, _ = solve_graph(looped if loops else graph, vertices, engine, kernel)
+        except ValueError:
+            if engine == "tree":
+                continue  # The tree engine only accepts forests
+            raise
+        uncovered = [(u, v) for u in graph for v in graph[u] if u not in cover and v not in cover]
+        if size != expected or len(cover) != size or uncovered:
+            print(f"Test {test_id:02d}: FAILED - engine {engine} "
+                  f"({'kernel' if kernel else 'no kernel'}{', self-loops' if loops else ''}) "
+                  f"found {size} {sorted(cover)}, expected size {expected}")
+            return False
+    return True
+
+
+def check_anytime() -> bool:
+    """
+    Check that main.solve_anytime keeps to its time limit.
+    
+    The random connected graph is too large to solve exactly within the
+    limit, so every stage of the anytime solver runs until the deadline.
+    
+    Returns:
+        True if it returned in time with a valid cover and a lower bound no
+        larger than the cover
+    """
+    graph, vertices = generate_connected_graph(*ANYTIME_CHECK_GRAPH, seed=1)
+    start = time.perf_counter()
+    size, cover, lower_bound = solve_anytime(graph, vertices, ANYTIME_CHECK_LIMIT)
+    elapsed = time.perf_counter() - start
+    uncovered = [(u, v) for u in graph for v in graph[u] if u not in cover and v not in cover]
+    if elapsed > ANYTIME_CHECK_LIMIT + ANYTIME_CHECK_SLACK or uncovered or size != len(cover) or lower_bound > size:
+        print(f"Anytime: FAILED - {elapsed:.2f}s for a {ANYTIME_CHECK_LIMIT}s limit, size {size}, "
+              f"lower bound {lower_bound}, {len(uncovered)} uncovered edges")
+        return False
+    print(f"Anytime: PASSED - {elapsed:.2f}s for a {ANYTIME_CHECK_LIMIT}s limit, size {size}, "
+          f"lower bound {lower_bound}")
+    return True
+
+
+def check_anytime_cli() -> bool:
+    """
+    Check that main.py --time-limit answers from the command line and from
+    --serve, and rejects an exact engine that cannot stop at the deadline.
+    
+    Returns:
+        True if the CLI reports the optimum of test 10, the server adds a
+        lower bound and --engine array is rejected
+    """
+    input_file, output_file = test_paths(10)
+    expected, _ = load_output(output_file)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        command = [sys.executable, "main.py", input_file, os.path.join(tmp_dir, "output.txt"), "--time-limit", "1"]
+        solved = subprocess.run(command, capture_output=True, text=True)
+        size = load_output(os.path.join(tmp_dir, "output.txt"))[0] if solved.returncode == 0 else None
+        rejected = subprocess.run(command + ["--engine", "array"], capture_output=True, text=True)
+    served = subprocess.run([sys.executable, "main.py", "--serve", "--time-limit", "1"],
+                            input=f"3\n0 1\n1 2\n{SERVER_END}\n", capture_output=True, text=True)
+    try:
+        response = json.loads(served.stdout)
+    except ValueError:
+        response = {}
+    if size != expected or rejected.returncode != 2 or "--engine array" not in rejected.stderr \
+            or response.get("min_size") != 1 or response.get("lower_bound") != 1:
+        print(f"Anytime CLI: FAILED - size {size} (expected {expected}), --engine array exited "
+              f"{rejected.returncode}, server answered {served.stdout.strip()!r}")
+        return False
+    print("Anytime CLI: PASSED - --time-limit solves, serves and rejects --engine array")
+    return True
+
+
+def check_incremental() -> bool:
+    """
+    Check IncrementalSolver against solving from scratch after every update.
+    
+    Random edges are added and removed on a small graph, so components
+    switch between the tree DP and the cyclic engine path.
+    
+    Returns:
+        True if the optimum and a valid cover match after every update
+    """
+    n, num_edges, num_updates = INCREMENTAL_CHECK_GRAPH
+    rng = random.Random(7)
+    pairs = [(u, v) for u in range(n) for v in range(u + 1, n)]
+    edges = set(rng.sample(pairs, num_edges))
+    graph = {v: set() for v in range(n)}
+    for u, v in edges:
+        graph[u].add(v)
+        graph[v].add(u)
+    solver_state = IncrementalSolver(graph, list(range(n)))
+    for step in range(num_updates + 1):
+        if step:
+            if edges and rng.random() < 0.4:
+                u, v = rng.choice(sorted(edges))
+                edges.discard((u, v))
+                graph[u].discard(v)
+                graph[v].discard(u)
+                solver_state.remove_edge(u, v)
+            else:
+                u, v = rng.choice([pair for pair in pairs if pair not in edges])
+                edges.add((u, v))
+                graph[u].add(v)
+                graph[v].add(u)
+                solver_state.add_edge(u, v)
+        expected, _, _ = solve_graph(graph, list(range(n)))
+        cover = solver_state.cover()
+        uncovered = [(u, v) for u, v in edges if u not in cover and v not in cover]
+        if solver_state.size != expected or len(cover) != expected or uncovered:
+            print(f"Incremental: FAILED - after {step} updates size {solver_state.size} "
+                  f"with cover {sorted(cover)}, expected {expected}")
+            return False
+    print(f"Incremental: PASSED - {num_updates} updates match solving from scratch")
+    return True
+
+
+def check_batch() -> bool:
+    """
+    Check main.py --batch with two worker processes on the test instances.
+    
+    Returns:
+        True if every instance is solved with the size of its expected output
+        and the summary counts no failures
+    """
+    inputs = sorted(glob.glob("tests/instance_*.txt"))
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        summary_file = os.path.join(tmp_dir, "summary.json")
+        batch = subprocess.run([sys.executable, "main.py", "--batch", "tests/instance_*.txt", tmp_dir,
+                                "--jobs", "2", "--summary", summary_file], capture_output=True, text=True)
+        try:
+            with open(summary_file, "r") as f:
+                summary = json.load(f)
+        except (OSError, ValueError):
+            summary = {}
+        wrong = []
+        for input_file in inputs:
+            output_file = os.path.join(tmp_dir, solver.batch_output_name(input_file))
+            expected_file = os.path.join("tests", solver.batch_output_name(input_file))
+            if not os.path.exists(output_file) or load_output(output_file)[0] != load_output(expected_file)[0]:
+                wrong.append(os.path.basename(input_file))
+    if batch.returncode != 0 or summary.get("count") != len(inputs) or summary.get("failures") or wrong:
+        print(f"Batch: FAILED - exit {batch.returncode}, summary counted {summary.get('count')} instances "
+              f"with {summary.get('failures')} failures, wrong sizes for {wrong}")
+        return False
+    print(f"Batch: PASSED - {len(inputs)} instances solved with --jobs 2")
+    return True
+
+
+def check_mmap_resume() -> bool:
+    """
+    Check that the mmap engine resumes an interrupted run from its checkpoint.
+    
+    The run is interrupted right after a checkpoint is written; the resumed
+    run must evaluate only the masks after it and find the optimum.
+    
+    Returns:
+        True if the resumed run starts at the checkpoint and agrees with the
+        array engine
+    """
+    n, interval, interrupt_after = MMAP_CHECK_RUN
+    rng = random.Random(3)
+    graph = {v: set() for v in range(n)}
+    for u in range(n):
+        for v in range(u + 1, n):
+            if rng.random() < 0.3:
+                graph[u].add(v)
+                graph[v].add(u)
+    vertices = list(range(n))
+    expected, _ = minimum_vertex_cover_dp_array(graph, vertices)
+    
+    class Interrupted(Exception):
+        pass
+    
+    written = []
+    write_checkpoint = solver.write_checkpoint
+    
+    def interrupting_checkpoint(filename, checkpoint):
+        write_checkpoint(filename, checkpoint)
+        written.append(checkpoint["next_mask"])
+        if len(written) == interrupt_after:
+            raise Interrupted()
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        solver.write_checkpoint = interrupting_checkpoint
+        try:
+            minimum_vertex_cover_mmap(graph, vertices, tmp_dir, checkpoint_interval=interval)
+        except Interrupted:
+            pass
+        finally:
+            solver.write_checkpoint = write_checkpoint
+        masks_before = PROFILE_COUNTERS["masks_evaluated"]
+        size, cover = minimum_vertex_cover_mmap(graph, vertices, tmp_dir, resume=True, checkpoint_interval=interval)
+        resumed_masks = PROFILE_COUNTERS["masks_evaluated"] - masks_before
+        leftover = os.listdir(tmp_dir)
+    uncovered = [(u, v) for u in graph for v in graph[u] if u not in cover and v not in cover]
+    if (len(written) != interrupt_after or resumed_masks != (1 << n) - written[-1] or size != expected
+            or len(cover) != size or uncovered or leftover):
+        print(f"Mmap resume: FAILED - resumed after {written} with {resumed_masks} masks, size {size} "
+              f"(expected {expected}), files left {leftover}")
+        return False
+    print(f"Mmap resume: PASSED - resumed at mask {written[-1]} of {1 << n}")
+    return True
+
+
+def check_loaders() -> bool:
+    """
+    Check that load_graph_csr reads the same graph as load_graph.
+    
+    Returns:
+        True if both loaders give the same vertices and edges on every
+        input in LOADER_CHECK_INPUTS
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        filename = os.path.join(tmp_dir, "instance.txt")
+        for data in LOADER_CHECK_INPUTS:
+            with open(filename, "wb") as f:
+                f.write(data)
+            graph, vertices = load_graph(filename)
+            csr_vertices, offsets, neighbors = load_graph_csr(filename)
+            edges = {(u, v) for u in graph for v in graph[u]}
+            csr_edges = {(csr_vertices[i], csr_vertices[j]) for i in range(len(csr_vertices))
+                         for j in neighbors[offsets[i]:offsets[i + 1]]}
+            if list(csr_vertices) != vertices or csr_edges != edges:
+                print(f"Loaders: FAILED - on {data!r} load_graph read {sorted(edges)}, "
+                      f"load_graph_csr read {sorted(csr_edges)}")
+                return False
+    print(f"Loaders: PASSED - {len(LOADER_CHECK_INPUTS)} irregular inputs read alike")
+    return True
+
+
+def check_table_limit() -> bool:
+    """
+    Check that main.py rejects a subset-DP table over --max-table-mb with a
+    normal error, and that the suggested bnb engine solves the instance.
+    
+    Returns:
+        True if the array engine exits with an error message and bnb
+        finds the optimum
+    """
+    n = TABLE_CHECK_CYCLE
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        input_file = os.path.join(tmp_dir, "cycle.txt")
+        output_file = os.path.join(tmp_dir, "output.txt")
+        with open(input_file, "w") as f:
+            f.write(f"{n}\n" + "".join(f"{i} {(i + 1) % n}\n" for i in range(n)))
+        command = [sys.executable, "main.py", input_file, output_file, "--no-kernel", "--max-table-mb", "1"]
+        rejected = subprocess.run(command + ["--engine", "array"], capture_output=True, text=True)
+        solved = subprocess.run(command + ["--engine", "bnb"], capture_output=True, text=True)
+        size = load_output(output_file)[0] if solved.returncode == 0 else None
+    if (rejected.returncode != 1 or not rejected.stdout.startswith("Error:") or "--engine bnb" not in rejected.stdout
+            or size != (n + 1) // 2):
+        print(f"Table limit: FAILED - array exited {rejected.returncode} with {rejected.stdout.strip()!r}"
+              f"{rejected.stderr.strip()[-200:]}, bnb found size {size}")
+        return False
+    print(f"Table limit: PASSED - {n}-vertex table rejected at 1 MiB, bnb solved it")
+    return True
+
+
+def check_treewidth_stats() -> bool:
+    """
+    Check that the decomposition width reported for a batch instance does
+    not carry over from the instance solved before it.
+    
+    Returns:
+        True if a cycle after K5 is reported with width 2
+    """
+    graphs = {"k5.txt": "5\n" + "".join(f"{u} {v}\n" for u in range(5) for v in range(u + 1, 5)),
+              "cycle.txt": "5\n" + "".join(f"{i} {(i + 1) % 5}\n" for i in range(5))}
+    widths = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name, text in graphs.items():
+            input_file = os.path.join(tmp_dir, name)
+            with open(input_file, "w") as f:
+                f.write(text)
+            record = solve_batch_instance((input_file, input_file + ".out", "treewidth", False, {}))
+            widths.append(record.get("width"))
+    if widths != [4, 2]:
+        print(f"Treewidth: FAILED - batch widths {widths} for K5 then C5, expected [4, 2]")
+        return False
+    print("Treewidth: PASSED - each batch instance reports its own width")
+    return True
+
+
+def check_lazy_uncached() -> bool:
+    """
+    Check the lazy engine without a memo on a graph whose subproblems share
+    a child: on two disjoint edges both branches reduce to the same edge.
+    
+    Returns:
+        True if it finds the cover of size 2
+    """
+    graph = {0: {1}, 1: {0}, 2: {3}, 3: {2}}
+    size, cover = minimum_vertex_cover_lazy(graph, [0, 1, 2, 3], cache_size=0)
+    if size != 2 or len(cover) != 2 or {0, 1}.isdisjoint(cover) or {2, 3}.isdisjoint(cover):
+        print(f"Lazy: FAILED - cache_size=0 found {size} {sorted(cover)}, expected size 2")
+        return False
+    print("Lazy: PASSED - cache_size=0 solves two disjoint edges")
+    return True
+
+
+def check_cache() -> bool:
+    """
+    Check that the component cache reuses relabeled components and skips
+    components too large to canonicalize cheaply.
+    
+    Returns:
+        True if a relabeled 5-cycle hits the cache, a long cycle bypasses it
+        and both covers are optimal
+    """
+    cycle = lambda labels: {v: {labels[i - 1], labels[(i + 1) % len(labels)]} for i, v in enumerate(labels)}
+    small = {**cycle([0, 1, 2, 3, 4]), **cycle([10, 13, 11, 14, 12])}
+    large = cycle(list(range(CACHE_CHECK_LARGE_CYCLE)))
+    configure_cache()
+    try:
+        size, cover = solve_by_components(small, sorted(small))
+        hits, misses = CACHE_STATS["hits"], CACHE_STATS["misses"]
+        large_size, _ = solve_by_components(large, sorted(large), "treewidth")
+        bypassed = CACHE_STATS["misses"] == misses
+    finally:
+        configure_cache(memory_entries=0)
+    if (size, len(cover), hits, misses) != (6, 6, 1, 1) or not bypassed or large_size != CACHE_CHECK_LARGE_CYCLE // 2:
+        print(f"Cache: FAILED - two 5-cycles gave size {size} with {hits} hits and {misses} misses, "
+              f"the {CACHE_CHECK_LARGE_CYCLE}-cycle size {large_size} ({'bypassed' if bypassed else 'cached'})")
+        return False
+    print(f"Cache: PASSED - relabeled component reused, {CACHE_CHECK_LARGE_CYCLE}-cycle solved uncached")
+    return True
+
+
+def check_server() -> bool:
+    """
+    Check that one idle connection does not stall the solver server.
+    
+    A server with two worker processes gets a first connection that sends
+    part of a request and then waits, and a second connection that sends
+    a whole request, which must be answered while the first stays open.
+    
+    Returns:
+        True if the second client got the right answer in time
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        socket_path = os.path.join(tmp_dir, "server.sock")
+        server = start_server(socket_path, jobs=2)
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as idle, \
+                    socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as busy:
+                idle.connect(socket_path)
+                idle.sendall(b"3\n0 1\n")
+                busy.connect(socket_path)
+                busy.settimeout(SERVER_CHECK_TIMEOUT)
+                busy.sendall(f"3\n0 1\n1 2\n{SERVER_END}\n".encode())
+                with busy.makefile("r") as responses:
+                    response = json.loads(responses.readline())
+        except (OSError, ValueError) as e:
+            print(f"Server: FAILED - no answer while another client was idle ({e or type(e).__name__})")
+            return False
+        finally:
+            server.terminate()
+            server.wait()
+    if response.get("min_size") != 1:
+        print(f"Server: FAILED - answered {response}, expected min_size 1")
+        return False
+    print("Server: PASSED - answered one client while another was idle")
+    return True
+
+
 def main():
     """Run all test cases."""
+    parser = argparse.ArgumentParser(description="Run the functional test cases")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Test cases run at once (default: number of CPUs)")
+    parser.add_argument("--timeout", type=float, default=None,
+                        help="Per-test time budget in seconds (default: none)")
+    parser.add_argument("--memory-limit", type=int, default=None,
+                        help="Per-test memory budget in MiB (default: none)")
+    args = parser.parse_args()
+    
     # Find all test instances
     test_files = [f for f in os.listdir("tests") if f.startswith("instance_")]
-    test_ids = sorted([int(f.split("_")[1].split(".")[0]) for f in test_files])
+    # A test with both instance_XX.txt and instance_XX.bin runs once (test_paths prefers .txt)
+    test_ids = sorted({int(f.split("_")[1].split(".")[0]) for f in test_files})
     
-    passed = 0
-    failed = 0
+    results = {}
+    with ThreadPoolExecutor(max_workers=args.workers or os.cpu_count() or 1) as pool:
+        futures = {pool.submit(run_test, test_id, args.timeout, args.memory_limit): test_id for test_id in test_ids}
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
     
+    # Compare the engines on the small instances, one test at a time in this process
     for test_id in test_ids:
-        if run_test(test_id):
-            passed += 1
-        else:
-            failed += 1
+        if results[test_id]:
+            results[test_id] = check_engines(test_id, *test_paths(test_id))
+    
+    results["anytime"] = check_anytime()
+    results["anytime_cli"] = check_anytime_cli()
+    results["incremental"] = check_incremental()
+    results["batch"] = check_batch()
+    results["mmap_resume"] = check_mmap_resume()
+    results["loaders"] = check_loaders()
+    results["table_limit"] = check_table_limit()
+    results["lazy"] = check_lazy_uncached()
+    results["treewidth"] = check_treewidth_stats()
+    results["cache"] = check_cache()
+    results["server"] = check_server()
     
+    passed = sum(1 for ok in results.values() if ok)
+    failed = len(results) - passed
     print(f"\nSummary: {passed} passed, {failed} failed")
 
 
@@ -3,7 +3,21 @@ Utility functions for graph generation and testing.
 """
 
 from typing import Dict, Set, List, Tuple
+from array import array
 import random
+import sys
+
+from main import BINARY_HEADER, GRAPH_MAGIC, GRAPH_LABELS, build_csr
+
+try:
+    import numpy as np
+except ImportError:  # numpy is only needed by the large-scale generators
+    np = None
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
 
 
 def generate_random_graph(n: int, edge_probability: float = 0.3, seed: int = None) -> Tuple[Dict[int, Set[int]], List[int]]:
@@ -13,13 +27,13 @@ def generate_random_graph(n: int, edge_probability: float = 0.3, seed: int = Non
     Args:
         n: Number of vertices (labeled 0 to n-1)
         edge_probability: Probability of including each edge
-        seed: Random seed for reproducibility
-        
+        seed: Random seed for reproducibility (a local generator is used,
+            so the global random state is left untouched)
+            
     Returns:
         A tuple (graph, vertices) where graph is an adjacency list
     """
-    if seed is not None:
-        random.seed(seed)
+    rng = random.Random(seed)
     
     graph: Dict[int, Set[int]] = {i: set() for i in range(n)}
     vertices = list(range(n))
@@ -27,7 +41,7 @@ def generate_random_graph(n: int, edge_probability: float = 0.3, seed: int = Non
     # Generate edges
     for u in range(n):
         for v in range(u + 1, n):
-            if random.random() < edge_probability:
+            if rng.random() < edge_probability:
                 graph[u].add(v)
                 graph[v].add(u)
     
@@ -41,20 +55,20 @@ def generate_connected_graph(n: int, m: int, seed: int = None) -> Tuple[Dict[int
     Args:
         n: Number of vertices
         m: Target number of edges
-        seed: Random seed for reproducibility
-        
+        seed: Random seed for reproducibility (a local generator is used,
+            so the global random state is left untouched)
+            
     Returns:
         A tuple (graph, vertices) where graph is an adjacency list
     """
-    if seed is not None:
-        random.seed(seed)
+    rng = random.Random(seed)
     
     graph: Dict[int, Set[int]] = {i: set() for i in range(n)}
     vertices = list(range(n))
     
     # First, ensure connectivity: create a spanning tree
     for i in range(1, n):
-        parent = random.randint(0, i - 1)
+        parent = rng.randint(0, i - 1)
         graph[parent].add(i)
         graph[i].add(parent)
     
@@ -64,8 +78,8 @@ def generate_connected_graph(n: int, m: int, seed: int = None) -> Tuple[Dict[int
     target_edges = min(m, max_edges)
     
     while edges_added < target_edges:
-        u = random.randint(0, n - 1)
-        v = random.randint(0, n - 1)
+        u = rng.randint(0, n - 1)
+        v = rng.randint(0, n - 1)
         if u != v and v not in graph[u]:
             graph[u].add(v)
             graph[v].add(u)
@@ -74,10 +88,309 @@ def generate_connected_graph(n: int, m: int, seed: int = None) -> Tuple[Dict[int
     return (graph, vertices)
 
 
+def require_numpy():
+    """
+    Raise ImportError if numpy, used by the large-scale generators, is missing.
+    """
+    if np is None:
+        raise ImportError("The large-scale generators require numpy. Install with: pip install numpy")
+
+
+def relabel_edges(n: int, edges, rng):
+    """
+    Apply a uniformly random permutation to the vertex labels of an edge array.
+    
+    Args:
+        n: Number of vertices
+        edges: Edge array of shape (m, 2)
+        rng: numpy Generator
+        
+    Returns:
+        The relabeled edge array
+    """
+    return rng.permutation(n)[edges]
+
+
+def path_edges(n: int, seed: int = None, shuffle: bool = False):
+    """
+    Generate the path 0 - 1 - ... - n-1.
+    
+    Args:
+        n: Number of vertices
+        seed: Random seed, only used with shuffle
+        shuffle: Randomly permute the vertex labels
+        
+    Returns:
+        An int64 edge array of shape (n - 1, 2)
+    """
+    require_numpy()
+    edges = np.stack((np.arange(n - 1, dtype=np.int64), np.arange(1, n, dtype=np.int64)), axis=1)
+    return relabel_edges(n, edges, np.random.default_rng(seed)) if shuffle else edges
+
+
+def star_edges(n: int, seed: int = None, shuffle: bool = False):
+    """
+    Generate the star with center 0 and leaves 1 to n-1.
+    
+    Args:
+        n: Number of vertices
+        seed: Random seed, only used with shuffle
+        shuffle: Randomly permute the vertex labels
+        
+    Returns:
+        An int64 edge array of shape (n - 1, 2)
+    """
+    require_numpy()
+    edges = np.stack((np.zeros(n - 1, dtype=np.int64), np.arange(1, n, dtype=np.int64)), axis=1)
+    return relabel_edges(n, edges, np.random.default_rng(seed)) if shuffle else edges
+
+
+def caterpillar_edges(n: int, spine: int = None, seed: int = None, shuffle: bool = False):
+    """
+    Generate a caterpillar: a spine path with every other vertex a leaf on it.
+    
+    Args:
+        n: Number of vertices
+        spine: Number of spine vertices (default: n // 2)
+        seed: Random seed for the leaf attachment points
+        shuffle: Randomly permute the vertex labels
+        
+    Returns:
+        An int64 edge array of shape (n - 1, 2)
+    """
+    require_numpy()
+    rng = np.random.default_rng(seed)
+    spine = max(1, min(n, spine if spine is not None else n // 2))
+    spine_edges = np.stack((np.arange(spine - 1, dtype=np.int64), np.arange(1, spine, dtype=np.int64)), axis=1)
+    leaves = np.arange(spine, n, dtype=np.int64)
+    leaf_edges = np.stack((rng.integers(0, spine, size=n - spine, dtype=np.int64), leaves), axis=1)
+    edges = np.concatenate((spine_edges, leaf_edges))
+    return relabel_edges(n, edges, rng) if shuffle else edges
+
+
+def random_forest_edges(n: int, trees: int = 1, seed: int = None, shuffle: bool = True):
+    """
+    Generate a random recursive forest with the given number of trees.
+    
+    Vertices 0 to trees-1 are roots and every later vertex i picks its
+    parent uniformly among 0..i-1, all in one vectorized draw. With
+    trees = 1 this is a random recursive tree (expected depth O(log n)).
+    
+    Args:
+        n: Number of vertices
+        trees: Number of trees (connected components)
+        seed: Random seed for reproducibility
+        shuffle: Randomly permute the vertex labels, so labels say nothing about depth
+        
+    Returns:
+        An int64 edge array of shape (n - trees, 2)
+    """
+    require_numpy()
+    rng = np.random.default_rng(seed)
+    trees = max(1, min(n, trees))
+    children = np.arange(trees, n, dtype=np.int64)
+    parents = (rng.random(n - trees) * children).astype(np.int64)
+    edges = np.stack((parents, children), axis=1)
+    return relabel_edges(n, edges, rng) if shuffle else edges
+
+
+def forest_plus_edges(n: int, trees: int = 1, extra: int = 0, seed: int = None):
+    """
+    Generate a random recursive forest plus extra random edges.
+    
+    The extra edges are distinct, not loops and not already in the forest;
+    each one joining two vertices of the same tree adds a cycle, so small
+    extra counts give near-trees with cyclomatic number at most extra.
+    
+    Args:
+        n: Number of vertices
+        trees: Number of trees in the underlying forest
+        extra: Number of extra edges
+        seed: Random seed for reproducibility
+        
+    Returns:
+        An int64 edge array of shape (n - trees + extra, 2)
+    """
+    require_numpy()
+    rng = np.random.default_rng(seed)
+    forest = random_forest_edges(n, trees, seed=int(rng.integers(1 << 62)))
+    keys = np.sort(np.minimum(forest[:, 0], forest[:, 1]) * n + np.maximum(forest[:, 0], forest[:, 1]))
+    added = np.empty(0, dtype=np.int64)
+    extra = min(extra, n * (n - 1) // 2 - len(forest))
+    while len(added) < extra:
+        # Oversample, then drop loops, forest edges and repeats
+        pairs = rng.integers(0, n, size=(2 * (extra - len(added)) + 16, 2), dtype=np.int64)
+        pairs = pairs[pairs[:, 0] != pairs[:, 1]]
+        candidates = np.minimum(pairs[:, 0], pairs[:, 1]) * n + np.maximum(pairs[:, 0], pairs[:, 1])
+        position = np.minimum(np.searchsorted(keys, candidates), len(keys) - 1)
+        candidates = candidates[keys[position] != candidates] if len(keys) else candidates
+        _, first = np.unique(np.concatenate((added, candidates)), return_index=True)
+        added = np.concatenate((added, candidates))[np.sort(first)][:extra]
+    extra_edges = np.stack((added // n, added % n), axis=1)
+    return np.concatenate((forest, extra_edges))
+
+
+def sparse_gnp_edges(n: int, p: float, seed: int = None):
+    """
+    Generate an Erdos-Renyi G(n, p) graph in O(n + m) expected time.
+    
+    Instead of one coin flip per pair, the gaps between consecutive present
+    pairs (in the order (0,1), (0,2), (1,2), (0,3), ...) are drawn from a
+    geometric distribution in vectorized batches (Batagelj and Brandes), so
+    sparse graphs with millions of vertices are cheap.
+    
+    Args:
+        n: Number of vertices
+        p: Edge probability
+        seed: Random seed for reproducibility
+        
+    Returns:
+        An int64 edge array of shape (m, 2)
+    """
+    require_numpy()
+    rng = np.random.default_rng(seed)
+    total = n * (n - 1) // 2
+    if p <= 0 or total == 0:
+        return np.empty((0, 2), dtype=np.int64)
+    if p >= 1:
+        indices = np.arange(total, dtype=np.int64)
+    else:
+        chunks = []
+        last = -1
+        batch = min(int(total * p * 1.1) + 1024, 1 << 22)
+        while last < total:
+            indices = last + np.cumsum(rng.geometric(p, size=batch).astype(np.int64))
+            chunks.append(indices[indices < total])
+            last = int(indices[-1])
+        indices = np.concatenate(chunks)
+    
+    # Invert k = v * (v - 1) / 2 + u with u < v, correcting float rounding
+    v = ((1 + np.sqrt(1 + 8 * indices.astype(np.float64))) // 2).astype(np.int64)
+    v -= v * (v - 1) // 2 > indices
+    v += (v + 1) * v // 2 <= indices
+    u = indices - v * (v - 1) // 2
+    return np.stack((u, v), axis=1)
+
+
+def block_forest_edges(blocks: int, size: int, cycles: int = 1, seed: int = None):
+    """
+    Generate many equal-size components, each a random tree plus a few extra edges.
+    
+    Component b holds vertices b*size to (b+1)*size - 1. All trees are drawn
+    in one vectorized step as random recursive trees, then each component
+    gets `cycles` random extra edges inside it (an extra edge that repeats a
+    tree edge is dropped, so a component can end up with fewer cycles).
+    
+    Args:
+        blocks: Number of components
+        size: Vertices per component
+        cycles: Extra edges per component
+        seed: Random seed for reproducibility
+        
+    Returns:
+        An int64 edge array with blocks * (size - 1) edges plus the extra edges
+    """
+    require_numpy()
+    rng = np.random.default_rng(seed)
+    base = (np.arange(blocks, dtype=np.int64) * size)[:, None]
+    children = np.arange(1, size, dtype=np.int64)
+    parents = (rng.random((blocks, size - 1)) * children).astype(np.int64)
+    tree_edges = np.stack(((base + parents).ravel(), (base + children).ravel()), axis=1)
+    if size < 2:
+        return tree_edges
+    
+    pairs = rng.integers(0, size, size=(blocks, cycles, 2), dtype=np.int64)
+    low = np.minimum(pairs[..., 0], pairs[..., 1])
+    high = np.maximum(pairs[..., 0], pairs[..., 1])
+    # A tree edge joins a vertex to its parent, so (low, high) is one iff parent[high] == low
+    keep = (low != high) & (parents[np.arange(blocks)[:, None], np.maximum(high - 1, 0)] != low)
+    extra = np.stack(((base + low)[keep], (base + high)[keep]), axis=1)
+    keys = extra[:, 0] * blocks * size + extra[:, 1]
+    _, first = np.unique(keys, return_index=True)
+    return np.concatenate((tree_edges, extra[np.sort(first)]))
+
+
+def count_components(n: int, edges) -> int:
+    """
+    Count the connected components of a graph given as an edge array.
+    
+    Vectorized label propagation: every vertex points at a root, each round
+    hooks the larger root of every edge onto the smaller one and then
+    compresses paths by pointer jumping. Isolated vertices count as
+    components.
+    
+    Args:
+        n: Number of vertices
+        edges: Edge array of shape (m, 2)
+        
+    Returns:
+        The number of connected components
+    """
+    require_numpy()
+    labels = np.arange(n, dtype=np.int64)
+    u = edges[:, 0]
+    v = edges[:, 1]
+    while True:
+        lu = labels[u]
+        lv = labels[v]
+        active = lu != lv
+        if not active.any():
+            break
+        np.minimum.at(labels, np.maximum(lu[active], lv[active]), np.minimum(lu[active], lv[active]))
+        while True:
+            jumped = labels[labels]
+            if (jumped == labels).all():
+                break
+            labels = jumped
+    return int(np.count_nonzero(labels == np.arange(n)))
+
+
+def graph_metadata(n: int, edges) -> Dict[str, int]:
+    """
+    Compute the structural parameters recorded for benchmark instances.
+    
+    Args:
+        n: Number of vertices
+        edges: Edge array of shape (m, 2)
+        
+    Returns:
+        A dict with n, m, components and cyclomatic (m - n + components, the
+        number of independent cycles; 0 exactly for forests)
+    """
+    m = len(edges)
+    components = count_components(n, edges)
+    return {"n": n, "m": m, "components": components, "cyclomatic": m - n + components}
+
+
+def edges_to_graph(n: int, edges) -> Tuple[Dict[int, Set[int]], List[int]]:
+    """
+    Convert an edge array into the adjacency-list form used by the solver.
+    
+    Args:
+        n: Number of vertices
+        edges: Edge array of shape (m, 2)
+        
+    Returns:
+        A tuple (graph, vertices) where graph is an adjacency list
+    """
+    graph: Dict[int, Set[int]] = {i: set() for i in range(n)}
+    for u, v in edges.tolist():
+        graph[u].add(v)
+        graph[v].add(u)
+    return (graph, list(range(n)))
+
+
+# Edges formatted per write by the bulk graph writers
+WRITE_BATCH_EDGES = 1 << 16
+
+
 def graph_to_file(graph: Dict[int, Set[int]], vertices: List[int], filename: str):
     """
     Write graph to file in the expected format.
     
+    Edges are formatted in batches of WRITE_BATCH_EDGES lines and written
+    with one call per batch.
+    
     Args:
         graph: Adjacency list representation
         vertices: List of all vertices
@@ -85,13 +398,105 @@ def graph_to_file(graph: Dict[int, Set[int]], vertices: List[int], filename: str
     """
     with open(filename, 'w') as f:
         f.write(f"{len(vertices)}\n")
-        edges_written = set()
+        batch = []
         for u in vertices:
-            if u in graph:
-                for v in graph[u]:
-                    if u < v:  # Write each edge only once
-                        f.write(f"{u} {v}\n")
-                        edges_written.add((u, v))
+            for v in graph.get(u, ()):
+                if u <= v:  # Write each edge (and self-loop) only once
+                    batch.append(f"{u} {v}\n")
+            if len(batch) >= WRITE_BATCH_EDGES:
+                f.write("".join(batch))
+                batch.clear()
+        f.write("".join(batch))
+
+
+def csr_to_file(vertices: List[int], offsets, neighbors, filename: str):
+    """
+    Write a CSR graph (as returned by main.load_graph_csr) in the expected format.
+    
+    Args:
+        vertices: Labels of the n vertices
+        offsets: CSR row offsets (length n + 1)
+        neighbors: CSR neighbor indices
+        filename: Output file path
+    """
+    with open(filename, 'w') as f:
+        f.write(f"{len(vertices)}\n")
+        batch = []
+        for i, u in enumerate(vertices):
+            for j in neighbors[offsets[i]:offsets[i + 1]]:
+                if i < j:  # Write each edge only once
+                    batch.append(f"{u} {vertices[j]}\n")
+            if len(batch) >= WRITE_BATCH_EDGES:
+                f.write("".join(batch))
+                batch.clear()
+        f.write("".join(batch))
+
+
+def csr_to_binary_file(vertices: List[int], offsets, neighbors, filename: str):
+    """
+    Write a CSR graph in the binary format read by main.load_graph_binary.
+    
+    Args:
+        vertices: Labels of the n vertices
+        offsets: CSR row offsets (length n + 1)
+        neighbors: CSR neighbor indices
+        filename: Output file path
+    """
+    n = len(vertices)
+    labeled = any(v != i for i, v in enumerate(vertices))
+    with open(filename, 'wb') as f:
+        f.write(BINARY_HEADER.pack(GRAPH_MAGIC, GRAPH_LABELS if labeled else 0, n, len(neighbors) // 2))
+        f.write(array('q', offsets).tobytes())
+        f.write(array('i', neighbors).tobytes())
+        if labeled:
+            f.write(array('q', vertices).tobytes())
+
+
+def graph_to_binary_file(graph: Dict[int, Set[int]], vertices: List[int], filename: str):
+    """
+    Write graph to file in the binary format read by main.load_graph_binary.
+    
+    Args:
+        graph: Adjacency list representation
+        vertices: List of all vertices
+        filename: Output file path
+    """
+    index = {v: i for i, v in enumerate(vertices)}
+    offsets = array('q', [0])
+    neighbors = array('i')
+    for u in vertices:
+        neighbors.extend(sorted(index[v] for v in graph.get(u, ()) if v != u))
+        offsets.append(len(neighbors))
+    csr_to_binary_file(vertices, offsets, neighbors, filename)
+
+
+def edges_to_file(n: int, edges, filename: str):
+    """
+    Write an edge array to file in the expected format.
+    
+    Args:
+        n: Number of vertices
+        edges: Edge array of shape (m, 2)
+        filename: Output file path
+    """
+    with open(filename, 'w') as f:
+        f.write(f"{n}\n")
+        for start in range(0, len(edges), WRITE_BATCH_EDGES):
+            f.write("".join(f"{u} {v}\n" for u, v in edges[start:start + WRITE_BATCH_EDGES].tolist()))
+
+
+def edges_to_binary_file(n: int, edges, filename: str):
+    """
+    Write an edge array in the binary format read by main.load_graph_binary.
+    
+    Args:
+        n: Number of vertices
+        edges: Edge array of shape (m, 2)
+        filename: Output file path
+    """
+    ends = array('q', np.ascontiguousarray(edges, dtype=np.int64).tobytes())
+    offsets, neighbors = build_csr(n, ends)
+    csr_to_binary_file(range(n), offsets, neighbors, filename)
 
 
 def count_edges(graph: Dict[int, Set[int]]) -> int:
@@ -111,3 +516,37 @@ def count_edges(graph: Dict[int, Set[int]]) -> int:
                 edge_count += 1
     return edge_count
 
+
+def limit_memory(megabytes: int):
+    """
+    Cap the address space of the current process and its future children.
+    
+    Allocations beyond the cap raise MemoryError instead of swapping. This
+    is a no-op where the resource module is unavailable.
+    
+    Args:
+        megabytes: Maximum address space in MiB
+    """
+    if resource is None:
+        return
+    limit = megabytes * 1024 * 1024
+    resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+def peak_rss_mb(children: bool = False) -> float:
+    """
+    Return the peak resident set size of this process or its finished children.
+    
+    Args:
+        children: Report the largest peak among terminated child processes
+            instead of this process
+            
+    Returns:
+        Peak RSS in MiB, or 0.0 where the resource module is unavailable
+    """
+    if resource is None:
+        return 0.0
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF)
+    # ru_maxrss is in KiB on Linux and in bytes on macOS
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return usage.ru_maxrss / scale